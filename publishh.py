@@ -1,11 +1,24 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import base64
-from PIL import Image
-import io
-import numpy as np
+import gzip
+import hashlib
+import html
+import os
+import tempfile
+import time
+
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.uploaded_file_manager import UploadedFile
+
+# Only the modules every rerun needs are imported here; pages and loaders import the tools they
+# use (pandas, numpy, matplotlib underneath) when they run
+from publishing_guide import content, payloads, profiling, routing, sessions, shared, telemetry, warmup
+
+rerun_started = time.perf_counter()
+script_context = get_script_run_ctx()
+# Counts the delta messages and bytes this run sends, checked against the per-page payload budgets
+payload_meter = payloads.PayloadMeter(script_context)
 
 # Page configuration
 st.set_page_config(
@@ -16,70 +29,31 @@ st.set_page_config(
 )
 
 # Custom CSS
-st.markdown("""
-<style>
-    .main-header {
-        font-size: 2.5rem;
-        color: #1E3A8A;
-        text-align: center;
-        margin-bottom: 1rem;
-    }
-    .sub-header {
-        font-size: 1.8rem;
-        color: #2563EB;
-        margin-top: 2rem;
-        margin-bottom: 1rem;
-    }
-    .topic-header {
-        font-size: 1.4rem;
-        color: #3B82F6;
-        margin-top: 1.5rem;
-        margin-bottom: 0.5rem;
-    }
-    .highlight {
-        background-color: #DBEAFE;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .warning {
-        background-color: #FEF2F2;
-        color: #B91C1C;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .success {
-        background-color: #ECFDF5;
-        color: #065F46;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        margin-bottom: 1rem;
-    }
-    .footnote {
-        font-size: 0.8rem;
-        color: #6B7280;
-        font-style: italic;
-    }
-</style>
-""", unsafe_allow_html=True)
+st.markdown(content.PAGE_CSS, unsafe_allow_html=True)
 
 # Create sidebar navigation
 st.sidebar.title("Navigation")
-pages = [
-	"Introduction to Academic Publishing",
-	"Types of Publications",
-	"Types of Journals",
-	"Understanding Journal Metrics",
-	"Access Models: Open Access & Subscriptions",
-	"The Publication Process",
-	"Writing Your Research Paper",
-	"Submission & Peer Review",
-	"Predatory Journals: Warning Signs",
-	"Publishing Ethics",
-	"After Publication: Promotion & Impact"
-]
-selected_page = st.sidebar.radio("Go to", pages)
+# A deep link (?page=<slug>, see publishing_guide.routing) picks the session's first page before
+# anything renders; from then on the radio drives the page and the URL follows it
+if 'page' not in st.session_state:
+	st.session_state['page'] = routing.resolve_page(st.query_params.get('page'))
+selected_page = st.sidebar.radio("Go to", content.PAGES, key='page')
+if routing.resolve_page(st.query_params.get('page')) != selected_page:
+	st.query_params.pop('item', None)
+	if selected_page == content.PAGES[0]:
+		st.query_params.pop('page', None)
+	else:
+		st.query_params['page'] = routing.slugify(selected_page)
+telemetry.counter('publishing_guide_reruns_total', "Script reruns by page", ['page']).inc(selected_page)
+# Opt-in: PUBLISHING_GUIDE_PROFILE or ?profile=<admin token> (see publishing_guide.profiling)
+rerun_profile = profiling.start(selected_page, st.query_params.get('profile'))
+
+# Results computed from this session's uploads are kept in a capped LRU cache that lives and
+# dies with the session (see publishing_guide.sessions for the per-session and process caps)
+session_id = script_context.session_id
+if 'session_artifacts' not in st.session_state:
+	st.session_state['session_artifacts'] = sessions.REGISTRY.open(session_id)
+artifacts = st.session_state['session_artifacts']
 
 # Introduction to the app
 st.sidebar.markdown("---")
@@ -97,83 +71,155 @@ def get_binary_file_downloader_html(bin_data, file_label='File', button_label='D
 	return href
 
 
-# Helper function to create infographics
-def create_impact_factor_chart():
-	# Sample data for impact factors
-	journals = ['Nature', 'Science', 'Cell', 'PNAS', 'NEJM', 'Field-specific Journal']
-	impact_factors = [49.962, 47.728, 41.582, 11.205, 91.245, 5.5]
-	colors = ['#1f77b4', '#1f77b4', '#1f77b4', '#1f77b4', '#1f77b4', '#ff7f0e']
+# The "learn more" selectbox of a page: ?item=<slug> preselects it when the page is first shown,
+# and the URL follows the choice so the link can be shared
+def explorer(label, page):
+	key = f'explorer:{page}'
+	if key not in st.session_state:
+		st.session_state[key] = routing.resolve_item(page, st.query_params.get('item'))
+	choice = st.selectbox(label, routing.EXPLORERS[page], key=key)
+	if routing.resolve_item(page, st.query_params.get('item')) != choice:
+		if choice == routing.EXPLORERS[page][0]:
+			st.query_params.pop('item', None)
+		else:
+			st.query_params['item'] = routing.slugify(choice)
+	return choice
+
+
+# Charts are sent as <img> tags in the encoding charts.encode_adaptive picked (SVG, or WebP/PNG
+# at the display width); st.image would re-encode WebP and resize the rasters again
+def show_chart(image, alt):
+	from publishing_guide import charts
+
+	fmt, data = image
+	st.markdown(
+		f'<img src="data:{charts.MIME_TYPES[fmt]};base64,{base64.b64encode(data).decode()}" '
+		f'alt="{html.escape(alt)}" style="width: 100%;">',
+		unsafe_allow_html=True)
+
+
+# Load the offline-built journal index once per server process
+@st.cache_resource(show_spinner="Loading journal index...")
+def load_journal_index(path):
+	return shared.journal_index(path)
+
+
+# Journal metric partitions live on disk; one engine per server process reads them
+@st.cache_resource
+def load_journal_metrics_engine(cache_dir):
+	return shared.journal_metrics_engine(cache_dir)
+
+
+# The background-frequency table is memory-mapped once and shared by every session
+@st.cache_resource
+def load_keyword_table(directory):
+	return shared.keyword_table(directory)
+
+
+# The overlap index is a SQLite file shared by all sessions; previous papers added by any user persist
+@st.cache_resource
+def load_overlap_index(path):
+	return shared.overlap_index(path)
+
+
+# Co-authorship graphs are keyed by the uploaded file's hash, so the graph and everything derived
+# from it (betweenness, communities) are computed once however often the page reruns
+@st.cache_resource(max_entries=4, show_spinner="Building co-authorship network...")
+def load_coauthor_graph(fingerprint, _source):
+	from publishing_guide import coauthors
+
+	return coauthors.CoauthorGraph.read_csv(_source)
+
+
+# Batch keyword suggestions are kept per uploaded publication list (by content hash), so reruns
+# triggered by any other widget reuse them instead of extracting again
+@st.cache_data(max_entries=8, show_spinner=False)
+def batch_keywords(fingerprint, _titles, _abstracts):
+	from publishing_guide import keywords
+
+	return keywords.extract_batch(_titles, _abstracts, table=load_keyword_table(keywords.DEFAULT_TABLE_DIR))
 
-	fig, ax = plt.subplots(figsize=(10, 6))
-	bars = ax.bar(journals, impact_factors, color=colors)
-	ax.set_title('Example Impact Factors of Top Journals vs. Field-Specific Journals')
-	ax.set_ylabel('Impact Factor (2023)')
-	ax.set_ylim(0, 100)
 
-	for bar in bars:
-		height = bar.get_height()
-		ax.annotate(f'{height:.1f}',
-					xy=(bar.get_x() + bar.get_width() / 2, height),
-					xytext=(0, 3),
-					textcoords="offset points",
-					ha='center', va='bottom')
+# Altmetric rollups are a SQLite file shared by all sessions; dumps ingested by any user persist
+@st.cache_resource
+def load_altmetrics_store(path):
+	return shared.altmetrics_store(path)
 
-	plt.xticks(rotation=45, ha='right')
-	plt.tight_layout()
 
-	return fig
+# One tracker (and its connection pool) per server process, shared by every session
+@st.cache_resource
+def load_portfolio_tracker(path):
+	return shared.portfolio_tracker(path)
 
 
-def create_publication_timeline():
-	# Sample data for publication timeline
-	stages = ['Research', 'Writing', 'Journal Selection', 'Submission', 'Initial Review',
-			  'Peer Review', 'Revisions', 'Acceptance', 'Publication']
-	time_weeks = [0, 12, 13, 14, 16, 24, 32, 36, 48]
+# Indexes, stores and static charts are loaded in the background once per server process, so the
+# first visitor does not wait for them (`python -m publishing_guide.warmup` does it before serving)
+@st.cache_resource
+def start_warmup():
+	return warmup.start_background()
 
-	fig, ax = plt.subplots(figsize=(12, 6))
-	ax.plot(time_weeks, range(len(stages)), 'bo-', markersize=10)
 
-	for i, stage in enumerate(stages):
-		ax.annotate(stage, (time_weeks[i], i), xytext=(10, 0),
-					textcoords='offset points', va='center')
+start_warmup()
 
-	ax.set_yticks([])
-	ax.set_xlabel('Weeks (approximate)')
-	ax.set_title('Typical Timeline of Academic Publication Process')
-	ax.grid(axis='x', linestyle='--', alpha=0.7)
 
-	plt.tight_layout()
-	return fig
+# Streamlit has no public count of connected sessions: its session manager is asked when it has
+# the (private) method, otherwise the sessions with memory accounting are counted
+def active_sessions():
+	from streamlit.runtime import Runtime
 
+	if not Runtime.exists():
+		return 0
+	count = getattr(getattr(Runtime.instance(), '_session_mgr', None), 'num_active_sessions', None)
+	if callable(count):
+		return count()
+	return len(sessions.REGISTRY.report())
 
-def create_open_access_chart():
-	labels = ['Gold OA', 'Green OA', 'Hybrid', 'Diamond OA', 'Traditional']
-	sizes = [30, 25, 20, 10, 15]
-	colors = ['#f9d923', '#36AE7C', '#187498', '#4361EE', '#888888']
-	explode = (0.1, 0, 0, 0.1, 0)
 
-	fig, ax = plt.subplots(figsize=(10, 7))
-	ax.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
-		   shadow=True, startangle=140)
-	ax.set_title('Publication Models in Academic Publishing')
-	ax.axis('equal')
+telemetry.gauge('publishing_guide_active_sessions', "Browser sessions connected to this server", active_sessions)
 
-	plt.tight_layout()
-	return fig
 
+# Every file uploader has a key, so the files a session holds are the UploadedFile values in its
+# session_state (one file, or a list of them)
+def uploaded_files(value):
+	files = value if isinstance(value, list) else [value]
+	return [file for file in files if isinstance(file, UploadedFile)]
 
-# Page content based on selection
-if selected_page == "Introduction to Academic Publishing":
-	st.markdown("<h1 class='main-header'>Introduction to Academic Publishing</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+# The JSON API (content and tools for LMS integrations, /metrics for Prometheus) runs alongside the app when
+# PUBLISHING_GUIDE_API_PORT is set; it is started once per server process
+@st.cache_resource
+def start_api_server(host, port):
+	server = api.ApiServer(host, port)
+	server.start_in_thread()
+	return server
+
+
+if os.environ.get('PUBLISHING_GUIDE_API_PORT'):
+	from publishing_guide import api
+
+	try:
+		start_api_server(os.environ.get('PUBLISHING_GUIDE_API_HOST', api.DEFAULT_HOST), int(os.environ['PUBLISHING_GUIDE_API_PORT']))
+	except OSError as error:
+		# Not cached, so a later rerun tries again (e.g. once the port is free)
+		st.sidebar.warning(f"The JSON API could not start: {error}")
+
+
+# Page content based on selection. The bookkeeping in `finally` runs for every rerun, including
+# ones cut short by an error or by st.stop()/st.rerun(), whose exceptions then carry on to Streamlit
+try:
+	if selected_page == "Introduction to Academic Publishing":
+		from publishing_guide import charts
+
+		st.markdown("<h1 class='main-header'>Introduction to Academic Publishing</h1>", unsafe_allow_html=True)
+
+		st.markdown("""
     Academic publishing is the process through which researchers share their findings with the broader scientific community 
     and the public. It's a critical part of the research cycle that allows for the verification, critique, 
     and building upon of knowledge.
     """)
 
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown("""
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown("""
     **Why is academic publishing important?**
     - Disseminates new knowledge and discoveries
     - Establishes intellectual priority and ownership of ideas
@@ -182,13 +228,13 @@ if selected_page == "Introduction to Academic Publishing":
     - Helps in career advancement and recognition
     - Influences policy decisions and practical applications
     """)
-	st.markdown("</div>", unsafe_allow_html=True)
+		st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>The Publishing Landscape</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>The Publishing Landscape</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
-	with col1:
-		st.markdown("""
+		col1, col2 = st.columns(2)
+		with col1:
+			st.markdown("""
         The academic publishing landscape has evolved significantly over the past decades:
 
         - **Traditional journals**: Established publications with subscription models
@@ -198,13 +244,12 @@ if selected_page == "Introduction to Academic Publishing":
         - **Alternative metrics**: Measuring impact beyond citation counts
         """)
 
-	with col2:
-		fig = create_open_access_chart()
-		st.pyplot(fig)
-		st.caption("Distribution of publication models in academic publishing")
+		with col2:
+			show_chart(charts.chart_image('open_access', charts.COLUMN_WIDTH), "Publication models pie chart")
+			st.caption("Distribution of publication models in academic publishing")
 
-	st.markdown("<h3 class='topic-header'>Key Challenges for Beginners</h3>", unsafe_allow_html=True)
-	st.markdown("""
+		st.markdown("<h3 class='topic-header'>Key Challenges for Beginners</h3>", unsafe_allow_html=True)
+		st.markdown("""
     As a beginner in academic publishing, you'll face several challenges:
 
     1. **Finding the right journal** for your research
@@ -217,101 +262,35 @@ if selected_page == "Introduction to Academic Publishing":
     This guide will help you navigate these challenges and provide a solid foundation for your publishing journey.
     """)
 
-	st.success(
-		"This interactive guide will walk you through each aspect of academic publishing, from understanding different types of publications to successfully publishing in reputable journals.")
+		st.success(
+			"This interactive guide will walk you through each aspect of academic publishing, from understanding different types of publications to successfully publishing in reputable journals.")
 
-elif selected_page == "Types of Publications":
-	st.markdown("<h1 class='main-header'>Types of Academic Publications</h1>", unsafe_allow_html=True)
+	elif selected_page == "Types of Publications":
+		st.markdown("<h1 class='main-header'>Types of Academic Publications</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Academic research can be published in various formats, each serving different purposes and audiences. 
     Understanding these formats will help you choose the most appropriate outlet for your work.
     """)
 
-	publication_types = {
-		"Original Research Articles": {
-			"description": "Present new, unpublished research, including methodology, results, and discussions",
-			"typical_length": "4,000-8,000 words",
-			"review_process": "Full peer review",
-			"example": "Smith et al. (2023) 'Novel approaches to quantum computing in environmental science', Nature",
-			"suitable_for": "Completed research projects with substantial findings"
-		},
-		"Review Articles": {
-			"description": "Synthesize and analyze existing research on a specific topic",
-			"typical_length": "6,000-10,000 words",
-			"review_process": "Full peer review",
-			"example": "Johnson & Garcia (2022) 'A decade of progress in CRISPR gene editing: A comprehensive review', Annual Review of Genetics",
-			"suitable_for": "Researchers with broad knowledge of a field wanting to provide an overview"
-		},
-		"Short Communications/Letters": {
-			"description": "Brief reports of significant, novel findings that warrant rapid publication",
-			"typical_length": "1,500-3,000 words",
-			"review_process": "Expedited peer review",
-			"example": "Chen et al. (2024) 'Rapid detection of viral mutations using AI algorithms', Science",
-			"suitable_for": "Time-sensitive findings or preliminary results of high importance"
-		},
-		"Case Studies/Reports": {
-			"description": "Detailed analysis of specific instances, patients, or phenomena",
-			"typical_length": "2,000-4,000 words",
-			"review_process": "Peer review",
-			"example": "Patel & Williams (2023) 'Management of rare neurological disorder: A case study', The Lancet Neurology",
-			"suitable_for": "Clinical observations, unique cases, or specific implementations"
-		},
-		"Methodological Papers": {
-			"description": "Present new experimental or computational methods, tests, or procedures",
-			"typical_length": "3,000-6,000 words",
-			"review_process": "Peer review with technical focus",
-			"example": "Martinez et al. (2024) 'A novel approach for single-cell RNA sequencing in limited samples', Nature Methods",
-			"suitable_for": "Researchers who have developed innovative techniques or improvements"
-		},
-		"Book Chapters": {
-			"description": "Contributions to edited volumes focusing on specific aspects of a broader topic",
-			"typical_length": "5,000-10,000 words",
-			"review_process": "Editor review, sometimes peer review",
-			"example": "Wilson (2023) 'Climate change impacts on urban infrastructure' in 'Climate Adaptation in Cities'",
-			"suitable_for": "Established researchers invited to contribute specialized knowledge"
-		},
-		"Conference Papers/Proceedings": {
-			"description": "Research presented at academic conferences, published in proceedings",
-			"typical_length": "2,000-5,000 words",
-			"review_process": "Varies (abstract review to full peer review)",
-			"example": "Rodriguez & Kim (2024) 'Machine learning for predicting protein structures', Proceedings of the 10th AI Conference",
-			"suitable_for": "Work in progress or completed research to be presented to peers"
-		},
-		"Commentaries/Perspectives": {
-			"description": "Expert opinions or insights on current issues, trends, or published research",
-			"typical_length": "1,000-3,000 words",
-			"review_process": "Editorial review",
-			"example": "Taylor (2023) 'The future of renewable energy policy', Energy Policy",
-			"suitable_for": "Experienced researchers offering context or opinion on important topics"
-		},
-		"Preprints": {
-			"description": "Preliminary versions of research papers shared before formal peer review",
-			"typical_length": "Varies by field",
-			"review_process": "No formal peer review",
-			"example": "Li et al. (2024) 'Preliminary evidence for exoplanet atmospheric composition', arXiv",
-			"suitable_for": "Researchers seeking early feedback or establishing priority"
-		}
-	}
-
-	# Create an interactive element to explore publication types
-	selected_pub_type = st.selectbox("Select a publication type to learn more:", list(publication_types.keys()))
-
-	# Display the details of the selected publication type
-	pub_details = publication_types[selected_pub_type]
-
-	st.markdown(f"<h3 class='topic-header'>{selected_pub_type}</h3>", unsafe_allow_html=True)
-
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown(f"**Description:** {pub_details['description']}")
-	st.markdown(f"**Typical Length:** {pub_details['typical_length']}")
-	st.markdown(f"**Review Process:** {pub_details['review_process']}")
-	st.markdown(f"**Example:** {pub_details['example']}")
-	st.markdown(f"**Best For:** {pub_details['suitable_for']}")
-	st.markdown("</div>", unsafe_allow_html=True)
-
-	st.markdown("<h3 class='topic-header'>Choosing the Right Publication Type</h3>", unsafe_allow_html=True)
-	st.markdown("""
+		# Create an interactive element to explore publication types
+		selected_pub_type = explorer("Select a publication type to learn more:", selected_page)
+
+		# Display the details of the selected publication type
+		pub_details = content.PUBLICATION_TYPES[selected_pub_type]
+
+		st.markdown(f"<h3 class='topic-header'>{selected_pub_type}</h3>", unsafe_allow_html=True)
+
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown(f"**Description:** {pub_details['description']}")
+		st.markdown(f"**Typical Length:** {pub_details['typical_length']}")
+		st.markdown(f"**Review Process:** {pub_details['review_process']}")
+		st.markdown(f"**Example:** {pub_details['example']}")
+		st.markdown(f"**Best For:** {pub_details['suitable_for']}")
+		st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Choosing the Right Publication Type</h3>", unsafe_allow_html=True)
+		st.markdown("""
     Consider these factors when deciding which publication type is best for your research:
 
     1. **Stage of research**: Completed study or preliminary findings?
@@ -321,74 +300,76 @@ elif selected_page == "Types of Publications":
     5. **Career goals**: How will this publication contribute to your research profile?
     """)
 
-	st.info(
-		"**Pro Tip:** Many researchers develop a publication strategy that includes different types of publications from a single research project. For example, presenting preliminary findings at a conference, sharing methodological innovations in a specialized journal, and publishing comprehensive results in a high-impact journal.")
+		st.info(
+			"**Pro Tip:** Many researchers develop a publication strategy that includes different types of publications from a single research project. For example, presenting preliminary findings at a conference, sharing methodological innovations in a specialized journal, and publishing comprehensive results in a high-impact journal.")
+
+	elif selected_page == "Types of Journals":
+		from publishing_guide import charts, recommender
 
-elif selected_page == "Types of Journals":
-	st.markdown("<h1 class='main-header'>Types of Academic Journals</h1>", unsafe_allow_html=True)
+		st.markdown("<h1 class='main-header'>Types of Academic Journals</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Academic journals vary widely in scope, prestige, audience, and publishing models. Understanding these differences 
     is crucial for selecting the right venue for your research.
     """)
 
-	st.markdown("<h3 class='topic-header'>Classification by Scope</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Classification by Scope</h3>", unsafe_allow_html=True)
 
-	scope_col1, scope_col2 = st.columns(2)
+		scope_col1, scope_col2 = st.columns(2)
 
-	with scope_col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with scope_col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Multidisciplinary Journals**
         - Publish research from multiple fields
         - Examples: Nature, Science, PNAS, PLOS ONE
         - Generally higher visibility but more competitive
         - Seek research with broad implications
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Field-Specific Journals**
         - Focus on a particular academic discipline
         - Examples: Cell, Journal of Finance, Physical Review
         - Reach targeted audience in your field
         - Content spans the entire discipline
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with scope_col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with scope_col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Specialized Journals**
         - Concentrate on a specific sub-discipline
         - Examples: Biomacromolecules, Urban Climate, Child Neuropsychology
         - Highly focused readership
         - Deeper technical content appropriate for specialists
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Regional Journals**
         - Focus on research relevant to specific geographic regions
         - Examples: European Journal of Public Health, Latin American Research Review
         - Important for locally-relevant research
         - May have language options beyond English
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Classification by Prestige and Impact</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Classification by Prestige and Impact</h3>", unsafe_allow_html=True)
 
-	# Visualize impact factors
-	st.pyplot(create_impact_factor_chart())
-	st.caption("Example impact factors for selected journals (2023 data)")
+		# Visualize impact factors
+		show_chart(charts.chart_image('impact_factor'), "Impact factors of top journals")
+		st.caption("Example impact factors for selected journals (2023 data)")
 
-	tier_col1, tier_col2 = st.columns(2)
+		tier_col1, tier_col2 = st.columns(2)
 
-	with tier_col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with tier_col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Top-Tier ("Flagship") Journals**
         - Highest impact factors and prestige
         - Very selective (acceptance rates often <10%)
@@ -396,10 +377,10 @@ elif selected_page == "Types of Journals":
         - Significant visibility and career impact
         - Long and demanding review process
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Mid-Tier Journals**
         - Respectable impact factors
         - Moderate selectivity (acceptance rates 20-40%)
@@ -407,11 +388,11 @@ elif selected_page == "Types of Journals":
         - Good visibility to relevant audiences
         - Examples: PLOS ONE, Scientific Reports, field-specific journals
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with tier_col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with tier_col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Specialized High-Impact Journals**
         - High impact within a specific sub-discipline
         - Selective within their niche
@@ -419,10 +400,10 @@ elif selected_page == "Types of Journals":
         - Excellent visibility to targeted audience
         - Strong reputation among specialists
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Emerging and New Journals**
         - Recently established, building reputation
         - May have innovative publishing models
@@ -430,11 +411,11 @@ elif selected_page == "Types of Journals":
         - Lower barriers to entry but less established prestige
         - Example: Nature Communications (established 2010)
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Journal Series and Families</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Journal Series and Families</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Many publishers have developed "families" of journals with different levels of selectivity and scope:
 
     **Example: Nature Portfolio**
@@ -447,9 +428,9 @@ elif selected_page == "Types of Journals":
     may be offered transfer to a more specialized or less selective journal in the same family.
     """)
 
-	st.markdown("<h3 class='topic-header'>Journal Selection Strategy</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Journal Selection Strategy</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     When selecting a journal, consider:
 
     1. **Fit with scope**: Does your research match the journal's focus?
@@ -461,90 +442,107 @@ elif selected_page == "Types of Journals":
     7. **Journal metrics**: Impact factor, CiteScore, etc.
     """)
 
-	st.info(
-		"**Pro Tip:** Review recent issues of potential target journals to assess whether your paper's style, methodology, and scope are a good match. Many experienced researchers identify 3-5 potential journals ranked in order of preference before submission.")
+		st.info(
+			"**Pro Tip:** Review recent issues of potential target journals to assess whether your paper's style, methodology, and scope are a good match. Many experienced researchers identify 3-5 potential journals ranked in order of preference before submission.")
+
+		st.markdown("<h3 class='topic-header'>Find Journals Matching Your Manuscript</h3>", unsafe_allow_html=True)
+
+		if not os.path.exists(recommender.DEFAULT_INDEX_PATH):
+			st.info(
+				"The journal recommender needs a local index of journal scope statements. Build it once with "
+				"`python -m publishing_guide.recommender journals.csv` (columns: journal, scope, abstract).")
+		else:
+			journal_index = load_journal_index(recommender.DEFAULT_INDEX_PATH)
+
+			with st.form("journal_recommender"):
+				manuscript_title = st.text_input("Manuscript title")
+				manuscript_abstract = st.text_area("Abstract", height=200)
+				top_k = st.slider("Number of suggestions", 5, 30, 10)
+				submitted = st.form_submit_button("Suggest journals")
+
+			if submitted and (manuscript_title.strip() or manuscript_abstract.strip()):
+				suggestions = journal_index.recommend(manuscript_abstract, manuscript_title, k=top_k)
+				if suggestions:
+					st.dataframe(
+						pd.DataFrame(suggestions, columns=['Journal', 'Match score']),
+						hide_index=True)
+					st.caption(f"Ranked against {len(journal_index):,} journals in the local index. "
+							   "Always confirm scope and reputation on the journal's own website.")
+				else:
+					st.warning("None of the indexed journal scopes share vocabulary with your text.")
 
-elif selected_page == "Understanding Journal Metrics":
-	st.markdown("<h1 class='main-header'>Understanding Journal Metrics</h1>", unsafe_allow_html=True)
+	elif selected_page == "Understanding Journal Metrics":
+		from publishing_guide import eigenfactor, journal_metrics
 
-	st.markdown("""
+		st.markdown("<h1 class='main-header'>Understanding Journal Metrics</h1>", unsafe_allow_html=True)
+
+		st.markdown("""
     Journal metrics are quantitative measures used to assess the relative importance and influence of academic journals. 
     These metrics help researchers evaluate where to publish and help institutions assess research quality.
     """)
 
-	st.markdown("<h3 class='topic-header'>Common Journal Metrics</h3>", unsafe_allow_html=True)
-
-	metrics = {
-		"Impact Factor (IF)": {
-			"description": "Average number of citations received per paper published in that journal during the two preceding years",
-			"publisher": "Clarivate Analytics (Web of Science)",
-			"strengths": "Widely recognized, long-established, simple to understand",
-			"limitations": "Can be manipulated, field-dependent, affected by outliers, short citation window",
-			"example": "Nature (2023): 49.962, NEJM (2023): 91.245"
-		},
-		"CiteScore": {
-			"description": "Similar to Impact Factor but counts citations over 4 years instead of 2",
-			"publisher": "Elsevier (Scopus)",
-			"strengths": "Larger citation window reduces annual fluctuations, covers more journals than IF",
-			"limitations": "Still field-dependent, can be influenced by self-citation practices",
-			"example": "Nature (2023): 45.3, Lancet (2023): 63.2"
-		},
-		"SCImago Journal Rank (SJR)": {
-			"description": "Measures weighted citations based on the prestige of the citing journal",
-			"publisher": "SCImago Lab (Scopus data)",
-			"strengths": "Considers citation quality not just quantity, mitigates field differences",
-			"limitations": "More complex to calculate and understand, less widely used",
-			"example": "Cell (2023): 13.48, JAMA (2023): 8.56"
-		},
-		"Source Normalized Impact per Paper (SNIP)": {
-			"description": "Measures contextual citation impact by weighting citations based on the total number of citations in a subject field",
-			"publisher": "CWTS (Leiden University)",
-			"strengths": "Normalizes for differences in citation practices between fields",
-			"limitations": "Complex methodology, less intuitive than simple ratios",
-			"example": "Science (2023): 7.52, Nature Materials (2023): 6.48"
-		},
-		"h-index for journals": {
-			"description": "A journal has an h-index of h if h of its papers have been cited at least h times",
-			"publisher": "Various",
-			"strengths": "Captures both productivity and citation impact, resistant to outliers",
-			"limitations": "Size-dependent, favors older journals, cumulative measure that always increases",
-			"example": "Nature (cumulative): 1120, Science (cumulative): 1089"
-		},
-		"Eigenfactor": {
-			"description": "Rates the total importance of a journal based on citations with a 5-year window, similar to Google's PageRank algorithm",
-			"publisher": "University of Washington",
-			"strengths": "Eliminates self-citations, accounts for prestige of citing journals, normalizes for field",
-			"limitations": "Complex algorithm less transparent to users",
-			"example": "Nature (2023): 1.56, Cell (2023): 0.67"
-		},
-		"Acceptance Rate": {
-			"description": "Percentage of submitted manuscripts that are accepted for publication",
-			"publisher": "Journals themselves (not always disclosed)",
-			"strengths": "Direct measure of selectivity and competition",
-			"limitations": "Not standardized, not consistently reported, affected by submission volume",
-			"example": "Science: ~7%, PLOS ONE: ~50%"
-		}
-	}
-
-	# Create interactive element to explore metrics
-	selected_metric = st.selectbox("Select a metric to learn more:", list(metrics.keys()))
-
-	# Display information for the selected metric
-	metric_details = metrics[selected_metric]
-
-	st.markdown(f"<h3 class='topic-header'>{selected_metric}</h3>", unsafe_allow_html=True)
-
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown(f"**Description:** {metric_details['description']}")
-	st.markdown(f"**Published by:** {metric_details['publisher']}")
-	st.markdown(f"**Strengths:** {metric_details['strengths']}")
-	st.markdown(f"**Limitations:** {metric_details['limitations']}")
-	st.markdown(f"**Examples:** {metric_details['example']}")
-	st.markdown("</div>", unsafe_allow_html=True)
-
-	st.markdown("<h3 class='topic-header'>Journal Quartiles</h3>", unsafe_allow_html=True)
-
-	st.markdown("""
+		st.markdown("<h3 class='topic-header'>Common Journal Metrics</h3>", unsafe_allow_html=True)
+
+		metrics = content.JOURNAL_METRICS
+
+		# Create interactive element to explore metrics
+		selected_metric = explorer("Select a metric to learn more:", selected_page)
+
+		# Display information for the selected metric
+		metric_details = metrics[selected_metric]
+
+		st.markdown(f"<h3 class='topic-header'>{selected_metric}</h3>", unsafe_allow_html=True)
+
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown(f"**Description:** {metric_details['description']}")
+		st.markdown(f"**Published by:** {metric_details['publisher']}")
+		st.markdown(f"**Strengths:** {metric_details['strengths']}")
+		st.markdown(f"**Limitations:** {metric_details['limitations']}")
+		st.markdown(f"**Examples:** {metric_details['example']}")
+		st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Compute Metrics from Your Own Citation Data</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload a local citation dump (CSV with `citing_paper`, `cited_paper`, `journal` and `year` columns, one row per 
+    reference, where journal and year describe the citing paper) to compute Impact Factor, CiteScore and a 
+    SNIP-style field-normalized impact for every journal in it. Each year is cached separately, so adding a new 
+    year of data only recomputes the windows that include it.
+    """)
+
+		metrics_engine = load_journal_metrics_engine(journal_metrics.DEFAULT_CACHE_DIR)
+		citation_dump = st.file_uploader("Citation dump", type=['csv'], key="citation_dump")
+		if citation_dump is not None and st.session_state.get('citation_dump_loaded') != (citation_dump.name, citation_dump.size):
+			with st.spinner("Updating journal metrics..."):
+				try:
+					rebuilt_years = metrics_engine.add_citations(journal_metrics.read_citation_dump(citation_dump))
+				except ValueError as error:
+					st.error(str(error))
+				else:
+					st.session_state['citation_dump_loaded'] = (citation_dump.name, citation_dump.size)
+					if rebuilt_years:
+						st.success(f"Recomputed {len(rebuilt_years)} year(s): {', '.join(map(str, rebuilt_years))}")
+
+		if metrics_engine.years():
+			metric_year = st.selectbox("Metric year", metrics_engine.years()[::-1])
+			st.dataframe(metrics_engine.metrics(metric_year), use_container_width=True)
+			st.caption("Items counts papers published in the four-year CiteScore window. Metrics are computed only "
+					   "from the uploaded data, so they will differ from the official databases.")
+
+			if st.checkbox("Also compute Eigenfactor and Article Influence scores"):
+				with st.spinner("Running Eigenfactor power iteration..."):
+					eigenfactor_table = eigenfactor.compute(metrics_engine, metric_year)
+				if eigenfactor_table.empty:
+					st.info(f"No citations between journals in the {eigenfactor.CITATION_WINDOW} years before {metric_year}, "
+							"so there is nothing to score yet.")
+				else:
+					st.dataframe(eigenfactor_table, use_container_width=True)
+				st.caption("Eigenfactor uses citations made in the selected year to items from the previous five years, "
+						   "excluding journal self-citations.")
+
+		st.markdown("<h3 class='topic-header'>Journal Quartiles</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
     Journals are often categorized into quartiles (Q1, Q2, Q3, Q4) based on their metrics within their field:
 
     - **Q1**: Top 25% of journals in the field
@@ -556,23 +554,23 @@ elif selected_page == "Understanding Journal Metrics":
     vary significantly between disciplines.
     """)
 
-	# Create a simple visualization of journal quartiles
-	quartile_data = pd.DataFrame({
-		'Quartile': ['Q1', 'Q2', 'Q3', 'Q4'],
-		'Percentile Range': ['75-100', '50-75', '25-50', '0-25'],
-		'Typical Characteristics': [
-			'Highest visibility and prestige, very selective',
-			'Good reputation, moderate selectivity',
-			'Emerging or specialized journals',
-			'New journals or less established venues'
-		]
-	})
+		# Create a simple visualization of journal quartiles
+		quartile_data = pd.DataFrame({
+			'Quartile': ['Q1', 'Q2', 'Q3', 'Q4'],
+			'Percentile Range': ['75-100', '50-75', '25-50', '0-25'],
+			'Typical Characteristics': [
+				'Highest visibility and prestige, very selective',
+				'Good reputation, moderate selectivity',
+				'Emerging or specialized journals',
+				'New journals or less established venues'
+			]
+		})
 
-	st.dataframe(quartile_data, hide_index=True)
+		st.dataframe(quartile_data, hide_index=True)
 
-	st.markdown("<h3 class='topic-header'>Using Journal Metrics Wisely</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Using Journal Metrics Wisely</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Journal metrics should be used thoughtfully:
 
     1. **Consider multiple metrics**: No single metric tells the complete story
@@ -582,30 +580,31 @@ elif selected_page == "Understanding Journal Metrics":
     5. **Remember the content**: The quality and fit of your paper is more important than chasing metrics
     """)
 
-	st.warning("""
+		st.warning("""
     **Important Note:**
     While journal metrics can guide publication decisions, they're imperfect proxies for quality. Many organizations, 
     including DORA (San Francisco Declaration on Research Assessment), advocate for reducing reliance on journal-based 
     metrics in favor of assessing research on its own merits.
     """)
 
-elif selected_page == "Access Models: Open Access & Subscriptions":
-	st.markdown("<h1 class='main-header'>Access Models: Open Access & Subscriptions</h1>", unsafe_allow_html=True)
+	elif selected_page == "Access Models: Open Access & Subscriptions":
+		from publishing_guide import apc, charts
 
-	st.markdown("""
+		st.markdown("<h1 class='main-header'>Access Models: Open Access & Subscriptions</h1>", unsafe_allow_html=True)
+
+		st.markdown("""
     The way research is accessed and who pays for publication costs varies significantly across academic publishing. 
     Understanding these access models is crucial for making informed decisions about where to publish.
     """)
 
-	# Visual representation of access models
-	fig = create_open_access_chart()
-	st.pyplot(fig)
-	st.caption("Distribution of publication access models in academic publishing")
+		# Visual representation of access models
+		show_chart(charts.chart_image('open_access'), "Publication models pie chart")
+		st.caption("Distribution of publication access models in academic publishing")
 
-	st.markdown("<h3 class='topic-header'>Traditional Subscription Model</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Traditional Subscription Model</h3>", unsafe_allow_html=True)
 
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown("""
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown("""
     **How it works:**
     - Readers (or their institutions) pay subscription fees to access content
     - Authors typically don't pay to publish
@@ -625,15 +624,15 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
     - Research inaccessible to many potential readers
     - Perpetuates inequalities in access to knowledge
     """)
-	st.markdown("</div>", unsafe_allow_html=True)
+		st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Open Access Models</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Open Access Models</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Gold Open Access**
 
         **How it works:**
@@ -653,10 +652,10 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
         - May create barriers for unfunded researchers
         - Quality concerns with some newer OA journals
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Green Open Access**
 
         **How it works:**
@@ -676,11 +675,11 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
         - Usually can only share accepted manuscript, not final version
         - Repository versions may lack final formatting
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Hybrid Open Access**
 
         **How it works:**
@@ -700,10 +699,10 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
         - Criticized as "double dipping" (subscription + APC revenue)
         - Complicated licensing and copyright arrangements
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Diamond/Platinum Open Access**
 
         **How it works:**
@@ -723,11 +722,11 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
         - Limited in number compared to other models
         - May have fewer resources for marketing/promotion
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>APC Waivers and Discounts</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>APC Waivers and Discounts</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Many open access publishers offer APC waivers or reductions for:
 
     - Researchers from low and middle-income countries
@@ -738,9 +737,9 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
     **Always check publisher websites for waiver policies before assuming you cannot afford to publish open access.**
     """)
 
-	st.markdown("<h3 class='topic-header'>Transformative Agreements</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Transformative Agreements</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     A growing trend is "transformative agreements" between publishers and institutions/consortia:
 
     - Combines subscription access with open access publishing rights
@@ -751,9 +750,44 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
     **Check with your library or research office to see if your institution has such agreements that cover your APC costs.**
     """)
 
-	st.markdown("<h3 class='topic-header'>Making Your Decision</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>APC Budget Planner</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Enter your lab's planned papers and the candidate journals for each, with list APCs, any waiver you qualify for 
+    and discounts from your institution's agreements. The planner picks one open access route per paper so that as 
+    many papers as possible (weighted by priority) are open access within your budget.
+    """)
 
-	st.markdown("""
+		planned_papers = st.data_editor(
+			pd.DataFrame({'paper': ['Paper A', 'Paper B', 'Paper C'], 'priority': [2, 1, 1]}),
+			num_rows="dynamic", key="apc_papers")
+		journal_options = st.data_editor(
+			pd.DataFrame({
+				'paper': ['Paper A', 'Paper A', 'Paper B', 'Paper B', 'Paper C'],
+				'journal': ['Journal X', 'Journal Y', 'Journal X', 'Journal Z', 'Journal Y'],
+				'route': ['Gold', 'Hybrid', 'Gold', 'Diamond', 'Hybrid'],
+				'apc': [2500.0, 4000.0, 2500.0, 0.0, 4000.0],
+				'waiver_pct': [0.0, 0.0, 50.0, 0.0, 0.0],
+				'agreement_discount_pct': [0.0, 100.0, 0.0, 0.0, 20.0],
+				'preference': [0.5, 1.0, 0.5, 0.8, 1.0],
+			}),
+			num_rows="dynamic", key="apc_options",
+			column_config={'route': st.column_config.SelectboxColumn('route', options=apc.OA_ROUTES)})
+		apc_budget = st.number_input("Available APC budget (USD)", min_value=0, value=5000, step=500)
+
+		try:
+			apc_plan = apc.optimize(planned_papers, journal_options, apc_budget)
+		except ValueError as error:
+			st.error(str(error))
+		else:
+			st.dataframe(apc_plan, hide_index=True)
+			st.caption(
+				f"{int(apc_plan['open_access'].sum())} of {len(apc_plan)} papers open access for "
+				f"${apc_plan['net_apc'].sum():,.0f} of ${apc_budget:,.0f}.")
+
+		st.markdown("<h3 class='topic-header'>Making Your Decision</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
     When deciding on an access model for your publication:
 
     1. **Check funder requirements**: Many require open access publication
@@ -764,27 +798,29 @@ elif selected_page == "Access Models: Open Access & Subscriptions":
     6. **Explore green OA options**: Secondary archiving can expand access
     """)
 
-	st.info("""
+		st.info("""
     **Pro Tip:** The "Journal Checker Tool" (https://journalcheckertool.org/) helps researchers identify journals 
     that comply with specific funder open access policies, taking into account institutional agreements.
     """)
 
-elif selected_page == "The Publication Process":
-	st.markdown("<h1 class='main-header'>The Publication Process: From Idea to Publication</h1>",
-				unsafe_allow_html=True)
+	elif selected_page == "The Publication Process":
+		from publishing_guide import charts, portfolio
 
-	st.markdown("""
+		st.markdown("<h1 class='main-header'>The Publication Process: From Idea to Publication</h1>",
+					unsafe_allow_html=True)
+
+		st.markdown("""
     The journey from research idea to published paper involves multiple steps and stakeholders. Understanding this process 
     helps set realistic expectations and navigate the system effectively.
     """)
 
-	# Display timeline chart
-	st.pyplot(create_publication_timeline())
-	st.caption("Approximate timeline of the academic publication process (varies by field and journal)")
+		# Display timeline chart
+		show_chart(charts.chart_image('publication_timeline'), "Timeline of the publication process")
+		st.caption("Approximate timeline of the academic publication process (varies by field and journal)")
 
-	st.markdown("<h3 class='topic-header'>Stage 1: Pre-Submission</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 1: Pre-Submission</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Research and Analysis**
     - Conduct research following rigorous methods
     - Analyze data and draw conclusions
@@ -808,9 +844,9 @@ elif selected_page == "The Publication Process":
     - Consider using preprint servers for early feedback
     """)
 
-	st.markdown("<h3 class='topic-header'>Stage 2: Submission and Initial Review</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 2: Submission and Initial Review</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Manuscript Submission**
     - Create account in journal's submission system
     - Prepare cover letter highlighting significance
@@ -830,12 +866,12 @@ elif selected_page == "The Publication Process":
     - Incomplete submission materials
     """)
 
-	st.markdown("<h3 class='topic-header'>Stage 3: Peer Review</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 3: Peer Review</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("""
+		with col1:
+			st.markdown("""
         **Reviewer Selection**
         - Editor identifies appropriate reviewers (2-4 typically)
         - Reviewers accept or decline invitation
@@ -851,8 +887,8 @@ elif selected_page == "The Publication Process":
         - Review period: 2-8 weeks depending on journal
         """)
 
-	with col2:
-		st.markdown("""
+		with col2:
+			st.markdown("""
         **Types of Peer Review**
 
         - **Single-blind**: Reviewers know authors' identities, but authors don't know reviewers'
@@ -863,9 +899,9 @@ elif selected_page == "The Publication Process":
         - **Post-publication review**: Public commentary after publication
         """)
 
-	st.markdown("<h3 class='topic-header'>Stage 4: Editorial Decision</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 4: Editorial Decision</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Based on peer reviews, editors make one of several decisions:
 
     **Accept (rare for first submission)**
@@ -891,9 +927,9 @@ elif selected_page == "The Publication Process":
     - May recommend submission to another journal
     """)
 
-	st.markdown("<h3 class='topic-header'>Stage 5: Revision and Resubmission</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 5: Revision and Resubmission</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Addressing Reviewer Comments**
     - Carefully address each reviewer point
     - Prepare detailed response letter explaining changes
@@ -910,9 +946,9 @@ elif selected_page == "The Publication Process":
     - This process may iterate multiple times
     """)
 
-	st.markdown("<h3 class='topic-header'>Stage 6: Acceptance and Production</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 6: Acceptance and Production</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Acceptance**
     - Formal acceptance notification
     - Copyright transfer or licensing agreement
@@ -931,9 +967,9 @@ elif selected_page == "The Publication Process":
     - Inclusion in issue (for traditional journals)
     """)
 
-	st.markdown("<h3 class='topic-header'>Stage 7: Post-Publication</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Stage 7: Post-Publication</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Promotion**
     - Share via social media and academic networks
     - Deposit in repositories (if allowed)
@@ -949,7 +985,75 @@ elif selected_page == "The Publication Process":
     - Address any serious concerns transparently
     """)
 
-	st.success("""
+		st.markdown("<h3 class='topic-header'>Track Your Lab's Manuscripts</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    A lab rarely has a single paper in the pipeline. Record each manuscript's journal, stage and deadline here and
+    follow all of them on one timeline. The tracker is stored locally and shared by everyone using this app, so
+    the whole group sees the same portfolio. A CSV with a `title` column (and optionally `journal`, `stage`,
+    `lead_author`, `started` and `deadline`) can be imported in one go.
+    """)
+
+		tracker = load_portfolio_tracker(portfolio.DEFAULT_PORTFOLIO_PATH)
+
+		with st.expander("Add manuscripts"):
+			with st.form('portfolio_add', clear_on_submit=True):
+				add_col1, add_col2 = st.columns(2)
+				new_title = add_col1.text_input("Title")
+				new_journal = add_col2.text_input("Target journal")
+				new_author = add_col1.text_input("Lead author")
+				new_stage = add_col2.selectbox("Stage", portfolio.STAGES)
+				new_started = add_col1.date_input("Started")
+				new_deadline = add_col2.text_input("Deadline (YYYY-MM-DD, optional)")
+				if st.form_submit_button("Add manuscript") and new_title.strip():
+					try:
+						tracker.add(new_title, new_journal, new_stage, new_author, new_started, new_deadline)
+					except ValueError as error:
+						st.error(str(error))
+			manuscript_list = st.file_uploader("Import a manuscript list", type=['csv'], key='portfolio_import')
+			if manuscript_list is not None and st.session_state.get('portfolio_imported') != (manuscript_list.name, manuscript_list.size):
+				try:
+					imported = tracker.import_csv(manuscript_list)
+				except ValueError as error:
+					st.error(str(error))
+				else:
+					st.session_state['portfolio_imported'] = (manuscript_list.name, manuscript_list.size)
+					st.caption(f"Imported {imported:,} manuscripts.")
+
+		if len(tracker):
+			stage_counts = tracker.stage_counts()
+			for column, (stage, count) in zip(st.columns(len(stage_counts)), stage_counts.items()):
+				column.metric(stage, f"{count:,}")
+
+			filter_col1, filter_col2, filter_col3 = st.columns(3)
+			shown_stages = filter_col1.multiselect(
+				"Stages", portfolio.STAGES, default=[stage for stage in portfolio.STAGES if stage not in portfolio.CLOSED_STAGES])
+			shown_journal = filter_col2.selectbox("Journal", ['All journals'] + tracker.journals())
+			due_within = filter_col3.number_input("Due within (days, 0 = any)", min_value=0, value=0, step=7)
+			lab_manuscripts = tracker.manuscripts(
+				stages=shown_stages,
+				journal=None if shown_journal == 'All journals' else shown_journal,
+				due_before=pd.Timestamp.today() + pd.Timedelta(days=due_within) if due_within else None,
+				limit=2000)
+
+			if len(lab_manuscripts):
+				show_chart(charts.encode_adaptive(
+					charts.create_portfolio_gantt(lab_manuscripts, tracker.segments(lab_manuscripts['id']))), "Manuscripts by stage")
+				st.dataframe(lab_manuscripts.drop(columns=['id']), hide_index=True, use_container_width=True)
+
+				move_col1, move_col2, move_col3 = st.columns([3, 2, 1])
+				moved_manuscript = move_col1.selectbox(
+					"Manuscript", lab_manuscripts['id'],
+					format_func=dict(zip(lab_manuscripts['id'], lab_manuscripts['title'])).get)
+				moved_stage = move_col2.selectbox("Move to stage", portfolio.STAGES, key='portfolio_move_stage')
+				if move_col3.button("Update"):
+					tracker.move(int(moved_manuscript), moved_stage)
+					# Drawn again so the table and the Gantt chart above show the new stage
+					st.rerun()
+			else:
+				st.info("No manuscripts match these filters.")
+
+		st.success("""
     **Success Factors for Publication:**
 
     - **Rigorous research**: Strong methodology and analysis
@@ -959,131 +1063,210 @@ elif selected_page == "The Publication Process":
     - **Persistence**: Willingness to revise and possibly resubmit elsewhere if rejected
     """)
 
-elif selected_page == "Writing Your Research Paper":
-	st.markdown("<h1 class='main-header'>Writing Your Research Paper</h1>", unsafe_allow_html=True)
+	elif selected_page == "Writing Your Research Paper":
+		from publishing_guide import charts, manuscript, readability, references
+
+		st.markdown("<h1 class='main-header'>Writing Your Research Paper</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Writing an effective research paper requires both scientific rigor and clear communication. 
     This guide will help you structure your manuscript and avoid common pitfalls.
     """)
 
-	st.markdown("<h3 class='topic-header'>Standard Paper Structure (IMRaD)</h3>", unsafe_allow_html=True)
-
-	paper_sections = {
-		"Title": {
-			"purpose": "Concisely describe the paper's content and attract readers",
-			"tips": "Be specific, include key concepts, avoid jargon, keep under 15 words if possible",
-			"example": "CRISPR-Cas9 Gene Editing Reverses Antibiotic Resistance in Pathogenic E. coli Strains",
-			"common_mistakes": "Too vague, too technical, too long, or using unnecessary words like 'A study of...'"
-		},
-		"Abstract": {
-			"purpose": "Summarize the entire paper in a single paragraph",
-			"tips": "Include background, objective, methods, results, and conclusion in 150-300 words",
-			"example": "Antibiotic resistance poses a global health threat. Here we demonstrate that CRISPR-Cas9 gene editing can effectively reverse resistance to ampicillin in E. coli strains by targeting the beta-lactamase gene. We developed a modified delivery system using bacteriophage vectors that achieved 87% editing efficiency in vitro and 64% in mouse models. Treated bacterial populations showed renewed susceptibility to ampicillin treatment with MIC values comparable to non-resistant strains. These results demonstrate a potential strategy for combating antibiotic resistance in clinical settings.",
-			"common_mistakes": "Including too much detail, omitting key results, using undefined abbreviations, exceeding word limits"
-		},
-		"Introduction": {
-			"purpose": "Provide context, establish importance, and state research questions",
-			"tips": "Move from broad field to specific gap, clearly state objectives at the end",
-			"example": "Starting with the global problem of antibiotic resistance, narrowing to beta-lactam resistance mechanisms, identifying the specific gap in reversing established resistance, then stating the specific objective to use CRISPR-Cas9 to target resistance genes",
-			"common_mistakes": "Too long/short, failing to justify importance, unclear research question, excessive literature review"
-		},
-		"Methods": {
-			"purpose": "Describe how the research was conducted with enough detail for replication",
-			"tips": "Use subheadings, provide specific details of materials, procedures, and analyses",
-			"example": "Detailed sections on bacterial strain selection, CRISPR-Cas9 construct design, bacteriophage vector preparation, transfection protocols, and statistical analysis approaches",
-			"common_mistakes": "Insufficient detail for replication, excessive detail on standard procedures, poor organization, omitting statistical methods"
-		},
-		"Results": {
-			"purpose": "Present findings without interpretation",
-			"tips": "Use clear figures and tables, highlight key findings, organize logically",
-			"example": "Presenting editing efficiency data, antibiotic susceptibility testing results, and in vivo efficacy findings with appropriate statistical analyses and clear figures",
-			"common_mistakes": "Interpreting results (save for discussion), presenting raw data without analysis, poor figure design, redundant presentation"
-		},
-		"Discussion": {
-			"purpose": "Interpret results, place in context, address limitations, and suggest implications",
-			"tips": "Begin with key findings summary, compare with existing literature, acknowledge limitations, suggest applications",
-			"example": "Interpreting the significance of achieved editing efficiency, comparing with other approaches to combat resistance, discussing delivery challenges, addressing potential for resistance to the CRISPR system itself, and suggesting clinical applications",
-			"common_mistakes": "Simply repeating results, overinterpreting findings, ignoring limitations, making claims beyond the data"
-		},
-		"Conclusion": {
-			"purpose": "Summarize key findings and their importance",
-			"tips": "Brief, impactful, focuses on contribution to the field",
-			"example": "This work demonstrates that CRISPR-Cas9 gene editing can effectively reverse established antibiotic resistance in pathogenic bacteria, offering a potential new approach to address this critical public health challenge.",
-			"common_mistakes": "Introducing new information, being too vague, merely repeating the abstract"
-		},
-		"References": {
-			"purpose": "Acknowledge sources and provide evidence",
-			"tips": "Follow journal-specific format exactly, ensure all citations are included",
-			"example": "Comprehensive list of relevant literature formatted according to journal requirements (e.g., APA, Vancouver, Harvard styles)",
-			"common_mistakes": "Formatting inconsistencies, missing citations, excessive self-citation, outdated sources"
-		}
-	}
-
-	# Create interactive element to explore paper sections
-	selected_section = st.selectbox("Select a paper section to learn more:", list(paper_sections.keys()))
-
-	# Display the details of the selected section
-	section_details = paper_sections[selected_section]
-
-	st.markdown(f"<h3 class='topic-header'>{selected_section}</h3>", unsafe_allow_html=True)
-
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown(f"**Purpose:** {section_details['purpose']}")
-	st.markdown(f"**Tips:** {section_details['tips']}")
-	st.markdown(f"**Example:** {section_details['example']}")
-	st.markdown(f"**Common Mistakes:** {section_details['common_mistakes']}")
-	st.markdown("</div>", unsafe_allow_html=True)
-
-	st.markdown("<h3 class='topic-header'>Writing Style for Academic Papers</h3>", unsafe_allow_html=True)
-
-	col1, col2 = st.columns(2)
-
-	with col1:
+		st.markdown("<h3 class='topic-header'>Standard Paper Structure (IMRaD)</h3>", unsafe_allow_html=True)
+
+		paper_sections = content.PAPER_SECTIONS
+
+		# Create interactive element to explore paper sections
+		selected_section = explorer("Select a paper section to learn more:", selected_page)
+
+		# Display the details of the selected section
+		section_details = paper_sections[selected_section]
+
+		st.markdown(f"<h3 class='topic-header'>{selected_section}</h3>", unsafe_allow_html=True)
+
 		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown(f"**Purpose:** {section_details['purpose']}")
+		st.markdown(f"**Tips:** {section_details['tips']}")
+		st.markdown(f"**Example:** {section_details['example']}")
+		st.markdown(f"**Common Mistakes:** {section_details['common_mistakes']}")
+		st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Check Your Manuscript's Length</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload your manuscript (.docx, .tex, .md or .txt) to see word counts for each section, checked against the 
+    typical length of the publication type you are targeting. Sections are recognised from headings such as 
+    "Introduction", "Materials and Methods" or "Conclusions"; subsection headings count towards their section.
+    """)
+
+		target_pub_type = st.selectbox("Target publication type:", list(content.PUBLICATION_TYPES.keys()))
+		manuscript_file = st.file_uploader("Manuscript", type=['docx', 'tex', 'md', 'txt'], key='manuscript_file')
+		if manuscript_file is not None:
+			try:
+				section_words = artifacts.get_or_create(
+					('section_words', manuscript_file.file_id),
+					lambda: manuscript.count_section_words(manuscript_file, manuscript_file.name))
+			except ValueError as error:
+				st.error(str(error))
+			else:
+				st.dataframe(
+					pd.DataFrame(manuscript.length_report(
+						section_words, content.PUBLICATION_TYPES[target_pub_type]['typical_length'])),
+					hide_index=True, use_container_width=True)
+				if not any(section in section_words for section in manuscript.BODY_SECTIONS):
+					st.warning("No standard section headings were found, so all text was counted as front matter.")
+
+		st.markdown("<h3 class='topic-header'>Score Your Title and Abstract</h3>", unsafe_allow_html=True)
+
 		st.markdown("""
+    Paste a title and abstract to get standard readability scores, the spread of sentence lengths, and the terms
+    a general academic reader is unlikely to know (acronyms and words outside a common-vocabulary list).
+    Lower grade levels and jargon density make an abstract easier to skim for editors and reviewers outside your niche.
+    """)
+
+		draft_title = st.text_input("Title", value=paper_sections['Title']['example'])
+		draft_abstract = st.text_area("Abstract", value=paper_sections['Abstract']['example'], height=200)
+		if draft_abstract.strip():
+			abstract_scores = readability.score_text(draft_abstract)
+			title_scores = readability.score_text(draft_title)
+
+			col1, col2, col3, col4 = st.columns(4)
+			col1.metric("Flesch Reading Ease", f"{abstract_scores['flesch_reading_ease']:.0f}")
+			col2.metric("Grade level (Flesch-Kincaid)", f"{abstract_scores['flesch_kincaid_grade']:.1f}")
+			col3.metric("Gunning Fog", f"{abstract_scores['gunning_fog']:.1f}")
+			col4.metric("Jargon density", f"{abstract_scores['jargon_density']:.0%}")
+			st.caption(
+				f"Abstract: {abstract_scores['words']} words in {abstract_scores['sentences']} sentences "
+				f"(SMOG {abstract_scores['smog']:.1f}, Coleman-Liau {abstract_scores['coleman_liau']:.1f}). "
+				f"Title: {title_scores['words']} words, jargon density {title_scores['jargon_density']:.0%}.")
+
+			col1, col2 = st.columns(2)
+			with col1:
+				show_chart(
+					charts.chart_image('sentence_length', charts.COLUMN_WIDTH, tuple(abstract_scores['sentence_lengths'])),
+					"Sentence lengths")
+			with col2:
+				jargon_terms = {**title_scores['jargon_terms']}
+				for term, count in abstract_scores['jargon_terms'].items():
+					jargon_terms[term] = jargon_terms.get(term, 0) + count
+				if jargon_terms:
+					st.markdown("**Specialist terms to define or simplify**")
+					st.dataframe(
+						pd.DataFrame(sorted(jargon_terms.items(), key=lambda item: -item[1]), columns=['term', 'count']),
+						hide_index=True, use_container_width=True)
+				else:
+					st.success("No specialist terms found.")
+
+		with st.expander("Score many abstracts at once"):
+			st.markdown("Upload a CSV with an `abstract` column (and optionally `title`) to score every row.")
+			abstracts_file = st.file_uploader("Abstracts", type=['csv'], key='readability_batch')
+			if abstracts_file is not None:
+				abstracts = pd.read_csv(abstracts_file)
+				abstracts.columns = [column.strip().lower() for column in abstracts.columns]
+				if 'abstract' not in abstracts:
+					st.error("The file needs an `abstract` column.")
+				else:
+					batch_scores = readability.score_texts(abstracts['abstract'].tolist())
+					if 'title' in abstracts:
+						batch_scores.insert(0, 'title', abstracts['title'].to_numpy())
+						batch_scores.insert(1, 'title_jargon_density', readability.score_texts(abstracts['title'].tolist())['jargon_density'])
+					st.dataframe(batch_scores, use_container_width=True)
+					st.download_button(
+						"Download scores", batch_scores.to_csv(index=False).encode('utf-8'), 'readability_scores.csv', 'text/csv')
+
+		st.markdown("<h3 class='topic-header'>Check Your Reference List</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload a reference library exported from your reference manager (BibTeX .bib or RIS .ris) or a plain-text 
+    reference list (.txt, one reference per line or numbered). Entries are checked for duplicates (same DOI, the same 
+    normalised title, author and year, or near-identical titles) and for malformed DOIs, ISSNs and years.
+    """)
+
+		reference_file = st.file_uploader("Reference list", type=['bib', 'bibtex', 'ris', 'txt'], key='reference_file')
+		if reference_file is not None:
+			progress = st.progress(0.0, text="Reading references...")
+			try:
+				library = artifacts.get_or_create(('references', reference_file.file_id), lambda: references.check_references(
+					reference_file, reference_file.name,
+					progress=lambda entries: progress.progress(
+						min(reference_file.tell() / max(reference_file.size, 1), 1.0), text=f"{entries:,} entries checked")))
+			except ValueError as error:
+				progress.empty()
+				st.error(str(error))
+			else:
+				progress.empty()
+				reference_table = library.table()
+				duplicates = reference_table[reference_table['duplicate_of'].notna()]
+				flagged = reference_table[reference_table['problems'] != '']
+
+				col1, col2, col3 = st.columns(3)
+				col1.metric("Entries", f"{len(reference_table):,}")
+				col2.metric("Duplicates", f"{len(duplicates):,}")
+				col3.metric("Entries with problems", f"{len(flagged):,}")
+
+				if len(duplicates):
+					st.markdown("**Duplicates** (each entry points to the first occurrence it repeats)")
+					st.dataframe(
+						duplicates[['entry', 'duplicate_of', 'match', 'similarity', 'key', 'first_author', 'year', 'title']],
+						hide_index=True, use_container_width=True)
+				if len(flagged):
+					st.markdown("**Problems**")
+					st.dataframe(
+						flagged[['entry', 'key', 'first_author', 'year', 'title', 'doi', 'issn', 'problems']],
+						hide_index=True, use_container_width=True)
+				st.download_button(
+					"Download full report", reference_table.to_csv(index=False).encode('utf-8'), 'reference_check.csv', 'text/csv')
+
+		st.markdown("<h3 class='topic-header'>Writing Style for Academic Papers</h3>", unsafe_allow_html=True)
+
+		col1, col2 = st.columns(2)
+
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Clarity and Precision**
         - Use precise, specific language
         - Define all technical terms and abbreviations
         - One idea per paragraph with clear topic sentences
         - Use simple sentence structures for complex ideas
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Objectivity**
         - Use passive voice judiciously (not exclusively)
         - Avoid emotional or subjective language
         - Support claims with evidence
         - Distinguish between facts and interpretations
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Conciseness**
         - Eliminate unnecessary words and redundancies
         - Use specific nouns rather than vague descriptions
         - Choose direct verbs ("shows" instead of "is showing")
         - Break up long sentences into shorter ones
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Flow and Cohesion**
         - Use transition words between ideas
         - Create logical progression between paragraphs
         - Link sentences with connecting words
         - Maintain consistent terminology throughout
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Tables and Figures</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Tables and Figures</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Effective Figures**
     - Should be self-explanatory with comprehensive captions
     - Use high resolution (300+ dpi) for publication
@@ -1105,9 +1288,9 @@ elif selected_page == "Writing Your Research Paper":
     - Follow journal guidelines for placement
     """)
 
-	st.markdown("<h3 class='topic-header'>Ethical Considerations in Writing</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Ethical Considerations in Writing</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Authorship**
     - Include all who made substantial contributions
     - Determine order according to field conventions and contribution
@@ -1127,9 +1310,9 @@ elif selected_page == "Writing Your Research Paper":
     - Maintain raw data for potential verification
     """)
 
-	st.markdown("<h3 class='topic-header'>Practical Writing Tips</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Practical Writing Tips</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Before Writing**
     - Create a detailed outline
     - Identify target journal and review its requirements
@@ -1150,26 +1333,28 @@ elif selected_page == "Writing Your Research Paper":
     - Verify all references are accurate and formatted correctly
     """)
 
-	st.info("""
+		st.info("""
     **Pro Tip:** Write regularly in shorter sessions rather than in marathon sessions. Research shows that consistent writing 
     (e.g., 1-2 hours daily) is more productive than occasional long sessions.
     """)
 
-elif selected_page == "Submission & Peer Review":
-	st.markdown("<h1 class='main-header'>Submission & Peer Review Process</h1>", unsafe_allow_html=True)
+	elif selected_page == "Submission & Peer Review":
+		from publishing_guide import assets, manuscript, revisions
+
+		st.markdown("<h1 class='main-header'>Submission & Peer Review Process</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     The submission and peer review process is critical to academic publishing. Understanding how it works 
     will help you navigate this phase successfully and respond effectively to reviewer feedback.
     """)
 
-	st.markdown("<h3 class='topic-header'>Preparing for Submission</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Preparing for Submission</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Final Manuscript Checklist**
         - All authors have approved final version
         - Manuscript follows journal formatting guidelines
@@ -1178,11 +1363,11 @@ elif selected_page == "Submission & Peer Review":
         - Word count, abstract length meet requirements
         - Supplementary materials are prepared if needed
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Required Submission Documents**
         - Cover letter
         - Main manuscript file
@@ -1193,16 +1378,16 @@ elif selected_page == "Submission & Peer Review":
         - Author contribution statements
         - Data availability statements
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Writing an Effective Cover Letter</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Writing an Effective Cover Letter</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     A well-crafted cover letter can influence editors' initial impression of your manuscript.
     """)
 
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown("""
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown("""
     **Cover Letter Components**
 
     1. **Journal information**: Editor's name, journal name, date
@@ -1217,9 +1402,9 @@ elif selected_page == "Submission & Peer Review":
     7. **Suggested reviewers**: Names and contacts of potential reviewers (if requested)
     8. **Closing**: Polite conclusion and contact information
     """)
-	st.markdown("</div>", unsafe_allow_html=True)
+		st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Cover Letter Example:**
 
     ```
@@ -1254,9 +1439,9 @@ elif selected_page == "Submission & Peer Review":
     ```
     """)
 
-	st.markdown("<h3 class='topic-header'>The Peer Review Process</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>The Peer Review Process</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Typical Workflow**
 
     1. **Submission**: You submit manuscript through journal's online system
@@ -1270,85 +1455,45 @@ elif selected_page == "Submission & Peer Review":
     9. **Re-evaluation**: Editor/reviewers assess revisions
     10. **Final decision**: Accept, further revisions, or reject
     """)
+		st.markdown(
+			assets.picture_html('peer_review_workflow', "Peer review workflow diagram", shared.asset_manifest()),
+			unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Types of Peer Review</h3>", unsafe_allow_html=True)
+
+		peer_review_types = content.PEER_REVIEW_TYPES
+
+		# Create interactive element to explore peer review types
+		selected_review_type = explorer("Select a peer review type to learn more:", selected_page)
+
+		# Display the details of the selected peer review type
+		review_type_details = peer_review_types[selected_review_type]
+
+		st.markdown(f"<h4>{selected_review_type}</h4>", unsafe_allow_html=True)
+
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown(f"**Description:** {review_type_details['description']}")
+		st.markdown(f"**Advantages:** {review_type_details['advantages']}")
+		st.markdown(f"**Disadvantages:** {review_type_details['disadvantages']}")
+		st.markdown(f"**Common in:** {review_type_details['common in']}")
+		st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Understanding Editorial Decisions</h3>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Types of Peer Review</h3>", unsafe_allow_html=True)
-
-	peer_review_types = {
-		"Single-blind": {
-			"description": "Reviewers know authors' identities, but authors don't know reviewers",
-			"advantages": "Reviewers can assess based on authors' previous work and reputation",
-			"disadvantages": "Potential bias based on author's institution, nationality, or reputation",
-			"common in": "Many traditional journals across disciplines"
-		},
-		"Double-blind": {
-			"description": "Neither reviewers nor authors know each other's identities",
-			"advantages": "Reduces potential bias based on author characteristics",
-			"disadvantages": "Authors can sometimes be identified by self-citations or specific methods",
-			"common in": "Social sciences, humanities, some medical journals"
-		},
-		"Open peer review": {
-			"description": "Reviewer and author identities are disclosed to each other",
-			"advantages": "Transparency, accountability, potential for more constructive feedback",
-			"disadvantages": "Junior reviewers may be hesitant to criticize senior authors",
-			"common in": "BMJ, BioMed Central journals, growing trend in scientific publishing"
-		},
-		"Transparent peer review": {
-			"description": "Review reports are published alongside the article (with or without reviewer names)",
-			"advantages": "Shows the development of the paper, allows evaluation of review quality",
-			"disadvantages": "May make reviewers more cautious in their critiques",
-			"common in": "Nature Communications, EMBO journals, PeerJ"
-		},
-		"Collaborative peer review": {
-			"description": "Reviewers interact with each other, sometimes with authors, during the review process",
-			"advantages": "Allows discussion and consensus-building among reviewers",
-			"disadvantages": "More time-consuming, potential for dominant personalities to influence",
-			"common in": "eLife, F1000Research"
-		},
-		"Post-publication peer review": {
-			"description": "Articles are published first, then openly reviewed and discussed",
-			"advantages": "Rapid publication, community involvement in evaluation",
-			"disadvantages": "Potential damage if significant flaws discovered after publication",
-			"common in": "F1000Research, ScienceOpen, PubPeer comments"
-		}
-	}
-
-	# Create interactive element to explore peer review types
-	selected_review_type = st.selectbox("Select a peer review type to learn more:", list(peer_review_types.keys()))
-
-	# Display the details of the selected peer review type
-	review_type_details = peer_review_types[selected_review_type]
-
-	st.markdown(f"<h4>{selected_review_type}</h4>", unsafe_allow_html=True)
-
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown(f"**Description:** {review_type_details['description']}")
-	st.markdown(f"**Advantages:** {review_type_details['advantages']}")
-	st.markdown(f"**Disadvantages:** {review_type_details['disadvantages']}")
-	st.markdown(f"**Common in:** {review_type_details['common in']}")
-	st.markdown("</div>", unsafe_allow_html=True)
-
-	st.markdown("<h3 class='topic-header'>Understanding Editorial Decisions</h3>", unsafe_allow_html=True)
-
-	decisions = {
-		"Accept": "Paper is accepted as is or with minimal copyediting changes. Very rare for first submissions.",
-		"Minor Revisions": "Paper is provisionally accepted pending small changes. Typically doesn't require full re-review.",
-		"Major Revisions": "Substantial changes needed but editors see potential. Will require thorough re-review.",
-		"Reject and Resubmit": "Current version rejected but a substantially revised version would be considered as a new submission.",
-		"Reject": "Paper is not suitable for the journal. May be due to quality issues or lack of fit with journal scope."
-	}
-
-	for decision, description in decisions.items():
-		st.markdown(f"**{decision}**: {description}")
-
-	st.markdown("<h3 class='topic-header'>Responding to Reviewer Comments</h3>", unsafe_allow_html=True)
-
-	st.markdown("""
+		decisions = content.EDITORIAL_DECISIONS
+
+		for decision, description in decisions.items():
+			st.markdown(f"**{decision}**: {description}")
+
+		st.markdown("<h3 class='topic-header'>Responding to Reviewer Comments</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
     The response to reviewers is a critical document that can determine whether your revised manuscript is accepted. 
     A well-structured response demonstrates professionalism and thoroughness.
     """)
 
-	st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-	st.markdown("""
+		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+		st.markdown("""
     **Effective Response Strategy**
 
     1. **Be comprehensive**: Address every single comment
@@ -1378,11 +1523,49 @@ elif selected_page == "Submission & Peer Review":
     [same format]
     ```
     """)
-	st.markdown("</div>", unsafe_allow_html=True)
+		st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Dealing with Rejection</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Map Your Revisions</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
+    Upload the submitted and the revised versions of your manuscript to list every added, removed, moved and revised 
+    paragraph, with the changed sentences and their location by section. The change map can be pasted into your 
+    response letter so reviewers can find each change quickly.
+    """)
+
+		col1, col2 = st.columns(2)
+		with col1:
+			original_file = st.file_uploader("Submitted version", type=['docx', 'tex', 'md', 'txt'], key='revision_original')
+		with col2:
+			revised_file = st.file_uploader("Revised version", type=['docx', 'tex', 'md', 'txt'], key='revision_revised')
+
+		if original_file is not None and revised_file is not None:
+			if 'revision_diff' not in st.session_state:
+				st.session_state['revision_diff'] = revisions.RevisionDiff()
+			try:
+				original_paragraphs = artifacts.get_or_create(
+					('paragraphs', original_file.file_id), lambda: manuscript.extract_paragraphs(original_file, original_file.name))
+				revised_paragraphs = artifacts.get_or_create(
+					('paragraphs', revised_file.file_id), lambda: manuscript.extract_paragraphs(revised_file, revised_file.name))
+			except ValueError as error:
+				st.error(str(error))
+			else:
+				revision_changes = st.session_state['revision_diff'].compare(original_paragraphs, revised_paragraphs)
+				if not revision_changes:
+					st.info("The two versions have the same text.")
+				else:
+					counts = revisions.summary(revision_changes)
+					columns = st.columns(4)
+					for column, kind in zip(columns, ['revised', 'added', 'deleted', 'moved']):
+						column.metric(kind.capitalize(), counts.get(kind, 0))
+					revision_map = revisions.change_map(revision_changes)
+					with st.expander("Change map", expanded=True):
+						st.markdown(revision_map)
+					st.download_button("Download change map", revision_map.encode('utf-8'), 'change_map.md', 'text/markdown')
+
+		st.markdown("<h3 class='topic-header'>Dealing with Rejection</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
     Rejection is a normal part of academic publishing that even established researchers experience regularly.
 
     **When Your Paper is Rejected:**
@@ -1403,29 +1586,29 @@ elif selected_page == "Submission & Peer Review":
     - Choose an appropriate journal based on feedback about scope or significance
     """)
 
-	st.success("""
+		st.success("""
     **Pro Tip:** Many successful papers were rejected from their first-choice journals. A study of high-impact papers 
     found that approximately 75% had been rejected at least once before finding the right home.
     """)
 
-elif selected_page == "Predatory Journals: Warning Signs":
-	st.markdown("<h1 class='main-header'>Predatory Journals: Warning Signs</h1>", unsafe_allow_html=True)
+	elif selected_page == "Predatory Journals: Warning Signs":
+		st.markdown("<h1 class='main-header'>Predatory Journals: Warning Signs</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Predatory journals exploit the academic publishing model by charging publication fees without providing legitimate 
     peer review, editorial services, or proper indexing. Identifying and avoiding these journals is essential for 
     protecting your research and reputation.
     """)
 
-	st.warning("""
+		st.warning("""
     **Important:** Publishing in predatory journals can damage your academic reputation, waste research funds, 
     and prevent your work from reaching its intended audience. These publications may appear legitimate at first glance, 
     so careful evaluation is necessary.
     """)
 
-	st.markdown("<h3 class='topic-header'>What Are Predatory Journals?</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>What Are Predatory Journals?</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Predatory journals are publications that prioritize profit over scholarly integrity by:
 
     - Charging article processing fees without providing proper editorial services
@@ -1438,82 +1621,29 @@ elif selected_page == "Predatory Journals: Warning Signs":
     those under publication pressure, or researchers from regions with less publishing experience.
     """)
 
-	st.markdown("<h3 class='topic-header'>Red Flags and Warning Signs</h3>", unsafe_allow_html=True)
-
-	warning_categories = [
-		"Communication and Solicitation",
-		"Website and Presentation",
-		"Editorial Board and Peer Review",
-		"Publication Metrics and Indexing",
-		"Fees and Transparency",
-		"Content and Quality"
-	]
-
-	warning_signs = {
-		"Communication and Solicitation": [
-			"Unsolicited emails with effusive praise for your previous work",
-			"Promises of rapid peer review (e.g., 'decision in 1 week')",
-			"Invitations to submit to journals outside your field of expertise",
-			"Poor grammar and spelling in communications",
-			"Overly flattering or personal tone in solicitation emails"
-		],
-		"Website and Presentation": [
-			"Poorly designed, unprofessional website with broken links",
-			"Spelling and grammatical errors throughout the site",
-			"Mixing different scientific fields without clear sections",
-			"Missing or vague contact information (e.g., no physical address)",
-			"Journal name mimicking a well-established journal",
-			"Use of terms like 'International', 'Global', or 'World' to seem legitimate"
-		],
-		"Editorial Board and Peer Review": [
-			"Editorial board members not listed or with no affiliations",
-			"Board members listed without their knowledge or permission",
-			"No information about the peer review process",
-			"Extremely brief peer review timeframes (days rather than weeks)",
-			"Single person serving as editor for multiple journals",
-			"No expertise in the field evident among editors"
-		],
-		"Publication Metrics and Indexing": [
-			"False claims about impact factor or invented metrics",
-			"Claims of indexing in major databases that cannot be verified",
-			'Using misleading metrics (e.g., "Journal Impact Factor" instead of official "Impact Factor")',
-			"Claiming to be indexed in Google Scholar (which isn't a selective index)",
-			"Falsely claiming to be included in Web of Science or Scopus"
-		],
-		"Fees and Transparency": [
-			"Hidden fees revealed only after acceptance",
-			"Unclear information about APCs on the website",
-			"No clear policies on copyright and licensing",
-			"Absence of retraction, correction, or ethics policies",
-			"No information about digital preservation"
-		],
-		"Content and Quality": [
-			"Previously published papers with minimal editing",
-			"Articles on topics outside the journal's stated scope",
-			"Obvious lack of copyediting in published articles",
-			"Low-quality figures and tables in published papers",
-			"Extremely short or extremely long articles without justification",
-			"Papers accepted without revisions despite obvious flaws"
-		]
-	}
-
-	# Create tabs for different categories of warning signs
-	tabs = st.tabs(warning_categories)
-
-	for i, tab in enumerate(tabs):
-		category = warning_categories[i]
-		with tab:
-			st.subheader(category)
-			for warning in warning_signs[category]:
-				st.markdown(f"🚩 {warning}")
-
-	st.markdown("<h3 class='topic-header'>How to Verify Journal Legitimacy</h3>", unsafe_allow_html=True)
-
-	col1, col2 = st.columns(2)
-
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		st.markdown("<h3 class='topic-header'>Red Flags and Warning Signs</h3>", unsafe_allow_html=True)
+
+		warning_categories = content.WARNING_CATEGORIES
+
+		warning_signs = content.WARNING_SIGNS
+
+		# Create tabs for different categories of warning signs
+		tabs = st.tabs(warning_categories)
+
+		for i, tab in enumerate(tabs):
+			category = warning_categories[i]
+			with tab:
+				st.subheader(category)
+				for warning in warning_signs[category]:
+					st.markdown(f"🚩 {warning}")
+
+		st.markdown("<h3 class='topic-header'>How to Verify Journal Legitimacy</h3>", unsafe_allow_html=True)
+
+		col1, col2 = st.columns(2)
+
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Check Established Lists and Directories**
 
         **Inclusion in these sources is a positive sign:**
@@ -1526,11 +1656,11 @@ elif selected_page == "Predatory Journals: Warning Signs":
         - Beall's List (archive versions still available)
         - Cabell's Predatory Reports (subscription required)
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Evaluate Publisher Reputation**
 
         **Reputable publishers typically include:**
@@ -1543,9 +1673,9 @@ elif selected_page == "Predatory Journals: Warning Signs":
         - Open Access Scholarly Publishers Association (OASPA) membership
         - Committee on Publication Ethics (COPE) membership
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Additional Verification Steps**
 
     1. **Search for the journal's articles** in major academic databases
@@ -1556,9 +1686,9 @@ elif selected_page == "Predatory Journals: Warning Signs":
     6. **Use the Think. Check. Submit.** checklist (thinkchecksubmit.org)
     """)
 
-	st.markdown("<h3 class='topic-header'>What If You've Already Submitted?</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>What If You've Already Submitted?</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     If you realize you've submitted to a potentially predatory journal:
 
     1. **Request immediate withdrawal** of your manuscript
@@ -1569,9 +1699,9 @@ elif selected_page == "Predatory Journals: Warning Signs":
     6. **Report the journal** to relevant authorities and warning lists
     """)
 
-	st.markdown("<h3 class='topic-header'>Hijacked Journals and Conferences</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Hijacked Journals and Conferences</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Be aware of these sophisticated predatory tactics:
 
     **Journal Hijacking**
@@ -1587,7 +1717,7 @@ elif selected_page == "Predatory Journals: Warning Signs":
     - Verify conference legitimacy through professional societies in your field
     """)
 
-	st.success("""
+		st.success("""
     **Pro Tip:** Use the "PLAN" approach to evaluate journals:
     - **P**resence: Check for physical address, clear contact information, and proper registration
     - **L**egitimacy: Verify indexing claims and editorial board members
@@ -1595,17 +1725,19 @@ elif selected_page == "Predatory Journals: Warning Signs":
     - **N**avigation: Evaluate website professionalism and transparency
     """)
 
-elif selected_page == "Publishing Ethics":
-	st.markdown("<h1 class='main-header'>Publishing Ethics</h1>", unsafe_allow_html=True)
+	elif selected_page == "Publishing Ethics":
+		from publishing_guide import authorship, manuscript, overlap
+
+		st.markdown("<h1 class='main-header'>Publishing Ethics</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Ethical considerations are fundamental to maintaining the integrity of scientific literature. Understanding and 
     adhering to ethical standards is essential for all researchers throughout the publication process.
     """)
 
-	st.markdown("<h3 class='topic-header'>Authorship Ethics</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Authorship Ethics</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Who Qualifies as an Author?**
 
     According to the International Committee of Medical Journal Editors (ICMJE), authorship should be based on the following criteria:
@@ -1618,11 +1750,11 @@ elif selected_page == "Publishing Ethics":
     All individuals who meet these criteria should be authors; those who don't meet all criteria should be acknowledged instead.
     """)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Authorship Malpractices to Avoid**
 
         **Ghost authorship:** Omitting contributors who qualify as authors
@@ -1633,11 +1765,11 @@ elif selected_page == "Publishing Ethics":
 
         **Coercive authorship:** Supervisors demanding authorship without meeting criteria
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Best Practices for Authorship**
 
         **Discuss authorship early:** Establish expectations at project start
@@ -1648,11 +1780,66 @@ elif selected_page == "Publishing Ethics":
 
         **Use CRediT taxonomy:** Consider using Contributor Roles Taxonomy
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Validate an Authorship Matrix</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    For multi-author and consortium papers, upload a contribution matrix (CSV) with one row per person, an `author` 
+    column, an optional `listed` column (yes/no for the byline) and one column per role marked with any non-blank 
+    value. A long format with `author` and `role` columns also works. CRediT roles are recognised automatically; 
+    other roles are classified by keywords in their name (columns matching none are skipped) and can be reassigned 
+    below. Include columns such as "Approved final version" 
+    and "Agrees to be accountable" to check all four ICMJE criteria.
+    """)
 
-	st.markdown("<h3 class='topic-header'>Plagiarism and Self-Plagiarism</h3>", unsafe_allow_html=True)
+		matrix_file = st.file_uploader("Contribution matrix", type=['csv'], key='authorship_matrix')
+		if matrix_file is not None:
+			try:
+				contributions = authorship.ContributionMatrix.read_csv(matrix_file)
+			except (ValueError, pd.errors.ParserError) as error:
+				st.error(str(error))
+			else:
+				if contributions.unrecognised:
+					st.info("Not recognised as roles, so left out: " + ", ".join(contributions.unrecognised))
+				with st.expander(f"Role classification ({len(contributions.roles)} roles)"):
+					role_categories = st.data_editor(
+						authorship.role_table(contributions), hide_index=True, use_container_width=True,
+						disabled=['role', 'authors', 'share'], key='authorship_roles',
+						column_config={'category': st.column_config.SelectboxColumn('category', options=authorship.CATEGORIES)})
+				role_assignment = dict(zip(role_categories['role'], role_categories['category']))
+				author_report, role_report, profiles, coverage = authorship.validate(contributions, role_assignment)
+
+				st.markdown("**Share of listed authors meeting each ICMJE criterion**")
+				columns = st.columns(len(coverage))
+				for column, (criterion, share) in zip(columns, coverage.items()):
+					column.metric(criterion.capitalize(), f"{share:.0%}")
+
+				flagged_authors = author_report[author_report['flags'] != '']
+				st.markdown(f"**{len(flagged_authors):,} of {len(author_report):,} people flagged**")
+				st.dataframe(flagged_authors[['author', 'listed', 'roles', 'flags']], hide_index=True, use_container_width=True)
+
+				blanket_roles = role_report[(role_report['share'] == 1) & (role_report['authors'] >= 10)]
+				if len(blanket_roles):
+					st.warning("Held by every person, which suggests bulk assignment: " + ", ".join(blanket_roles['role']))
+				if len(profiles):
+					st.markdown("**Largest groups with identical role profiles** (often roles assigned in bulk)")
+					st.dataframe(profiles, hide_index=True, use_container_width=True)
+
+				# The exports are written only once asked for, spooled to disk past a few MB and closed
+				# as soon as Streamlit has taken their bytes
+				if st.checkbox("Prepare the full report and CRediT statement for download", key='authorship_exports'):
+					col1, col2 = st.columns(2)
+					with col1, tempfile.SpooledTemporaryFile(max_size=8 * 2 ** 20) as report_file:
+						authorship.write_stream(authorship.iter_csv(author_report), report_file).seek(0)
+						st.download_button("Download full report (CSV)", report_file, 'authorship_report.csv', 'text/csv')
+					with col2, tempfile.SpooledTemporaryFile(max_size=8 * 2 ** 20) as statement_file:
+						authorship.write_stream(authorship.iter_credit_statement(contributions, role_assignment), statement_file).seek(0)
+						st.download_button("Download CRediT statement", statement_file, 'credit_statement.txt', 'text/plain')
+
+		st.markdown("<h3 class='topic-header'>Plagiarism and Self-Plagiarism</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Types of Plagiarism**
 
     **Direct plagiarism:** Copying text verbatim without attribution
@@ -1666,7 +1853,7 @@ elif selected_page == "Publishing Ethics":
     **Text recycling:** Reusing portions of your previous writing in a new manuscript
     """)
 
-	st.markdown("""
+		st.markdown("""
     **Avoiding Plagiarism**
 
     1. **Cite all sources** of data, ideas, and language
@@ -1676,13 +1863,65 @@ elif selected_page == "Publishing Ethics":
     5. **Cite your own previous work** when building upon it
     """)
 
-	st.markdown("<h3 class='topic-header'>Research Integrity and Data Ethics</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Check for Overlap with Previous Papers</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
-
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
 		st.markdown("""
+    Compare a manuscript against a local index of your own or your institution's previous papers to catch text 
+    recycling and duplicate publication before an editor does. Papers are indexed by their overlapping five-word 
+    sequences, so reordered or lightly edited passages are still found. Large collections can be indexed from the 
+    command line with `python -m publishing_guide.overlap <folder>`.
+    """)
+
+		overlap_index = load_overlap_index(overlap.DEFAULT_INDEX_PATH)
+
+		with st.expander(f"Previous papers in the index ({len(overlap_index):,})"):
+			previous_papers = st.file_uploader(
+				"Add previous papers", type=['docx', 'tex', 'md', 'txt'], accept_multiple_files=True, key='overlap_corpus')
+			# Each upload is extracted and indexed once per session, not on every rerun of the page
+			indexed_papers = st.session_state.setdefault('overlap_indexed', set())
+			new_papers = [paper for paper in previous_papers or [] if paper.file_id not in indexed_papers]
+			if new_papers:
+				documents = []
+				for paper in new_papers:
+					try:
+						documents.append((paper.name, manuscript.extract_text(paper, paper.name)))
+					except ValueError as error:
+						st.error(str(error))
+					indexed_papers.add(paper.file_id)
+				added = overlap_index.add_documents(documents)
+				st.caption(f"{added} new or changed paper(s) indexed; {len(overlap_index):,} papers in total.")
+
+		overlap_file = st.file_uploader("Manuscript to check", type=['docx', 'tex', 'md', 'txt'], key='overlap_manuscript')
+		if overlap_file is not None:
+			try:
+				manuscript_text = artifacts.get_or_create(
+					('text', overlap_file.file_id), lambda: manuscript.extract_text(overlap_file, overlap_file.name))
+			except ValueError as error:
+				st.error(str(error))
+			else:
+				matches = overlap_index.check(manuscript_text, exclude=overlap_file.name)
+				if matches.empty:
+					st.success("No substantial overlap with the indexed papers.")
+				else:
+					st.dataframe(
+						matches[['document', 'words', 'containment', 'jaccard']].style.format(
+							{'containment': '{:.0%}', 'jaccard': '{:.0%}'}),
+						hide_index=True, use_container_width=True)
+					st.caption("Containment: share of your manuscript's text that also appears in the paper.")
+					for name in matches['document'].head(5):
+						passages = overlap_index.passages(manuscript_text, name)
+						if passages:
+							with st.expander(f"Passages shared with {name} ({len(passages)})"):
+								for passage in passages:
+									st.markdown(f"> {passage}")
+
+		st.markdown("<h3 class='topic-header'>Research Integrity and Data Ethics</h3>", unsafe_allow_html=True)
+
+		col1, col2 = st.columns(2)
+
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Data Fabrication and Falsification**
 
         **Fabrication:** Inventing data or results
@@ -1693,11 +1932,11 @@ elif selected_page == "Publishing Ethics":
 
         **Cherry-picking:** Selectively reporting only favorable data
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Responsible Data Practices**
 
         **Data availability:** Share underlying data when possible
@@ -1708,15 +1947,15 @@ elif selected_page == "Publishing Ethics":
 
         **Proper statistical analysis:** Use appropriate tests and avoid p-hacking
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Conflicts of Interest</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Conflicts of Interest</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     A conflict of interest exists when professional judgment concerning a primary interest may be influenced by a secondary interest.
     """)
 
-	st.markdown("""
+		st.markdown("""
     **Types of Conflicts**
 
     **Financial conflicts:**
@@ -1732,7 +1971,7 @@ elif selected_page == "Publishing Ethics":
     - Institutional affiliations affecting objectivity
     """)
 
-	st.markdown("""
+		st.markdown("""
     **Managing Conflicts of Interest**
 
     1. **Disclose all potential conflicts** in your manuscript
@@ -1742,13 +1981,13 @@ elif selected_page == "Publishing Ethics":
     5. **Consider recusing yourself** from certain research roles if conflicts are significant
     """)
 
-	st.markdown("<h3 class='topic-header'>Publication Ethics in Peer Review</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Publication Ethics in Peer Review</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Ethical Issues for Reviewers**
 
         **Confidentiality:** Not sharing manuscripts under review
@@ -1761,11 +2000,11 @@ elif selected_page == "Publishing Ethics":
 
         **Constructive criticism:** Providing helpful, respectful feedback
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Ethical Issues for Authors**
 
         **Simultaneous submission:** Not submitting to multiple journals simultaneously
@@ -1778,11 +2017,11 @@ elif selected_page == "Publishing Ethics":
 
         **Reviewer suggestions:** Not suggesting reviewers with conflicts
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Research Ethics and Participant Protection</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Research Ethics and Participant Protection</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Human Subjects Research**
 
     1. **Ethics committee approval:** Document IRB/Ethics Committee approval
@@ -1799,9 +2038,9 @@ elif selected_page == "Publishing Ethics":
     4. **Reporting standards:** Follow ARRIVE guidelines
     """)
 
-	st.markdown("<h3 class='topic-header'>Addressing Ethical Breaches</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Addressing Ethical Breaches</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Post-Publication Issues**
 
     **Corrections:** Published to address minor errors that don't invalidate results
@@ -1813,7 +2052,7 @@ elif selected_page == "Publishing Ethics":
     **Reporting concerns:** Anyone can report potential ethical issues to journals
     """)
 
-	st.markdown("""
+		st.markdown("""
     **Resources for Publication Ethics**
 
     - **Committee on Publication Ethics (COPE):** Guidelines and flowcharts
@@ -1823,24 +2062,26 @@ elif selected_page == "Publishing Ethics":
     - **Institution Research Integrity Offices:** Local guidance and support
     """)
 
-	st.info("""
+		st.info("""
     **Pro Tip:** When facing an ethical dilemma in publishing, consult your institution's research 
     integrity office or ethics committee for guidance. Being proactive about ethics questions is 
     always better than addressing problems after publication.
     """)
 
-elif selected_page == "After Publication: Promotion & Impact":
-	st.markdown("<h1 class='main-header'>After Publication: Promotion & Impact</h1>", unsafe_allow_html=True)
+	elif selected_page == "After Publication: Promotion & Impact":
+		from publishing_guide import altmetrics, charts, citations, keywords
+
+		st.markdown("<h1 class='main-header'>After Publication: Promotion & Impact</h1>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     Publication is not the end of the research process—it's the beginning of your work's journey into the scientific 
     community. Actively promoting your research can significantly increase its visibility, readership, citations, 
     and real-world impact.
     """)
 
-	st.markdown("<h3 class='topic-header'>Why Promote Your Research?</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Why Promote Your Research?</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Benefits of Research Promotion**
 
     1. **Increased readership and citations:** More readers typically leads to more citations
@@ -1851,21 +2092,21 @@ elif selected_page == "After Publication: Promotion & Impact":
     6. **Funder requirements:** Meet dissemination obligations
     """)
 
-	st.markdown("<h3 class='topic-header'>Promotion Strategies</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Promotion Strategies</h3>", unsafe_allow_html=True)
 
-	promotion_tabs = st.tabs([
-		"Academic Channels",
-		"Digital Promotion",
-		"Media Engagement",
-		"Conferences & Events",
-		"Institutional Resources"
-	])
+		promotion_tabs = st.tabs([
+			"Academic Channels",
+			"Digital Promotion",
+			"Media Engagement",
+			"Conferences & Events",
+			"Institutional Resources"
+		])
 
-	with promotion_tabs[0]:
-		st.subheader("Academic Channels")
+		with promotion_tabs[0]:
+			st.subheader("Academic Channels")
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Academic Social Networks**
 
         - **ResearchGate & Academia.edu:** Upload papers, track metrics, connect with colleagues
@@ -1879,10 +2120,10 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Respond to questions and comments
         - Follow relevant researchers in your field
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Repositories and Preprint Servers**
 
         - **Institutional repositories:** Archive in your university's system
@@ -1896,13 +2137,48 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Tag with appropriate keywords for discoverability
         - Include all supplementary materials and data
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with promotion_tabs[1]:
-		st.subheader("Digital Promotion")
-
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("**Suggest Keywords for Your Paper**")
+			st.markdown("""
+        Keywords and repository tags are how readers and search engines find your work. Paste your abstract to get 
+        suggested indexing terms: phrases that are frequent in your text but uncommon in general academic writing.
+        """)
+			keyword_table = load_keyword_table(keywords.DEFAULT_TABLE_DIR)
+			keyword_title = st.text_input("Paper title", key='keyword_title')
+			keyword_abstract = st.text_area("Abstract", key='keyword_abstract', height=150)
+			if keyword_abstract.strip():
+				suggestions = keywords.extract(keyword_abstract, keyword_table, title=keyword_title, k=10)
+				if suggestions:
+					st.dataframe(
+						pd.DataFrame(suggestions, columns=['keyword', 'score']), hide_index=True, use_container_width=True)
+				else:
+					st.info("No candidate keywords found in the text.")
+
+			with st.expander("Suggest keywords for a whole publication list"):
+				st.markdown("Upload a CSV with an `abstract` column (and optionally `title`).")
+				publication_list = st.file_uploader("Publication list", type=['csv'], key='keyword_batch')
+				if publication_list is not None:
+					publications = pd.read_csv(publication_list)
+					publications.columns = [column.strip().lower() for column in publications.columns]
+					if 'abstract' not in publications:
+						st.error("The file needs an `abstract` column.")
+					else:
+						with st.spinner(f"Extracting keywords for {len(publications):,} publications..."):
+							publications['suggested_keywords'] = batch_keywords(
+								hashlib.sha1(publication_list.getvalue()).hexdigest(),
+								publications['title'] if 'title' in publications else [''] * len(publications),
+								publications['abstract'])
+						st.dataframe(publications, use_container_width=True)
+						st.download_button(
+							"Download with keywords", publications.to_csv(index=False).encode('utf-8'),
+							'publication_keywords.csv', 'text/csv')
+
+		with promotion_tabs[1]:
+			st.subheader("Digital Promotion")
+
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Social Media Strategies**
 
         - **Twitter/X:** Share key findings with relevant hashtags, tag collaborators
@@ -1917,10 +2193,10 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Tag co-authors, institutions, and funders
         - Time posts for maximum visibility
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Digital Content Creation**
 
         - **Blog posts:** Write detailed, accessible summaries
@@ -1935,13 +2211,13 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Repurpose content across multiple platforms
         - Include clear calls to action (read full paper, contact for collaboration)
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with promotion_tabs[2]:
-		st.subheader("Media Engagement")
+		with promotion_tabs[2]:
+			st.subheader("Media Engagement")
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Working with Institutional Media Relations**
 
         - **Press releases:** Work with PR office on announcements
@@ -1955,10 +2231,10 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Have high-quality images available
         - Be available for interviews after publication
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Direct Media Approaches**
 
         - **The Conversation:** Write articles for this academic-journalist platform
@@ -1973,13 +2249,13 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Respect embargo dates set by journals
         - Maintain scientific accuracy while simplifying
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with promotion_tabs[3]:
-		st.subheader("Conferences & Events")
+		with promotion_tabs[3]:
+			st.subheader("Conferences & Events")
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Conference Presentations**
 
         - **Oral presentations:** Submit abstracts to relevant conferences
@@ -1994,10 +2270,10 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Network actively during the conference
         - Follow up with interested contacts afterward
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Academic and Public Events**
 
         - **Department seminars:** Present at your institution and others
@@ -2011,13 +2287,13 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Collect contact information from interested attendees
         - Follow up with specific audiences for potential collaboration
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with promotion_tabs[4]:
-		st.subheader("Institutional Resources")
+		with promotion_tabs[4]:
+			st.subheader("Institutional Resources")
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **University Support Systems**
 
         - **Research office:** Utilize promotion resources and networks
@@ -2031,10 +2307,10 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Participate in research showcase events
         - Suggest your work for institutional social media
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Funder and Publisher Resources**
 
         - **Publisher promotion:** Work with journal marketing teams
@@ -2048,15 +2324,15 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Tag publishers and funders in social media posts
         - Express interest in being featured in publisher highlights
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	st.markdown("<h3 class='topic-header'>Measuring Research Impact</h3>", unsafe_allow_html=True)
+		st.markdown("<h3 class='topic-header'>Measuring Research Impact</h3>", unsafe_allow_html=True)
 
-	col1, col2 = st.columns(2)
+		col1, col2 = st.columns(2)
 
-	with col1:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col1:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Traditional Metrics**
 
         **Citation counts:** Number of times your paper is cited
@@ -2073,11 +2349,11 @@ elif selected_page == "After Publication: Promotion & Impact":
         - Scopus
         - Dimensions
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
 
-	with col2:
-		st.markdown("<div class='highlight'>", unsafe_allow_html=True)
-		st.markdown("""
+		with col2:
+			st.markdown("<div class='highlight'>", unsafe_allow_html=True)
+			st.markdown("""
         **Alternative Metrics (Altmetrics)**
 
         **Social media mentions:** Twitter, Facebook, etc.
@@ -2094,11 +2370,98 @@ elif selected_page == "After Publication: Promotion & Impact":
         - ImpactStory
         - Journal article pages
         """)
-		st.markdown("</div>", unsafe_allow_html=True)
+			st.markdown("</div>", unsafe_allow_html=True)
+
+		st.markdown("<h3 class='topic-header'>Track Attention to Your Papers</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload attention-event dumps in JSON Lines format (one event per line with a `doi`, a time such as 
+    `occurred_at` or `timestamp`, and optionally a `type` such as mention, share or download, a `source` and a 
+    `count`), for example Crossref Event Data or repository download logs. Events are rolled up per paper and day 
+    in a local store shared by all users. Re-uploading a dump that has grown since only adds the new events, so a 
+    daily refresh takes seconds. Large archives can be loaded from the command line with 
+    `python -m publishing_guide.altmetrics <folder>`.
+    """)
+
+		attention_store = load_altmetrics_store(altmetrics.DEFAULT_STORE_PATH)
+		event_dumps = st.file_uploader(
+			"Event dumps", type=['jsonl', 'ndjson', 'json', 'gz'], accept_multiple_files=True, key='altmetric_dumps')
+		# Each upload is read once per session: the ledger would find nothing new, but reaching its
+		# offset again means re-inflating a .gz from the start on every rerun of the page
+		ingested_dumps = st.session_state.setdefault('altmetric_ingested', set())
+		for event_dump in event_dumps or []:
+			if event_dump.file_id in ingested_dumps:
+				continue
+			progress = st.progress(0.0, text=f"Reading {event_dump.name}...")
+			handle = gzip.GzipFile(fileobj=event_dump) if event_dump.name.endswith('.gz') else event_dump
+			added = attention_store.ingest(
+				handle, event_dump.name,
+				progress=lambda offset, events: progress.progress(
+					min(event_dump.tell() / max(event_dump.size, 1), 1.0), text=f"{events:,} new events"))
+			progress.empty()
+			ingested_dumps.add(event_dump.file_id)
+			if added:
+				st.caption(f"{event_dump.name}: {added:,} new events.")
+
+		attention_totals = attention_store.totals()
+		if len(attention_totals):
+			attention_col1, attention_col2 = st.columns(2)
+			attention_period = attention_col1.radio("Period", ['Daily', 'Weekly', 'Monthly'], index=1, horizontal=True)
+			attention_by = attention_col2.radio("Break down by", ['Event type', 'Source'], horizontal=True)
+			frequency = {'Daily': 'D', 'Weekly': 'W', 'Monthly': 'MS'}[attention_period]
+			attention_title = f"Attention to all {len(attention_totals):,} tracked papers"
+			show_chart(charts.encode_adaptive(
+				charts.create_attention_chart(attention_store.series(freq=frequency), attention_title)), attention_title)
+
+			st.dataframe(attention_totals.head(500), hide_index=True, use_container_width=True)
+			attention_doi = st.selectbox("Paper", attention_totals['doi'].head(5000))
+			if attention_doi:
+				paper_series = attention_store.series(
+					attention_doi, freq=frequency, by='source' if attention_by == 'Source' else 'kind')
+				show_chart(charts.encode_adaptive(charts.create_attention_chart(paper_series, attention_doi)), attention_doi)
+				st.download_button(
+					"Download time series", paper_series.to_csv().encode('utf-8'),
+					f"attention_{attention_doi.replace('/', '_')}.csv", 'text/csv')
+
+		st.markdown("<h3 class='topic-header'>Citation Metrics Calculator</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload a citation export (CSV) for yourself or your department to compute h-index, g-index, i10-index and 
+    m-quotient per author. The file needs `author` and `paper` columns, plus optional `citations` (otherwise each 
+    row counts as one citation) and `year`. Rows with several authors separated by `;` are credited to each author. 
+    Uploading further files adds their rows to the running totals.
+    """)
 
-	st.markdown("<h3 class='topic-header'>Long-term Impact Strategies</h3>", unsafe_allow_html=True)
+		citation_files = st.file_uploader("Citation exports", type=['csv'], accept_multiple_files=True, key='citation_exports')
+		if 'citation_ledger' not in st.session_state:
+			st.session_state['citation_ledger'] = citations.CitationLedger()
+			st.session_state['citation_files'] = set()
+		ledger = st.session_state['citation_ledger']
+
+		for citation_file in citation_files or []:
+			file_key = (citation_file.name, citation_file.size)
+			if file_key in st.session_state['citation_files']:
+				continue
+			progress = st.progress(0.0, text=f"Reading {citation_file.name}...")
+			try:
+				ledger.ingest(
+					citation_file,
+					progress=lambda rows: progress.progress(
+						min(citation_file.tell() / max(citation_file.size, 1), 1.0), text=f"{rows:,} rows read"))
+			except ValueError as error:
+				st.error(f"{citation_file.name}: {error}")
+			else:
+				st.session_state['citation_files'].add(file_key)
+			progress.empty()
+
+		if ledger.rows_ingested:
+			author_table = ledger.metrics()
+			st.dataframe(author_table.sort_values('h_index', ascending=False), use_container_width=True)
+			st.caption(f"{len(author_table):,} authors from {ledger.rows_ingested:,} citation rows.")
+
+		st.markdown("<h3 class='topic-header'>Long-term Impact Strategies</h3>", unsafe_allow_html=True)
 
-	st.markdown("""
+		st.markdown("""
     **Creating Research Narratives**
 
     1. **Connect related publications:** Reference your previous work appropriately
@@ -2121,22 +2484,70 @@ elif selected_page == "After Publication: Promotion & Impact":
     4. **Mentor junior researchers:** Help others build on your findings
     """)
 
-	st.success("""
+		st.markdown("<h3 class='topic-header'>Explore Your Co-authorship Network</h3>", unsafe_allow_html=True)
+
+		st.markdown("""
+    Upload a publication export for yourself, your group or your department (CSV with `author` and `paper` 
+    columns, several authors per row separated by `;`, the same format as the citation calculator). The network 
+    shows who bridges otherwise separate groups (betweenness), which research communities exist, and who you are 
+    likely to work well with: people your collaborators already work with. Papers with more than 
+    50 authors are left out, as they say little about who actually works together.
+    """)
+
+		network_file = st.file_uploader("Publication export", type=['csv'], key='coauthor_export')
+		if network_file is not None:
+			try:
+				graph = load_coauthor_graph(hashlib.sha1(network_file.getvalue()).hexdigest(), network_file)
+			except ValueError as error:
+				st.error(str(error))
+			else:
+				col1, col2, col3 = st.columns(3)
+				col1.metric("Authors", f"{len(graph):,}")
+				col2.metric("Collaborations", f"{graph.edge_count:,}")
+				with st.spinner("Estimating betweenness and detecting communities..."):
+					network_table = graph.summary()
+				col3.metric("Communities", f"{network_table['community'].nunique():,}")
+				st.dataframe(
+					network_table.sort_values('betweenness', ascending=False).head(500), use_container_width=True)
+				st.download_button(
+					"Download network metrics", network_table.to_csv().encode('utf-8'), 'coauthor_network.csv', 'text/csv')
+
+				network_author = st.selectbox(
+					"Suggest collaborators for", network_table.sort_values('papers', ascending=False).index[:5000])
+				if network_author is not None:
+					suggestions = graph.suggest_collaborators(network_author)
+					if len(suggestions):
+						st.dataframe(suggestions, hide_index=True, use_container_width=True)
+					else:
+						st.info("No suggestions: this author has no co-authors in the export.")
+
+		st.success("""
     **Pro Tip:** Create a promotion plan before publication. The first few weeks after publication are 
     critical for visibility. Having graphics, summaries, and outreach strategies ready in advance will 
     maximize your paper's initial impact.
     """)
 
-# Sidebar footer
-st.sidebar.markdown("---")
-st.sidebar.info(
-	"This app was created to help researchers understand the academic publishing process. "
-	"Navigate through different topics using the menu above."
-)
-
-# Footer
-st.markdown("---")
-st.markdown(
-	"<p class='footnote'>This guide is for educational purposes only. Publishing practices vary by field and journal.</p>",
-	unsafe_allow_html=True)
-st.markdown("<p class='footnote'>© 2025 Academic Publishing Guide</p>", unsafe_allow_html=True)
\ No newline at end of file
+	# Sidebar footer
+	st.sidebar.markdown("---")
+	st.sidebar.info(
+		"This app was created to help researchers understand the academic publishing process. "
+		"Navigate through different topics using the menu above."
+	)
+
+	# Footer
+	st.markdown("---")
+	st.markdown(
+		"<p class='footnote'>This guide is for educational purposes only. Publishing practices vary by field and journal.</p>",
+		unsafe_allow_html=True)
+	st.markdown("<p class='footnote'>© 2025 Academic Publishing Guide</p>", unsafe_allow_html=True)
+finally:
+	payload_meter.finish(selected_page)
+	session_values = {key: st.session_state[key] for key in st.session_state if key != 'session_artifacts'}
+	sessions.REGISTRY.account(
+		session_id,
+		sessions.estimate_size({key: value for key, value in session_values.items() if not uploaded_files(value)}),
+		sum(file.size for value in session_values.values() for file in uploaded_files(value)))
+	telemetry.histogram('publishing_guide_rerun_seconds', "Time to run the script for one page view", ['page']).observe(
+		time.perf_counter() - rerun_started, selected_page)
+	if rerun_profile is not None:
+		st.sidebar.caption(f"Profile written to {rerun_profile.finish()}")
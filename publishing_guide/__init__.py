@@ -0,0 +1,22 @@
+# Tools and content behind the Academic Publishing Guide app.
+#
+# Nothing here depends on Streamlit, so every module can be used from scripts and batch jobs.
+# Submodules are imported on first attribute access (publishing_guide.readability...), so
+# importing the package itself loads nothing beyond the standard library.
+import importlib
+
+__all__ = [
+	'altmetrics', 'api', 'apc', 'assets', 'authorship', 'charts', 'citations', 'coauthors', 'content', 'eigenfactor',
+	'journal_metrics', 'keywords', 'manuscript', 'overlap', 'payloads', 'portfolio', 'profiling', 'readability', 'recommender',
+	'references', 'revisions', 'routing', 'sessions', 'shared', 'storage', 'telemetry', 'warmup',
+]
+
+
+def __getattr__(name):
+	if name in __all__:
+		return importlib.import_module(f'{__name__}.{name}')
+	raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+	return sorted(set(globals()) | set(__all__))
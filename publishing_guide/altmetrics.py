@@ -0,0 +1,304 @@
+import argparse
+import gzip
+import hashlib
+import io
+import json
+import os
+import sqlite3
+import threading
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide.references import normalize_doi
+from publishing_guide.storage import data_path, ensure_parent
+
+DEFAULT_STORE_PATH = data_path('altmetrics.sqlite')
+BLOCK_BYTES = 16 * 1024 * 1024
+DEFAULT_KIND = 'mention'
+
+# Field names used by the common event dumps (Crossref Event Data, Altmetric and PlumX exports,
+# repository download logs); the first one present in a file is used. Crossref Event Data gives
+# the DOI as a doi.org URL in obj_id (its `id` is the event's UUID); normalize_doi strips the prefix.
+DOI_FIELDS = ['doi', 'obj_doi', 'object_doi', 'obj_id']
+TIME_FIELDS = ['occurred_at', 'timestamp', 'date', 'time', 'created_at']
+KIND_FIELDS = ['type', 'event', 'kind', 'relation_type_id']
+SOURCE_FIELDS = ['source', 'source_id', 'platform']
+COUNT_FIELDS = ['count', 'value', 'total']
+
+
+def _first_column(frame, names):
+	return next((name for name in names if name in frame.columns), None)
+
+
+def _days(values):
+	# ISO strings or Unix timestamps (seconds or milliseconds) to days since 1970-01-01
+	numeric = pd.to_numeric(values, errors='coerce')
+	if numeric.notna().all():
+		unit = 'ms' if numeric.abs().max() > 1e11 else 's'
+		times = pd.to_datetime(numeric, unit=unit, utc=True, errors='coerce')
+	else:
+		times = pd.to_datetime(values.astype(str), utc=True, errors='coerce', format='mixed')
+	days = times.dt.tz_localize(None).to_numpy().astype('datetime64[D]')
+	return pd.Series(days.astype(np.int64), index=values.index).where(times.notna())
+
+
+def _rows(frame):
+	# Plain Python tuples for executemany, with day numbers back as ISO dates
+	columns = [
+		np.asarray(frame[column], dtype='datetime64[D]').astype(str).tolist() if column.endswith('day')
+		else frame[column].tolist()
+		for column in frame.columns
+	]
+	return zip(*columns)
+
+
+def _parse_events(lines):
+	# One frame of (doi, day number, kind, source, count) from a block of JSONL text. The block is
+	# parsed in one call; if any line is malformed it is parsed line by line, dropping bad lines.
+	try:
+		frame = pd.read_json(io.StringIO(lines), lines=True, dtype=False, convert_dates=False)
+	except ValueError:
+		records = []
+		for line in lines.splitlines():
+			try:
+				record = json.loads(line)
+			except ValueError:
+				continue
+			if isinstance(record, dict):
+				records.append(record)
+		frame = pd.DataFrame.from_records(records)
+	columns = ['doi', 'day', 'kind', 'source', 'count']
+	doi_column, time_column = _first_column(frame, DOI_FIELDS), _first_column(frame, TIME_FIELDS)
+	if frame.empty or doi_column is None or time_column is None:
+		return pd.DataFrame(columns=columns)
+
+	kind_column, source_column = _first_column(frame, KIND_FIELDS), _first_column(frame, SOURCE_FIELDS)
+	count_column = _first_column(frame, COUNT_FIELDS)
+	events = pd.DataFrame({
+		'doi': frame[doi_column].astype(str).map(normalize_doi),
+		'day': _days(frame[time_column]),
+		'kind': frame[kind_column].fillna(DEFAULT_KIND).astype(str).str.strip().str.lower() if kind_column else DEFAULT_KIND,
+		'source': frame[source_column].fillna('').astype(str).str.strip().str.lower() if source_column else '',
+		'count': pd.to_numeric(frame[count_column], errors='coerce').fillna(1) if count_column else 1,
+	})
+	events = events[events['doi'].str.startswith('10.') & events['day'].notna()]
+	return events[columns].astype({'day': np.int64})
+
+
+def _complete(line):
+	try:
+		json.loads(line)
+	except ValueError:
+		return False
+	return True
+
+
+# Per-DOI, per-day event counts in SQLite, kept at three levels (DOI x day x kind x source,
+# DOI x kind totals, and all-DOI daily totals) so dashboards never scan raw events. Dumps are
+# tracked in a ledger by their first line and how far they have been read: re-reading a dump
+# that has grown since only parses the new bytes, and each block's rollups and ledger offset
+# are committed together, so an interrupted ingest never counts an event twice.
+class AltmetricsStore:
+	def __init__(self, path=DEFAULT_STORE_PATH):
+		self.path = path
+		self._lock = threading.RLock()
+		self._connection = sqlite3.connect(ensure_parent(path), check_same_thread=False)
+		with self._connection as connection:
+			connection.executescript("""
+				CREATE TABLE IF NOT EXISTS dumps (
+					fingerprint TEXT PRIMARY KEY,
+					name TEXT NOT NULL,
+					offset INTEGER NOT NULL,
+					events INTEGER NOT NULL
+				);
+				CREATE TABLE IF NOT EXISTS daily (
+					doi TEXT NOT NULL,
+					day TEXT NOT NULL,
+					kind TEXT NOT NULL,
+					source TEXT NOT NULL,
+					count REAL NOT NULL,
+					PRIMARY KEY (doi, day, kind, source)
+				) WITHOUT ROWID;
+				CREATE TABLE IF NOT EXISTS totals (
+					doi TEXT NOT NULL,
+					kind TEXT NOT NULL,
+					count REAL NOT NULL,
+					first_day TEXT NOT NULL,
+					last_day TEXT NOT NULL,
+					PRIMARY KEY (doi, kind)
+				) WITHOUT ROWID;
+				CREATE TABLE IF NOT EXISTS overall (
+					day TEXT NOT NULL,
+					kind TEXT NOT NULL,
+					count REAL NOT NULL,
+					PRIMARY KEY (day, kind)
+				) WITHOUT ROWID;
+			""")
+
+	def close(self):
+		self._connection.close()
+
+	def __len__(self):
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(DISTINCT doi) FROM totals").fetchone()[0]
+
+	def _apply(self, connection, events):
+		# Grouping sorts the keys, so each batch of upserts walks the primary-key B-trees in order
+		daily = events.groupby(['doi', 'day', 'kind', 'source'])['count'].sum().reset_index()
+		connection.executemany("""
+			INSERT INTO daily VALUES (?, ?, ?, ?, ?)
+			ON CONFLICT (doi, day, kind, source) DO UPDATE SET count = count + excluded.count
+		""", _rows(daily))
+		totals = events.groupby(['doi', 'kind']).agg(
+			count=('count', 'sum'), first_day=('day', 'min'), last_day=('day', 'max')).reset_index()
+		connection.executemany("""
+			INSERT INTO totals VALUES (?, ?, ?, ?, ?)
+			ON CONFLICT (doi, kind) DO UPDATE SET
+				count = count + excluded.count,
+				first_day = MIN(first_day, excluded.first_day),
+				last_day = MAX(last_day, excluded.last_day)
+		""", _rows(totals))
+		overall = events.groupby(['day', 'kind'])['count'].sum().reset_index()
+		connection.executemany("""
+			INSERT INTO overall VALUES (?, ?, ?)
+			ON CONFLICT (day, kind) DO UPDATE SET count = count + excluded.count
+		""", _rows(overall))
+
+	def _commit(self, fingerprint, name, start, lines):
+		# Applies one block's events and moves the dump's offset past it in the same transaction,
+		# but only if the dump is still read up to `start`: when another ingest of the same dump
+		# (another session or process) has committed past it, nothing is applied and None is returned
+		events = _parse_events(lines.decode('utf-8', errors='replace'))
+		with self._lock, self._connection as connection:
+			connection.execute("BEGIN IMMEDIATE")
+			row = connection.execute("SELECT offset FROM dumps WHERE fingerprint = ?", (fingerprint,)).fetchone()
+			if (row[0] if row else 0) != start:
+				return None
+			if len(events):
+				self._apply(connection, events)
+			connection.execute("""
+				INSERT INTO dumps VALUES (?, ?, ?, ?)
+				ON CONFLICT (fingerprint) DO UPDATE SET offset = excluded.offset, events = events + excluded.events
+			""", (fingerprint, name, start + len(lines), len(events)))
+		return len(events)
+
+	def ingest(self, handle, name='', progress=None):
+		# Reads a binary JSONL stream from where this dump was last read up to its last complete
+		# record. Returns the number of new events.
+		first_line = handle.readline(64 * 1024)
+		if not first_line:
+			return 0
+		fingerprint = hashlib.sha1(name.encode('utf-8') + b'\0' + first_line).hexdigest()
+		with self._lock:
+			row = self._connection.execute("SELECT offset FROM dumps WHERE fingerprint = ?", (fingerprint,)).fetchone()
+		offset = row[0] if row else 0
+		handle.seek(offset)
+
+		added = 0
+		pending = b''
+		while True:
+			block = handle.read(BLOCK_BYTES)
+			if not block:
+				break
+			block = pending + block
+			end = block.rfind(b'\n') + 1
+			pending = block[end:]
+			if not end:
+				continue
+			committed = self._commit(fingerprint, name, offset, block[:end])
+			if committed is None:
+				# Another ingest of this dump is ahead; it adds the rest
+				return added
+			offset += end
+			added += committed
+			if progress is not None:
+				progress(offset, added)
+		# A last line without a newline is taken once it is a complete record; a line still being
+		# written is left for the next read
+		if pending.strip() and _complete(pending):
+			committed = self._commit(fingerprint, name, offset, pending)
+			if committed is None:
+				return added
+			offset += len(pending)
+			added += committed
+			if progress is not None:
+				progress(offset, added)
+		return added
+
+	def ingest_file(self, path, progress=None):
+		opener = gzip.open if path.endswith('.gz') else open
+		with opener(path, 'rb') as handle:
+			return self.ingest(handle, os.path.basename(path), progress)
+
+	def dumps(self):
+		with self._lock:
+			return pd.read_sql_query("SELECT name, offset AS bytes_read, events FROM dumps ORDER BY name", self._connection)
+
+	def totals(self, limit=None):
+		# One row per DOI: total events by kind, all kinds together, first and last active day
+		with self._lock:
+			frame = pd.read_sql_query("SELECT * FROM totals", self._connection)
+		if frame.empty:
+			return pd.DataFrame(columns=['doi', 'total', 'first_day', 'last_day'])
+		table = frame.pivot_table(index='doi', columns='kind', values='count', aggfunc='sum', fill_value=0)
+		table.columns = list(table.columns)
+		table['total'] = table.sum(axis=1)
+		days = frame.groupby('doi').agg(first_day=('first_day', 'min'), last_day=('last_day', 'max'))
+		table = table.join(days).sort_values('total', ascending=False)
+		return (table.head(limit) if limit else table).reset_index()
+
+	def series(self, doi=None, start=None, end=None, freq='D', by='kind'):
+		# Event counts per period (rows) and kind or source (columns) for one DOI, or for all
+		# DOIs when `doi` is None. Days without events are filled with zeros.
+		column = 'source' if by == 'source' and doi is not None else 'kind'
+		if doi is None:
+			query, parameters = "SELECT day, kind, count FROM overall WHERE 1", []
+		else:
+			query = f"SELECT day, {column}, SUM(count) AS count FROM daily WHERE doi = ?"
+			parameters = [normalize_doi(doi)]
+		if start is not None:
+			query += " AND day >= ?"
+			parameters.append(pd.Timestamp(start).strftime('%Y-%m-%d'))
+		if end is not None:
+			query += " AND day <= ?"
+			parameters.append(pd.Timestamp(end).strftime('%Y-%m-%d'))
+		if doi is not None:
+			query += f" GROUP BY day, {column}"
+		with self._lock:
+			frame = pd.read_sql_query(query, self._connection, params=parameters)
+		if frame.empty:
+			return pd.DataFrame()
+		frame.loc[frame[column] == '', column] = 'unknown'
+		table = frame.pivot_table(index='day', columns=column, values='count', aggfunc='sum', fill_value=0)
+		table.index = pd.to_datetime(table.index)
+		days = pd.date_range(start or table.index.min(), end or table.index.max(), freq='D')
+		table = table.reindex(days, fill_value=0)
+		table.columns = list(table.columns)
+		return table.resample(freq).sum() if freq != 'D' else table
+
+
+def iter_dumps(paths):
+	for path in paths:
+		if os.path.isdir(path):
+			for root, _, files in os.walk(path):
+				for file_name in sorted(files):
+					if file_name.endswith(('.jsonl', '.jsonl.gz', '.ndjson')):
+						yield os.path.join(root, file_name)
+		else:
+			yield path
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Add attention-event dumps (JSONL) to the local altmetrics store.")
+	parser.add_argument('paths', nargs='+', help="JSONL dumps (optionally gzipped) or directories of them")
+	parser.add_argument('-s', '--store', default=DEFAULT_STORE_PATH)
+	args = parser.parse_args(argv)
+
+	store = AltmetricsStore(args.store)
+	added = sum(store.ingest_file(path) for path in iter_dumps(args.paths))
+	print(f"Added {added} events; {len(store)} DOIs in {args.store}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,129 @@
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+OA_ROUTES = ['Gold', 'Hybrid', 'Diamond', 'Green']
+# Routes that charge no APC of their own; a blank APC on them means none
+NO_APC_ROUTES = ['Diamond', 'Green']
+
+PAPER_COLUMNS = ['paper', 'priority']
+OPTION_COLUMNS = ['paper', 'journal', 'route', 'apc', 'waiver_pct', 'agreement_discount_pct', 'preference']
+
+_RESULT_CACHE = OrderedDict()
+_RESULT_CACHE_SIZE = 128
+# Upper bound on budget steps in the knapsack table (papers x steps cells); large budgets
+# are planned in coarser steps instead
+MAX_STEPS = 4000
+
+
+def net_apc(options):
+	# Waivers and transformative-agreement discounts stack multiplicatively on the list APC. An
+	# unknown APC stays unknown (NaN) unless the route charges none.
+	apc = options['apc'].astype(float).where(~options['route'].isin(NO_APC_ROUTES), options['apc'].fillna(0))
+	waiver = options['waiver_pct'].fillna(0).astype(float).clip(0, 100) / 100
+	discount = options['agreement_discount_pct'].fillna(0).astype(float).clip(0, 100) / 100
+	cost = apc * (1 - waiver) * (1 - discount)
+	return cost.where(options['route'] != 'Diamond', 0.0)
+
+
+def _normalise(papers, options):
+	papers = papers.reindex(columns=PAPER_COLUMNS).dropna(subset=['paper']).copy()
+	papers['paper'] = papers['paper'].astype(str).str.strip()
+	papers = papers[papers['paper'] != ''].drop_duplicates('paper')
+	papers['priority'] = pd.to_numeric(papers['priority'], errors='coerce').fillna(1).clip(lower=0).round().astype(int)
+
+	options = options.reindex(columns=OPTION_COLUMNS).dropna(subset=['paper', 'journal']).copy()
+	options['paper'] = options['paper'].astype(str).str.strip()
+	options['route'] = options['route'].fillna('Gold')
+	unknown_routes = set(options['route']) - set(OA_ROUTES)
+	if unknown_routes:
+		raise ValueError(f"Unknown open access route(s): {', '.join(sorted(unknown_routes))}")
+	unknown_papers = set(options['paper']) - set(papers['paper'])
+	if unknown_papers:
+		raise ValueError(f"Journal options refer to unlisted paper(s): {', '.join(sorted(unknown_papers))}")
+	for column in ['apc', 'waiver_pct', 'agreement_discount_pct', 'preference']:
+		options[column] = pd.to_numeric(options[column], errors='coerce')
+	negative = options.loc[options['apc'] < 0, 'paper']
+	if len(negative):
+		raise ValueError(f"Negative APC for paper(s): {', '.join(sorted(set(negative)))}")
+	options['preference'] = options['preference'].fillna(0).clip(0, 1)
+	options['net_apc'] = net_apc(options)
+	return papers.reset_index(drop=True), options.reset_index(drop=True)
+
+
+def input_hash(papers, options, budget, resolution):
+	digest = hashlib.sha1()
+	for frame in (papers, options):
+		digest.update(','.join(map(str, frame.columns)).encode())
+		digest.update(pd.util.hash_pandas_object(frame, index=False).values.tobytes())
+	digest.update(f"{float(budget)}:{float(resolution)}".encode())
+	return digest.hexdigest()
+
+
+# Pick at most one OA route per paper to maximise the (priority-weighted) number of open access
+# papers within the budget, preferring favoured journals and then lower spend. Solved as a
+# multiple-choice knapsack over the budget in `resolution`-dollar steps (coarser when the budget
+# needs more than MAX_STEPS of them); costs are rounded up so the plan never exceeds the real
+# budget. Options whose APC is unknown are left out and named in the `note` column.
+def optimize(papers, options, budget, resolution=10):
+	key = input_hash(papers, options, budget, resolution)
+	if key in _RESULT_CACHE:
+		_RESULT_CACHE.move_to_end(key)
+		return _RESULT_CACHE[key].copy()
+
+	papers, options = _normalise(papers, options)
+	unknown = options[options['net_apc'].isna()]
+	options = options.dropna(subset=['net_apc']).reset_index(drop=True)
+	resolution = max(float(resolution), float(budget) / MAX_STEPS)
+	capacity = max(int(budget // resolution), 0)
+	steps = np.ceil(options['net_apc'].to_numpy() / resolution - 1e-9).astype(np.int64)
+	# Journal preference only ever breaks ties between plans with the same paper count
+	tie_break = 1.0 / (len(papers) + 1)
+
+	# best[c] is the best value reachable spending exactly c steps
+	best = np.full(capacity + 1, -np.inf)
+	best[0] = 0.0
+	choices = np.full((len(papers), capacity + 1), -1, dtype=np.int32)
+	option_rows = options.groupby('paper').indices
+
+	for p, (paper, priority) in enumerate(zip(papers['paper'], papers['priority'])):
+		updated = best.copy()
+		for row in option_rows.get(paper, ()):
+			step = steps[row]
+			if step > capacity:
+				continue
+			value = priority + tie_break * options.at[row, 'preference']
+			candidate = np.full(capacity + 1, -np.inf)
+			candidate[step:] = best[:capacity + 1 - step] + value
+			improved = candidate > updated
+			updated[improved] = candidate[improved]
+			choices[p, improved] = row
+		best = updated
+
+	target = int(np.flatnonzero(best == best.max())[0])
+	plan = []
+	for p in range(len(papers) - 1, -1, -1):
+		row = choices[p, target]
+		if row >= 0:
+			target -= steps[row]
+		plan.append(row)
+	plan.reverse()
+
+	result = papers[['paper', 'priority']].copy()
+	chosen = [options.loc[row] if row >= 0 else None for row in plan]
+	result['journal'] = [option['journal'] if option is not None else None for option in chosen]
+	result['route'] = [option['route'] if option is not None else 'Subscription (no APC)' for option in chosen]
+	result['net_apc'] = [round(float(option['net_apc']), 2) if option is not None else 0.0 for option in chosen]
+	result['open_access'] = [option is not None for option in chosen]
+	unknown_journals = unknown.groupby('paper')['journal'].agg(lambda journals: ', '.join(map(str, journals)))
+	result['note'] = [
+		f"APC unknown for {unknown_journals[paper]}" if paper in unknown_journals.index else ''
+		for paper in result['paper']
+	]
+
+	_RESULT_CACHE[key] = result
+	if len(_RESULT_CACHE) > _RESULT_CACHE_SIZE:
+		_RESULT_CACHE.popitem(last=False)
+	return result.copy()
@@ -0,0 +1,386 @@
+import argparse
+import asyncio
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from urllib.parse import urlsplit
+
+from publishing_guide import assets, content, sessions, shared, telemetry, warmup
+
+DEFAULT_HOST = '127.0.0.1'
+DEFAULT_PORT = 8765
+KEEP_ALIVE_SECONDS = 15
+MAX_HEADER_BYTES = 64 * 1024
+MAX_BODY_BYTES = 20 * 1024 * 1024
+TOOL_THREADS = 4
+JSON_TYPE = 'application/json; charset=utf-8'
+
+logger = logging.getLogger(__name__)
+
+# Content sections served under /content/<name>
+SECTIONS = {
+	'pages': 'PAGES',
+	'publication-types': 'PUBLICATION_TYPES',
+	'journal-metrics': 'JOURNAL_METRICS',
+	'paper-sections': 'PAPER_SECTIONS',
+	'peer-review-types': 'PEER_REVIEW_TYPES',
+	'editorial-decisions': 'EDITORIAL_DECISIONS',
+	'warning-categories': 'WARNING_CATEGORIES',
+	'warning-signs': 'WARNING_SIGNS',
+}
+
+
+def _plain(value):
+	# json.dumps fallback for numpy scalars/arrays and pandas frames returned by the tools
+	if hasattr(value, 'to_dict') and hasattr(value, 'columns'):
+		return json.loads(value.to_json(orient='records'))
+	if hasattr(value, 'tolist'):
+		return value.tolist()
+	if hasattr(value, 'item'):
+		return value.item()
+	raise TypeError(f"{type(value).__name__} is not JSON serialisable")
+
+
+def _finite(value):
+	if isinstance(value, float) and not math.isfinite(value):
+		return None
+	if isinstance(value, dict):
+		return {key: _finite(item) for key, item in value.items()}
+	if isinstance(value, list):
+		return [_finite(item) for item in value]
+	return value
+
+
+def encode(payload):
+	try:
+		text = json.dumps(payload, default=_plain, ensure_ascii=False, allow_nan=False)
+	except ValueError:
+		# NaN or infinity somewhere (e.g. a score of an empty text): JSON has no such values
+		text = json.dumps(_finite(json.loads(json.dumps(payload, default=_plain))), ensure_ascii=False)
+	return text.encode('utf-8')
+
+
+def etag(body):
+	return '"' + hashlib.blake2b(body, digest_size=12).hexdigest() + '"'
+
+
+def _document(request):
+	# Tool inputs are either `text` or base64 `data`, plus a `filename` whose extension picks the format
+	if 'data' in request:
+		return base64.b64decode(request['data']), request.get('filename', 'upload.docx')
+	return str(request.get('text', '')).encode('utf-8'), request.get('filename', 'upload.txt')
+
+
+# Tools take the decoded JSON request and return something JSON-serialisable. Their modules
+# are imported on first use, so the API starts without loading pandas or the indexes.
+def _readability(request):
+	from publishing_guide import readability
+
+	if 'texts' in request:
+		return readability.score_texts(request['texts'])
+	return readability.score_text(str(request.get('text', '')))
+
+
+def _keywords(request):
+	from publishing_guide import keywords
+
+	table = shared.keyword_table()
+	return [
+		{'keyword': phrase, 'score': score}
+		for phrase, score in keywords.extract(
+			str(request.get('text', '')), table, title=str(request.get('title', '')), k=int(request.get('k', 10)))
+	]
+
+
+def _references(request):
+	from publishing_guide import references
+
+	stream, filename = _document({'filename': 'references.bib', **request})
+	return references.check_references(stream, filename).table()
+
+
+def _length(request):
+	from publishing_guide import manuscript
+
+	stream, filename = _document(request)
+	counts = manuscript.count_section_words(stream, filename)
+	publication_type = request.get('publication_type', 'Original Research Articles')
+	if publication_type not in content.PUBLICATION_TYPES:
+		raise ValueError(f"Unknown publication type '{publication_type}'")
+	return manuscript.length_report(counts, content.PUBLICATION_TYPES[publication_type]['typical_length'])
+
+
+def _revisions(request):
+	from publishing_guide import manuscript, revisions
+
+	# Both versions as `old`/`new` text or `old_data`/`new_data` base64, in the format of `filename`
+	def version(prefix):
+		if f'{prefix}_data' in request:
+			return manuscript.extract_paragraphs(*_document({**request, 'data': request[f'{prefix}_data']}))
+		return manuscript.extract_paragraphs(*_document({'filename': request.get('filename', 'upload.txt'), 'text': request.get(prefix, '')}))
+
+	changes = shared.revision_diff().compare(version('old'), version('new'))
+	return {'summary': revisions.summary(changes), 'changes': changes}
+
+
+def _recommend(request):
+	from publishing_guide import recommender
+
+	if not os.path.exists(recommender.DEFAULT_INDEX_PATH):
+		raise LookupError("No journal index has been built on this server")
+	index = shared.journal_index()
+	return [
+		{'journal': journal, 'score': score}
+		for journal, score in index.recommend(
+			str(request.get('abstract', '')), title=str(request.get('title', '')), k=int(request.get('k', 10)))
+	]
+
+
+def _overlap(request):
+	from publishing_guide import manuscript
+
+	return shared.overlap_index().check(manuscript.extract_text(*_document(request)))
+
+
+TOOLS = {
+	'readability': _readability,
+	'keywords': _keywords,
+	'references': _references,
+	'length': _length,
+	'revisions': _revisions,
+	'recommend': _recommend,
+	'overlap': _overlap,
+}
+
+
+# Process state, computed on every request: (status, content type, body)
+def _readiness():
+	# For load balancers and orchestrators: 503 until the warm-up has finished
+	report = warmup.report()
+	return 200 if report['ready'] else 503, JSON_TYPE, encode(report)
+
+
+DIAGNOSTICS = {
+	'/readyz': _readiness,
+	'/warmup': lambda: (200, JSON_TYPE, encode(warmup.report())),
+	'/metrics': lambda: (200, telemetry.CONTENT_TYPE, telemetry.render()),
+	'/sessions': lambda: (200, JSON_TYPE, encode(sessions.REGISTRY.report())),
+}
+
+
+def _response(status, body, headers=(), keep_alive=True):
+	status = HTTPStatus(status)
+	lines = [
+		f'HTTP/1.1 {status.value} {status.phrase}',
+		f'Content-Length: {len(body)}',
+		'Connection: keep-alive' if keep_alive else 'Connection: close',
+		*headers,
+	]
+	return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def _error(status, message, keep_alive=True):
+	return _response(status, encode({'error': message}), ['Content-Type: application/json'], keep_alive)
+
+
+# HTTP/1.1 JSON API on asyncio streams. GET responses for the content store are built once:
+# each is cached as ready-to-send bytes with a strong ETag, so a conditional request is
+# answered with 304 and a plain one with a single write. Tools run in a small thread pool so
+# a slow check never stalls the event loop. Connections are kept alive and requests on them
+# may be pipelined.
+class ApiServer:
+	def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, tool_threads=TOOL_THREADS):
+		self.host = host
+		self.port = port
+		self._executor = ThreadPoolExecutor(tool_threads, thread_name_prefix='api-tool')
+		self._static = {}
+		self._server = None
+		self._assets_loaded = None
+		self.add_static('/content', {'sections': sorted(SECTIONS)})
+		for name, attribute in SECTIONS.items():
+			self.add_static(f'/content/{name}', getattr(content, attribute))
+		self.add_static('/tools', {'tools': sorted(TOOLS)})
+		self.add_static('/health', {'status': 'ok'})
+		self.load_assets()
+
+	def add_static(self, path, payload):
+		self.add_file(path, encode(payload), JSON_TYPE, 'no-cache')
+
+	def load_assets(self, directory=assets.DEFAULT_ASSET_DIR):
+		# Image variants built by publishing_guide.assets, under /assets/<content-hashed name>.
+		# Re-read only when the manifest has changed since the last load.
+		manifest = os.path.join(directory, 'manifest.json')
+		stamp = os.path.getmtime(manifest) if os.path.exists(manifest) else None
+		if stamp == self._assets_loaded:
+			return
+		self._assets_loaded = stamp
+		for name, content_type, body in assets.files(directory):
+			if f'/assets/{name}' not in self._static:
+				self.add_file(f'/assets/{name}', body, content_type, assets.CACHE_CONTROL)
+
+	def add_file(self, path, body, content_type, cache_control):
+		tag = etag(body)
+		headers = [f'Content-Type: {content_type}', f'ETag: {tag}', f'Cache-Control: {cache_control}']
+		self._static[path] = (tag, {
+			keep_alive: (_response(200, body, headers, keep_alive), _response(304, b'', headers[1:], keep_alive))
+			for keep_alive in (True, False)
+		})
+
+	async def _run_tool(self, name, body, keep_alive):
+		try:
+			request = json.loads(body or b'{}')
+			if not isinstance(request, dict):
+				raise ValueError("The request body must be a JSON object")
+		except ValueError as error:
+			return _error(400, str(error), keep_alive)
+		try:
+			result = await asyncio.get_running_loop().run_in_executor(self._executor, TOOLS[name], request)
+		except (ValueError, KeyError) as error:
+			return _error(422, str(error), keep_alive)
+		except LookupError as error:
+			return _error(503, str(error), keep_alive)
+		except Exception:
+			# A bug or an input the tool did not anticipate (e.g. a field of the wrong type):
+			# the client still gets an answer and the connection stays usable
+			logger.exception("Tool %s failed", name)
+			return _error(500, f"The {name} tool failed on this request", keep_alive)
+		result_body = encode(result)
+		return _response(200, result_body, ['Content-Type: application/json; charset=utf-8', f'ETag: {etag(result_body)}'], keep_alive)
+
+	async def dispatch(self, method, path, headers, body, keep_alive=True):
+		if path in self._static:
+			if method not in ('GET', 'HEAD'):
+				return _error(405, f"{method} is not allowed on {path}", keep_alive)
+			tag, responses = self._static[path]
+			full, not_modified = responses[keep_alive]
+			if tag in headers.get('if-none-match', ''):
+				return not_modified
+			return full if method == 'GET' else full[:full.index(b'\r\n\r\n') + 4]
+		if path.startswith('/assets/') and method in ('GET', 'HEAD'):
+			# Not loaded yet: built after the server started (e.g. by the warm-up)
+			self.load_assets()
+			if path in self._static:
+				return await self.dispatch(method, path, headers, body, keep_alive)
+		if path in DIAGNOSTICS:
+			if method != 'GET':
+				return _error(405, f"{method} is not allowed on {path}", keep_alive)
+			status, content_type, payload = DIAGNOSTICS[path]()
+			return _response(status, payload, [f'Content-Type: {content_type}', 'Cache-Control: no-store'], keep_alive)
+		if path.startswith('/tools/') and path[7:] in TOOLS:
+			if method != 'POST':
+				return _error(405, "Tools are called with POST and a JSON body", keep_alive)
+			return await self._run_tool(path[7:], body, keep_alive)
+		return _error(404, f"No such resource: {path}", keep_alive)
+
+	async def _handle(self, reader, writer):
+		try:
+			while True:
+				try:
+					head = await asyncio.wait_for(reader.readuntil(b'\r\n\r\n'), KEEP_ALIVE_SECONDS)
+				except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, asyncio.TimeoutError, ConnectionError):
+					break
+				request_line, *header_lines = head.decode('latin-1').split('\r\n')
+				try:
+					method, target, version = request_line.split(' ')
+				except ValueError:
+					writer.write(_error(400, "Malformed request line", keep_alive=False))
+					break
+				headers = {}
+				for line in header_lines:
+					name, _, value = line.partition(':')
+					if name:
+						headers[name.strip().lower()] = value.strip()
+				connection = headers.get('connection', '').lower()
+				keep_alive = connection != 'close' if version == 'HTTP/1.1' else connection == 'keep-alive'
+
+				# Without a valid length the body cannot be framed, so the connection is closed
+				length = headers.get('content-length')
+				if length is None and method in ('POST', 'PUT', 'PATCH'):
+					writer.write(_error(400, "Content-Length is required", keep_alive=False))
+					break
+				try:
+					length = int(length or 0)
+				except ValueError:
+					length = -1
+				if length < 0:
+					writer.write(_error(400, "Invalid Content-Length", keep_alive=False))
+					break
+				if length > MAX_BODY_BYTES:
+					writer.write(_error(413, "Request body too large", keep_alive=False))
+					break
+				body = await reader.readexactly(length) if length else b''
+				try:
+					response = await self.dispatch(method, urlsplit(target).path.rstrip('/') or '/', headers, body, keep_alive)
+				except Exception:
+					logger.exception("Request %s %s failed", method, target)
+					response = _error(500, "Internal server error", keep_alive)
+				writer.write(response)
+				if writer.transport.get_write_buffer_size() > 64 * 1024:
+					await writer.drain()
+				if not keep_alive:
+					break
+			await writer.drain()
+		except (ConnectionError, asyncio.IncompleteReadError):
+			pass
+		finally:
+			writer.close()
+
+	async def start(self):
+		self._server = await asyncio.start_server(self._handle, self.host, self.port, limit=MAX_HEADER_BYTES, backlog=1024)
+		self.port = self._server.sockets[0].getsockname()[1]
+		return self._server
+
+	async def serve_forever(self):
+		server = await self.start()
+		async with server:
+			await server.serve_forever()
+
+	def start_in_thread(self):
+		# Runs the API on its own event loop in a daemon thread (used when serving alongside the
+		# Streamlit app); returns once the socket is listening, or raises why it could not listen
+		# (e.g. OSError for a port already in use)
+		started = threading.Event()
+		failed = []
+
+		def run():
+			loop = asyncio.new_event_loop()
+			asyncio.set_event_loop(loop)
+			try:
+				loop.run_until_complete(self.start())
+			except BaseException as error:
+				failed.append(error)
+				loop.close()
+				return
+			finally:
+				started.set()
+			loop.run_forever()
+
+		thread = threading.Thread(target=run, name='publishing-guide-api', daemon=True)
+		thread.start()
+		started.wait()
+		if failed:
+			raise failed[0]
+		return thread
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Serve the guide's content and tools as a local JSON API.")
+	parser.add_argument('--host', default=DEFAULT_HOST)
+	parser.add_argument('--port', type=int, default=DEFAULT_PORT)
+	parser.add_argument('--tool-threads', type=int, default=TOOL_THREADS)
+	args = parser.parse_args(argv)
+
+	server = ApiServer(args.host, args.port, args.tool_threads)
+	warmup.start_background()
+	print(f"Serving on http://{args.host}:{args.port}/content and /tools")
+	asyncio.run(server.serve_forever())
+
+
+if __name__ == '__main__':
+	main()
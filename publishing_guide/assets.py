@@ -0,0 +1,189 @@
+import argparse
+import base64
+import hashlib
+import html
+import io
+import json
+import os
+import re
+
+from PIL import Image
+
+from publishing_guide.storage import data_path
+
+SOURCE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'images')
+DEFAULT_ASSET_DIR = data_path('assets')
+# Public URL the built files are served under (the API's /assets route, or a CDN in front of
+# it). Without one, pages inline the smallest suitable variant as a data URI.
+ASSET_URL = os.environ.get('PUBLISHING_GUIDE_ASSET_URL', '').rstrip('/')
+
+WIDTHS = (480, 960, 1440)
+RASTER_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.webp', '.gif')
+# Files are named by content hash, so a URL never changes meaning and can be cached for a year
+CACHE_CONTROL = 'public, max-age=31536000, immutable'
+CONTENT_TYPES = {'.svg': 'image/svg+xml', '.webp': 'image/webp', '.png': 'image/png', '.jpg': 'image/jpeg'}
+PIPELINE_VERSION = 1
+INLINE_WIDTH = 960
+# Names of the files build() writes: <stem>-<hash>.svg and <stem>-<width>-<hash>.<format>
+BUILT_FILE_RE = re.compile(r'^.+-(?:\d+-)?[0-9a-f]{16}\.(?:svg|webp|png|jpg)(?:\.tmp)?$')
+
+
+def _hash(data):
+	return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _minify_svg(text):
+	# Comments and the whitespace between tags carry nothing the browser draws
+	text = re.sub(r'<!--.*?-->', '', text, flags=re.S)
+	return re.sub(r'>\s+<', '><', text).strip()
+
+
+def _fallback_format(image):
+	# PNG keeps transparency and the flat colours of diagrams; photographs are far smaller as JPEG
+	if image.mode in ('RGBA', 'LA', 'P') or image.getcolors(4096) is not None:
+		return 'png'
+	return 'jpg'
+
+
+def _encode(image, fmt):
+	buffer = io.BytesIO()
+	if fmt == 'webp':
+		image.save(buffer, format='WEBP', quality=80, method=6)
+	elif fmt == 'png':
+		image.save(buffer, format='PNG', optimize=True)
+	else:
+		image.convert('RGB').save(buffer, format='JPEG', quality=82, optimize=True, progressive=True)
+	return buffer.getvalue()
+
+
+def _write(directory, name, data):
+	path = os.path.join(directory, name)
+	if not os.path.exists(path):
+		with open(path + '.tmp', 'wb') as handle:
+			handle.write(data)
+		os.replace(path + '.tmp', path)
+	return {'file': name, 'bytes': len(data)}
+
+
+def _build_one(path, directory):
+	stem, extension = os.path.splitext(os.path.basename(path))
+	with open(path, 'rb') as handle:
+		source = handle.read()
+	if extension.lower() == '.svg':
+		data = _minify_svg(source.decode('utf-8')).encode('utf-8')
+		size = re.search(rb'viewBox="[\d.]+ [\d.]+ ([\d.]+) ([\d.]+)"', data)
+		width, height = (round(float(value)) for value in size.groups()) if size else (None, None)
+		variant = {'width': width, 'format': 'svg', **_write(directory, f'{stem}-{_hash(data)}.svg', data)}
+		return {'width': width, 'height': height, 'variants': [variant]}
+
+	image = Image.open(io.BytesIO(source))
+	image.load()
+	fallback = _fallback_format(image)
+	if image.mode not in ('RGB', 'RGBA'):
+		image = image.convert('RGBA' if 'A' in image.getbands() or 'transparency' in image.info else 'RGB')
+	variants = []
+	# Never upscale: the largest variant is the source's own width
+	for width in sorted({min(width, image.width) for width in WIDTHS}):
+		resized = image if width == image.width else image.resize(
+			(width, round(image.height * width / image.width)), Image.Resampling.LANCZOS)
+		for fmt in ('webp', fallback):
+			data = _encode(resized, fmt)
+			variants.append({'width': width, 'format': fmt, **_write(directory, f'{stem}-{width}-{_hash(data)}.{fmt}', data)})
+	return {'width': image.width, 'height': image.height, 'variants': variants}
+
+
+def build(source_dir=SOURCE_DIR, directory=DEFAULT_ASSET_DIR):
+	# Rebuilds only sources whose content changed since the last build; built files no longer in
+	# the manifest are removed (nothing else in the directory is touched). Returns the manifest.
+	os.makedirs(directory, exist_ok=True)
+	if not os.path.exists(os.path.join(directory, 'manifest.json')) and any(os.scandir(directory)):
+		raise ValueError(f"{directory} is not empty and has no asset manifest; build assets into their own directory")
+	previous = load_manifest(directory)
+	manifest = {}
+	for entry in sorted(os.scandir(source_dir), key=lambda entry: entry.name) if os.path.isdir(source_dir) else ():
+		stem, extension = os.path.splitext(entry.name)
+		if extension.lower() not in (*RASTER_EXTENSIONS, '.svg'):
+			continue
+		with open(entry.path, 'rb') as handle:
+			source_hash = f'{PIPELINE_VERSION}:{_hash(handle.read())}'
+		built = previous.get(stem)
+		if built is None or built['source'] != source_hash or not all(
+				os.path.exists(os.path.join(directory, variant['file'])) for variant in built['variants']):
+			built = {'source': source_hash, **_build_one(entry.path, directory)}
+		manifest[stem] = built
+
+	keep = {variant['file'] for entry in manifest.values() for variant in entry['variants']} | {'manifest.json'}
+	for entry in os.scandir(directory):
+		if entry.is_file() and entry.name not in keep and BUILT_FILE_RE.match(entry.name):
+			os.remove(entry.path)
+	with open(os.path.join(directory, 'manifest.json.tmp'), 'w') as handle:
+		json.dump(manifest, handle, indent=1)
+	os.replace(os.path.join(directory, 'manifest.json.tmp'), os.path.join(directory, 'manifest.json'))
+	return manifest
+
+
+def load_manifest(directory=DEFAULT_ASSET_DIR):
+	path = os.path.join(directory, 'manifest.json')
+	if not os.path.exists(path):
+		return {}
+	with open(path) as handle:
+		return json.load(handle)
+
+
+def files(directory=DEFAULT_ASSET_DIR):
+	# (file name, content type, bytes) of every built variant, for serving
+	for entry in load_manifest(directory).values():
+		for variant in entry['variants']:
+			extension = os.path.splitext(variant['file'])[1]
+			with open(os.path.join(directory, variant['file']), 'rb') as handle:
+				yield variant['file'], CONTENT_TYPES[extension], handle.read()
+
+
+def picture_html(name, alt, manifest, directory=DEFAULT_ASSET_DIR, base_url=ASSET_URL, sizes='100vw'):
+	entry = manifest[name]
+	alt = html.escape(alt)
+	dimensions = f'width="{entry["width"]}" height="{entry["height"]}"' if entry['width'] else ''
+	style = 'style="width: 100%; height: auto;"'
+	if not base_url:
+		# Inlined: the variant closest to a typical content column, as a data URI
+		variant = min(
+			(variant for variant in entry['variants'] if variant['format'] in ('svg', 'webp')),
+			key=lambda variant: abs((variant['width'] or INLINE_WIDTH) - INLINE_WIDTH))
+		with open(os.path.join(directory, variant['file']), 'rb') as handle:
+			data = base64.b64encode(handle.read()).decode()
+		content_type = CONTENT_TYPES[os.path.splitext(variant['file'])[1]]
+		return f'<img src="data:{content_type};base64,{data}" alt="{alt}" {dimensions} {style}>'
+
+	def srcset(fmt):
+		return ', '.join(
+			f'{base_url}/{variant["file"]} {variant["width"]}w' for variant in entry['variants'] if variant['format'] == fmt)
+
+	formats = [variant['format'] for variant in entry['variants']]
+	if formats == ['svg']:
+		return f'<img src="{base_url}/{entry["variants"][0]["file"]}" alt="{alt}" {dimensions} {style} loading="lazy" decoding="async">'
+	fallback = next(fmt for fmt in formats if fmt != 'webp')
+	largest = [variant for variant in entry['variants'] if variant['format'] == fallback][-1]
+	return (
+		f'<picture><source type="image/webp" srcset="{srcset("webp")}" sizes="{sizes}">'
+		f'<img src="{base_url}/{largest["file"]}" srcset="{srcset(fallback)}" sizes="{sizes}" alt="{alt}" '
+		f'{dimensions} {style} loading="lazy" decoding="async"></picture>')
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Build responsive, content-hashed variants of the guide's images.")
+	parser.add_argument('-s', '--source', default=SOURCE_DIR)
+	parser.add_argument('-o', '--output', default=DEFAULT_ASSET_DIR)
+	args = parser.parse_args(argv)
+
+	try:
+		manifest = build(args.source, args.output)
+	except ValueError as error:
+		parser.error(str(error))
+	for name, entry in manifest.items():
+		total = sum(variant['bytes'] for variant in entry['variants'])
+		print(f"{name}: {len(entry['variants'])} variant(s), {total / 1024:.1f} KiB")
+	print(f"Manifest written to {os.path.join(args.output, 'manifest.json')}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,260 @@
+import re
+
+import numpy as np
+import pandas as pd
+
+# ICMJE's four authorship criteria, plus the role categories that do not satisfy any of them
+CRITERIA = ['substantial_contribution', 'drafting_or_revision', 'final_approval', 'accountability']
+ADMINISTRATIVE = 'administrative'
+OTHER = 'other'
+CATEGORIES = CRITERIA + [ADMINISTRATIVE, OTHER]
+CRITERION_LABELS = {
+	'substantial_contribution': 'substantial contribution',
+	'drafting_or_revision': 'drafting or revision',
+	'final_approval': 'final approval',
+	'accountability': 'accountability',
+}
+
+# The 14 CRediT roles. Funding, supervision, administration and resources are real
+# contributions but do not on their own meet ICMJE criterion 1.
+CREDIT_ROLES = {
+	'conceptualization': 'substantial_contribution',
+	'data curation': 'substantial_contribution',
+	'formal analysis': 'substantial_contribution',
+	'investigation': 'substantial_contribution',
+	'methodology': 'substantial_contribution',
+	'software': 'substantial_contribution',
+	'validation': 'substantial_contribution',
+	'visualization': 'substantial_contribution',
+	'writing original draft': 'drafting_or_revision',
+	'writing review editing': 'drafting_or_revision',
+	'funding acquisition': ADMINISTRATIVE,
+	'project administration': ADMINISTRATIVE,
+	'resources': ADMINISTRATIVE,
+	'supervision': ADMINISTRATIVE,
+}
+
+# Consortium role names beyond CRediT are classified by the first keyword they contain. The
+# administrative keywords are specific, since they are checked first: "data management" is a
+# substantial contribution, "project administration" is not
+ROLE_KEYWORDS = [
+	('final_approval', ('approv',)),
+	('accountability', ('accountab',)),
+	('drafting_or_revision', ('writ', 'draft', 'revis', 'editing', 'manuscript')),
+	(ADMINISTRATIVE, ('funding', 'supervis', 'project administration', 'resource', 'coordinat', 'steering', 'chair')),
+	('substantial_contribution', (
+		'concept', 'design', 'data', 'analys', 'acqui', 'investig', 'method', 'software', 'experiment',
+		'sample', 'collect', 'interpret', 'model', 'statist', 'curation', 'validat', 'visuali', 'recruit',
+		'measure', 'simulat', 'calibrat', 'detector', 'operation', 'reconstruct', 'clinical', 'patient',
+	)),
+]
+
+AUTHOR_COLUMNS = {'author', 'name', 'author name'}
+LISTED_COLUMNS = {'listed', 'on byline', 'byline', 'author list'}
+IGNORED_COLUMNS = {'affiliation', 'email', 'orcid', 'institution', 'country', 'id'}
+FALSY = {'', '0', '0.0', 'no', 'n', 'false', 'f', 'none', 'nan', '-', 'x-', 'not applicable', 'na', 'n/a'}
+CHUNK_ROWS = 50_000
+
+
+def _normalise_name(text):
+	return ' '.join(re.findall(r'[a-z0-9]+', str(text).lower()))
+
+
+def classify_role(role):
+	name = _normalise_name(role)
+	if name in CREDIT_ROLES:
+		return CREDIT_ROLES[name]
+	for category, keywords in ROLE_KEYWORDS:
+		if any(keyword in name for keyword in keywords):
+			return category
+	return OTHER
+
+
+def recognised_role(role):
+	# A CRediT role or a name containing one of the role keywords
+	return classify_role(role) != OTHER
+
+
+def _truthy(values):
+	# Any mark other than an explicit blank/no counts as holding the role ("x", "1", "Lead", ...)
+	# Each distinct cell value is judged once; a matrix holds only a handful of them
+	values = np.asarray(values, dtype=object)
+	codes, uniques = pd.factorize(values.ravel())
+	truthy = np.array([str(value).strip().lower() not in FALSY for value in uniques], dtype=bool)
+	return truthy[codes].reshape(values.shape)
+
+
+# Authors x roles boolean matrix, plus whether each person is on the byline (people who are
+# only acknowledged can be included to check for ghost authorship). Columns of a wide matrix
+# that are not recognised as roles are left out and listed in `unrecognised`.
+class ContributionMatrix:
+	def __init__(self, authors, roles, matrix, listed, unrecognised=()):
+		self.authors = authors
+		self.roles = roles
+		self.matrix = matrix
+		self.listed = listed
+		self.unrecognised = list(unrecognised)
+
+	def __len__(self):
+		return len(self.authors)
+
+	@staticmethod
+	def _columns(frame):
+		columns = {_normalise_name(column): column for column in frame.columns}
+		author_column = next((columns[name] for name in AUTHOR_COLUMNS if name in columns), None)
+		if author_column is None:
+			raise ValueError("The contribution matrix needs an 'author' column")
+		listed_column = next((columns[name] for name in LISTED_COLUMNS if name in columns), None)
+		# Long format has one row per (author, role) instead of one column per role; any other
+		# columns (email, ORCID, affiliation...) may sit alongside
+		is_long = 'role' in columns and not any(name in CREDIT_ROLES for name in columns)
+		role_column = columns['role'] if is_long else None
+		return columns, author_column, listed_column, role_column
+
+	@classmethod
+	def from_frame(cls, frame):
+		columns, author_column, listed_column, role_column = cls._columns(frame)
+		frame = frame[frame[author_column].notna()]
+		if role_column is not None:
+			authors, author_codes = np.unique(frame[author_column].astype(str).str.strip(), return_inverse=True)
+			roles, role_codes = np.unique(frame[role_column].astype(str).str.strip(), return_inverse=True)
+			matrix = np.zeros((len(authors), len(roles)), dtype=bool)
+			matrix[author_codes, role_codes] = True
+			listed = np.ones(len(authors), dtype=bool)
+			if listed_column is not None:
+				listed[:] = False
+				listed[author_codes[_truthy(frame[listed_column].fillna(''))]] = True
+			return cls(list(authors), list(roles), matrix, listed)
+
+		ignored = {author_column, listed_column} | {columns[name] for name in IGNORED_COLUMNS if name in columns}
+		roles = [column for column in frame.columns if column not in ignored and recognised_role(column)]
+		unrecognised = [str(column).strip() for column in frame.columns if column not in ignored and column not in roles]
+		matrix = _truthy(frame[roles].fillna('').to_numpy()).reshape(len(frame), len(roles))
+		if listed_column is not None:
+			listed = _truthy(frame[listed_column].fillna('').to_numpy())
+		else:
+			listed = np.ones(len(frame), dtype=bool)
+		return cls(
+			frame[author_column].astype(str).str.strip().tolist(), [str(role).strip() for role in roles], matrix, listed,
+			unrecognised)
+
+	@classmethod
+	def read_csv(cls, source, chunksize=CHUNK_ROWS):
+		# A wide matrix is converted to booleans chunk by chunk, so thousands of authors x
+		# hundreds of roles never sit in memory as a frame of strings. Long-format rows for
+		# one author may span chunks, so those are only pivoted once all rows are read.
+		chunks = iter(pd.read_csv(source, dtype=str, chunksize=chunksize))
+		first = next(chunks, None)
+		if first is None:
+			raise ValueError("The contribution matrix is empty")
+		if cls._columns(first)[3] is not None:
+			return cls.from_frame(pd.concat([first, *chunks], ignore_index=True))
+
+		parts = [cls.from_frame(first)] + [cls.from_frame(chunk) for chunk in chunks]
+		return cls(
+			[author for part in parts for author in part.authors],
+			parts[0].roles,
+			np.vstack([part.matrix for part in parts]),
+			np.concatenate([part.listed for part in parts]),
+			parts[0].unrecognised)
+
+
+def role_table(contributions, categories=None):
+	categories = categories or {}
+	held = contributions.matrix.sum(axis=0)
+	return pd.DataFrame({
+		'role': contributions.roles,
+		'category': [categories.get(role) or classify_role(role) for role in contributions.roles],
+		'authors': held,
+		'share': held / max(len(contributions), 1),
+	})
+
+
+def validate(contributions, categories=None):
+	# Returns (authors, roles, profiles, coverage). All checks are boolean matrix operations:
+	# authors x roles times roles x categories gives each author's role count per category.
+	roles = role_table(contributions, categories)
+	incidence = (roles['category'].to_numpy()[:, None] == np.array(CATEGORIES)[None, :]).astype(np.float32)
+	per_category = contributions.matrix.astype(np.float32) @ incidence
+	has = per_category > 0
+	has_criterion = dict(zip(CATEGORIES, has.T))
+	listed = contributions.listed
+
+	meets = np.logical_and.reduce([has_criterion[criterion] for criterion in CRITERIA])
+	role_counts = contributions.matrix.sum(axis=1)
+	names = pd.Series([_normalise_name(author) for author in contributions.authors])
+	substantive = has_criterion['substantial_contribution']
+	administrative_only = listed & has_criterion[ADMINISTRATIVE] & ~substantive & ~has_criterion['drafting_or_revision']
+	checks = {
+		'no roles recorded': role_counts == 0,
+		'no substantive contribution (gift or guest authorship?)':
+			listed & ~substantive & (role_counts > 0) & ~administrative_only,
+		'only funding, supervision or administrative roles (guest or coercive authorship?)': administrative_only,
+		'meets all ICMJE criteria but is not listed (ghost authorship?)': ~listed & meets,
+		'listed more than once': names.duplicated(keep=False).to_numpy() & (names != '').to_numpy(),
+	}
+	for criterion in CRITERIA[1:]:
+		checks[f'missing {CRITERION_LABELS[criterion]}'] = listed & substantive & ~has_criterion[criterion]
+	flags = pd.DataFrame(checks)
+	labels = pd.Series([label + '; ' for label in flags.columns], index=flags.columns, dtype=object)
+
+	authors = pd.DataFrame({
+		'author': contributions.authors,
+		'listed': listed,
+		'roles': role_counts,
+		**{criterion: has_criterion[criterion] for criterion in CRITERIA},
+		'meets_icmje': meets,
+		'flags': flags.dot(labels).str.rstrip('; ') if len(flags) else pd.Series(dtype=object),
+	})
+
+	# Large groups of authors with exactly the same role profile usually mean roles were
+	# assigned in bulk rather than recorded per person
+	packed = np.packbits(contributions.matrix, axis=1)
+	if len(packed):
+		profiles, inverse, counts = np.unique(packed, axis=0, return_inverse=True, return_counts=True)
+		inverse = inverse.reshape(-1)
+		order = np.argsort(-counts)
+		profile_rows = [
+			{
+				'authors': int(counts[index]),
+				'roles': ', '.join(np.asarray(contributions.roles)[
+					np.unpackbits(profiles[index])[:len(contributions.roles)].astype(bool)]) or '(none)',
+				'example': contributions.authors[int(np.argmax(inverse == index))],
+			}
+			for index in order[:20] if counts[index] > 1
+		]
+	else:
+		profile_rows = []
+	profiles = pd.DataFrame(profile_rows, columns=['authors', 'roles', 'example'])
+
+	on_byline = max(int(listed.sum()), 1)
+	coverage = {CRITERION_LABELS[criterion]: float((has_criterion[criterion] & listed).sum() / on_byline) for criterion in CRITERIA}
+	coverage['all four criteria'] = float((meets & listed).sum() / on_byline)
+	return authors, roles, profiles, coverage
+
+
+def iter_csv(frame, chunk_rows=5000):
+	# CSV text in chunks, for writing a report of any size to a file or response
+	for start in range(0, len(frame), chunk_rows):
+		yield frame.iloc[start:start + chunk_rows].to_csv(index=False, header=start == 0)
+	if len(frame) == 0:
+		yield frame.to_csv(index=False)
+
+
+def iter_credit_statement(contributions, categories=None):
+	# "Author: Role, Role." lines for every listed author, one author at a time
+	roles = np.asarray(contributions.roles, dtype=object)
+	categories = categories or {}
+	reported = np.array([(categories.get(role) or classify_role(role)) not in ('final_approval', 'accountability')
+						 for role in contributions.roles], dtype=bool)
+	for author, row, listed in zip(contributions.authors, contributions.matrix, contributions.listed):
+		if listed:
+			held = roles[row & reported]
+			yield f"{author}: {', '.join(held) if len(held) else 'no roles recorded'}.\n"
+
+
+def write_stream(chunks, handle):
+	# Writes text chunks to a binary file-like object without joining them first
+	for chunk in chunks:
+		handle.write(chunk.encode('utf-8'))
+	return handle
@@ -0,0 +1,308 @@
+import argparse
+import functools
+import io
+import sys
+import threading
+import time
+import weakref
+
+import matplotlib
+import matplotlib.dates as mdates
+import numpy as np
+import pandas as pd
+from matplotlib.collections import PolyCollection
+from matplotlib.figure import Figure
+from matplotlib.patches import Patch
+from PIL import Image
+
+from publishing_guide import telemetry
+
+# Figures are built with matplotlib's object API rather than pyplot: nothing is registered in
+# pyplot's global figure list (so batch jobs creating thousands of charts do not leak them),
+# no GUI backend is selected, and figures can be built from several threads at once.
+
+RENDER_SECONDS = telemetry.histogram('publishing_guide_chart_render_seconds', "Time to build a chart figure", ['chart'])
+# Figures built here that have not been garbage-collected yet
+_figures = weakref.WeakSet()
+
+
+def _open_figures():
+	pyplot = sys.modules.get('matplotlib.pyplot')
+	return {('charts',): len(_figures), ('pyplot',): len(pyplot.get_fignums()) if pyplot else 0}
+
+
+telemetry.gauge('publishing_guide_open_figures', "Matplotlib figures still in memory", _open_figures, ['owner'])
+
+
+def _timed(create):
+	name = create.__name__.removeprefix('create_').removesuffix('_chart')
+
+	@functools.wraps(create)
+	def wrapper(*args, **kwargs):
+		with RENDER_SECONDS.time(name):
+			fig = create(*args, **kwargs)
+		_figures.add(fig)
+		return fig
+
+	return wrapper
+
+
+@_timed
+def create_impact_factor_chart():
+	# Sample data for impact factors
+	journals = ['Nature', 'Science', 'Cell', 'PNAS', 'NEJM', 'Field-specific Journal']
+	impact_factors = [49.962, 47.728, 41.582, 11.205, 91.245, 5.5]
+	colors = ['#1f77b4', '#1f77b4', '#1f77b4', '#1f77b4', '#1f77b4', '#ff7f0e']
+
+	fig = Figure(figsize=(10, 6))
+	ax = fig.subplots()
+	bars = ax.bar(journals, impact_factors, color=colors)
+	ax.set_title('Example Impact Factors of Top Journals vs. Field-Specific Journals')
+	ax.set_ylabel('Impact Factor (2023)')
+	ax.set_ylim(0, 100)
+
+	for bar in bars:
+		height = bar.get_height()
+		ax.annotate(f'{height:.1f}',
+					xy=(bar.get_x() + bar.get_width() / 2, height),
+					xytext=(0, 3),
+					textcoords="offset points",
+					ha='center', va='bottom')
+
+	ax.set_xticks(range(len(journals)), journals, rotation=45, ha='right')
+	fig.tight_layout()
+
+	return fig
+
+
+@_timed
+def create_publication_timeline():
+	# Sample data for publication timeline
+	stages = ['Research', 'Writing', 'Journal Selection', 'Submission', 'Initial Review',
+			  'Peer Review', 'Revisions', 'Acceptance', 'Publication']
+	time_weeks = [0, 12, 13, 14, 16, 24, 32, 36, 48]
+
+	fig = Figure(figsize=(12, 6))
+	ax = fig.subplots()
+	ax.plot(time_weeks, range(len(stages)), 'bo-', markersize=10)
+
+	for i, stage in enumerate(stages):
+		ax.annotate(stage, (time_weeks[i], i), xytext=(10, 0),
+					textcoords='offset points', va='center')
+
+	ax.set_yticks([])
+	ax.set_xlabel('Weeks (approximate)')
+	ax.set_title('Typical Timeline of Academic Publication Process')
+	ax.grid(axis='x', linestyle='--', alpha=0.7)
+
+	fig.tight_layout()
+	return fig
+
+
+@_timed
+def create_open_access_chart():
+	labels = ['Gold OA', 'Green OA', 'Hybrid', 'Diamond OA', 'Traditional']
+	sizes = [30, 25, 20, 10, 15]
+	colors = ['#f9d923', '#36AE7C', '#187498', '#4361EE', '#888888']
+	explode = (0.1, 0, 0, 0.1, 0)
+
+	fig = Figure(figsize=(10, 7))
+	ax = fig.subplots()
+	ax.pie(sizes, explode=explode, labels=labels, colors=colors, autopct='%1.1f%%',
+		   shadow=True, startangle=140)
+	ax.set_title('Publication Models in Academic Publishing')
+	ax.axis('equal')
+
+	fig.tight_layout()
+	return fig
+
+
+@_timed
+def create_sentence_length_chart(lengths):
+	from publishing_guide import readability
+
+	fig = Figure(figsize=(6, 4))
+	ax = fig.subplots()
+	ax.bar(range(1, len(lengths) + 1), lengths, color=['#E74C3C' if n > readability.LONG_SENTENCE else '#3498DB' for n in lengths])
+	ax.axhline(readability.LONG_SENTENCE, color='gray', linestyle='--', linewidth=1)
+	ax.set_xlabel('Sentence')
+	ax.set_ylabel('Words')
+	ax.set_title('Sentence Lengths')
+	return fig
+
+
+@_timed
+def create_portfolio_gantt(manuscripts, segments):
+	# Same picture as one broken_barh call per manuscript, but every bar goes into a single
+	# PolyCollection built with array operations, so thousands of manuscripts are one artist
+	from publishing_guide import portfolio
+
+	rows = pd.Series(np.arange(len(manuscripts)), index=manuscripts['id'].to_numpy())
+	y = rows.reindex(segments['manuscript'].to_numpy()).to_numpy(dtype=float)
+	start = mdates.date2num(segments['start'].to_numpy())
+	# Final stages are drawn one day wide so they stay visible
+	end = np.maximum(mdates.date2num(segments['end'].to_numpy()), start + 1)
+	verts = np.empty((len(segments), 4, 2))
+	verts[:, :, 0] = np.column_stack([start, start, end, end])
+	verts[:, :, 1] = np.column_stack([y - 0.4, y + 0.4, y + 0.4, y - 0.4])
+	colors = segments['stage'].map(portfolio.STAGE_COLORS).fillna('#888888').to_numpy()
+
+	fig = Figure(figsize=(12, min(2 + 0.25 * len(manuscripts), 30)))
+	ax = fig.subplots()
+	ax.add_collection(PolyCollection(verts, facecolors=colors, edgecolors='none'))
+	ax.set_xlim(start.min() - 7, end.max() + 7)
+	ax.set_ylim(len(manuscripts) - 0.5, -0.5)
+	ax.xaxis_date()
+	if len(manuscripts) <= 60:
+		ax.set_yticks(np.arange(len(manuscripts)))
+		ax.set_yticklabels(manuscripts['title'].str.slice(0, 40))
+	else:
+		ax.set_yticks([])
+	deadlines = pd.to_datetime(manuscripts['deadline'])
+	has_deadline = deadlines.notna().to_numpy()
+	ax.scatter(mdates.date2num(deadlines[has_deadline].to_numpy()), np.flatnonzero(has_deadline),
+			   marker='|', color='black', s=80, label='Deadline', zorder=3)
+	ax.legend(handles=[Patch(color=color, label=stage) for stage, color in portfolio.STAGE_COLORS.items()],
+			  loc='upper center', bbox_to_anchor=(0.5, -0.08), ncol=4, frameon=False)
+	ax.set_title('Manuscripts by Stage')
+	ax.grid(axis='x', linestyle='--', alpha=0.5)
+	fig.autofmt_xdate()
+	fig.tight_layout()
+	return fig
+
+
+@_timed
+def create_attention_chart(series, title):
+	# Stacked areas of events per period, one layer per event kind or source
+	fig = Figure(figsize=(10, 4))
+	ax = fig.subplots()
+	ax.stackplot(series.index, series.T.to_numpy(), labels=series.columns, alpha=0.8)
+	ax.set_title(title)
+	ax.set_ylabel('Events')
+	ax.legend(loc='upper left')
+	fig.autofmt_xdate()
+	fig.tight_layout()
+	return fig
+
+
+# Encoded charts. SVG keeps simple charts sharp at any zoom and is usually smallest for a
+# handful of bars or wedges; dense charts are rasterised at a resolution matched to the width
+# they are shown at (in device pixels, so 2x for high-density screens), as WebP or a
+# palette PNG, whichever is smaller. Streamlit does not tell the script how wide the browser
+# is, so the width is that of the layout slot the caller draws the chart in: the main column of
+# the wide layout (FULL_WIDTH) or one of two columns (COLUMN_WIDTH), at 2x for dense screens;
+# the browser scales down from there.
+MIME_TYPES = {'svg': 'image/svg+xml', 'png': 'image/png', 'webp': 'image/webp'}
+FULL_WIDTH = 1600
+COLUMN_WIDTH = 800
+MIN_DPI = 72
+MAX_DPI = 200
+CHART_BYTE_BUDGET = 48 * 1024
+MAX_SVG_VERTICES = 5000
+ADAPTIVE_FORMATS = ('svg', 'webp', 'png')
+
+# SVG text stays text (set in the page's sans-serif) instead of one path per glyph, and with
+# fixed ids and no date the same chart always encodes to the same bytes. rc_context swaps
+# matplotlib's global settings for its duration, so SVG encodes from different sessions take
+# turns inside it.
+SVG_RC = {'svg.fonttype': 'none', 'svg.hashsalt': 'publishing-guide'}
+_svg_lock = threading.Lock()
+
+ENCODE_SECONDS = telemetry.histogram('publishing_guide_chart_encode_seconds', "Time to encode a chart", ['format'])
+
+
+def _vertex_count(fig):
+	count = 0
+	for ax in fig.axes:
+		for collection in ax.collections:
+			count += sum(len(path.vertices) for path in collection.get_paths())
+		count += sum(len(patch.get_path().vertices) for patch in ax.patches)
+		count += sum(len(line.get_xydata()) for line in ax.lines)
+	return count
+
+
+def encode_figure(fig, fmt, width=FULL_WIDTH):
+	buffer = io.BytesIO()
+	with ENCODE_SECONDS.time(fmt):
+		if fmt == 'svg':
+			with _svg_lock, matplotlib.rc_context(SVG_RC):
+				fig.savefig(buffer, format='svg', bbox_inches='tight', metadata={'Date': None})
+			return buffer.getvalue()
+		if fmt not in MIME_TYPES:
+			raise ValueError(f"Unknown chart format '{fmt}' (use {', '.join(MIME_TYPES)})")
+		dpi = min(max(width / fig.get_figwidth(), MIN_DPI), MAX_DPI)
+		fig.savefig(buffer, format='png', dpi=dpi, bbox_inches='tight')
+		image = Image.open(buffer).convert('RGB')
+		output = io.BytesIO()
+		if fmt == 'png':
+			# Charts use few colours: a 256-colour palette is visually lossless and several times smaller
+			image.quantize(256, method=Image.Quantize.FASTOCTREE).save(output, format='PNG', optimize=True)
+		else:
+			image.save(output, format='WEBP', quality=85, method=4)
+		return output.getvalue()
+
+
+def encode_adaptive(fig, width=FULL_WIDTH, budget=CHART_BYTE_BUDGET, formats=ADAPTIVE_FORMATS):
+	# SVG when the chart is simple enough to fit the budget, otherwise the smallest raster
+	if 'svg' in formats and _vertex_count(fig) <= MAX_SVG_VERTICES:
+		data = encode_figure(fig, 'svg')
+		if len(data) <= budget or formats == ('svg',):
+			return 'svg', data
+	rasters = [(fmt, encode_figure(fig, fmt, width)) for fmt in formats if fmt != 'svg']
+	return min(rasters, key=lambda encoded: len(encoded[1]))
+
+
+# Charts drawn from a few hashable arguments, encoded once per process for each width (the
+# static ones by the warm-up, before the first visitor)
+STATIC_CHARTS = {
+	'impact_factor': create_impact_factor_chart,
+	'publication_timeline': create_publication_timeline,
+	'open_access': create_open_access_chart,
+}
+CACHED_CHARTS = {**STATIC_CHARTS, 'sentence_length': create_sentence_length_chart}
+
+
+@functools.lru_cache(maxsize=256)
+def chart_image(name, width=FULL_WIDTH, *args):
+	return encode_adaptive(CACHED_CHARTS[name](*args), width)
+
+
+telemetry.watch_lru_cache('chart_images', chart_image)
+
+
+def benchmark(widths=(COLUMN_WIDTH, FULL_WIDTH), repeat=3):
+	# Bytes and best-of-`repeat` encode time for every static chart, format and width
+	rows = []
+	for name, create in STATIC_CHARTS.items():
+		fig = create()
+		for fmt in MIME_TYPES:
+			for width in (widths if fmt != 'svg' else widths[:1]):
+				timings = []
+				for _ in range(repeat):
+					started = time.perf_counter()
+					data = encode_figure(fig, fmt, width)
+					timings.append(time.perf_counter() - started)
+				rows.append({
+					'chart': name, 'format': fmt, 'width': width if fmt != 'svg' else None,
+					'bytes': len(data), 'encode_ms': round(min(timings) * 1000, 1),
+				})
+		started = time.perf_counter()
+		fmt, data = encode_adaptive(fig)
+		rows.append({
+			'chart': name, 'format': f'adaptive ({fmt})', 'width': FULL_WIDTH,
+			'bytes': len(data), 'encode_ms': round((time.perf_counter() - started) * 1000, 1),
+		})
+	return pd.DataFrame(rows).astype({'width': 'Int64'})
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Compare chart encodings: bytes and encode time per format and width.")
+	parser.add_argument('--width', type=int, action='append', help="Display width in device pixels (repeatable)")
+	parser.add_argument('--repeat', type=int, default=3)
+	args = parser.parse_args(argv)
+
+	print(benchmark(tuple(args.width or (COLUMN_WIDTH, FULL_WIDTH)), args.repeat).to_string(index=False))
+
+
+if __name__ == '__main__':
+	main()
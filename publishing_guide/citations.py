@@ -0,0 +1,143 @@
+import datetime
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 250_000
+METRIC_COLUMNS = ['papers', 'citations', 'h_index', 'g_index', 'i10_index', 'first_year', 'm_quotient']
+METRIC_DTYPES = {
+	'papers': np.int64, 'citations': np.int64, 'h_index': np.int64, 'g_index': np.int64, 'i10_index': np.int64,
+	'first_year': np.float64, 'm_quotient': np.float64,
+}
+
+
+def read_citation_export(source, chunksize=CHUNK_ROWS, author_separator=';'):
+	# Streams (author, paper, citations, year) chunks out of a CSV export. Rows without a
+	# 'citations' column count as one citation each; multi-author rows are split on `author_separator`.
+	for chunk in pd.read_csv(source, chunksize=chunksize, dtype={'author': str, 'paper': str}):
+		chunk.columns = [column.strip().lower() for column in chunk.columns]
+		missing = {'author', 'paper'} - set(chunk.columns)
+		if missing:
+			raise ValueError(f"Citation export is missing column(s): {', '.join(sorted(missing))}")
+		if 'citations' not in chunk:
+			chunk['citations'] = 1
+		if 'year' not in chunk:
+			chunk['year'] = np.nan
+		chunk = chunk[['author', 'paper', 'citations', 'year']].dropna(subset=['author', 'paper'])
+		if author_separator and chunk['author'].str.contains(author_separator, regex=False).any():
+			chunk = chunk.assign(author=chunk['author'].str.split(author_separator)).explode('author')
+		chunk['author'] = chunk['author'].str.strip()
+		chunk['citations'] = pd.to_numeric(chunk['citations'], errors='coerce').fillna(0)
+		chunk['year'] = pd.to_numeric(chunk['year'], errors='coerce')
+		yield chunk[chunk['author'] != '']
+
+
+def _score(author_codes, citations):
+	# Scores every author in one pass: a lexsort puts each author's papers in descending order,
+	# then ranks and within-author cumulative sums give h, g and i10 without a loop per author
+	authors, codes = np.unique(author_codes, return_inverse=True)
+	order = np.lexsort((-citations, codes))
+	codes = codes[order]
+	sorted_citations = citations[order]
+	papers = np.bincount(codes, minlength=len(authors))
+	group_start = np.concatenate(([0], np.cumsum(papers)[:-1]))
+	rank = np.arange(len(codes)) - group_start[codes] + 1
+
+	running = np.cumsum(sorted_citations)
+	cumulative = running - np.concatenate(([0.0], running))[group_start][codes]
+
+	def per_author(values):
+		return np.bincount(codes, weights=values, minlength=len(authors)).astype(np.int64)
+
+	return authors, {
+		'papers': papers,
+		'citations': per_author(sorted_citations),
+		'h_index': per_author(sorted_citations >= rank),
+		'g_index': per_author(cumulative >= rank.astype(np.float64) ** 2),
+		'i10_index': per_author(sorted_citations >= 10),
+	}
+
+
+# Running per-(author, paper) citation totals, kept as sorted int64 keys (author id in the
+# high 32 bits) so each author's papers are contiguous. Appended rows are merged with a
+# searchsorted and only the authors they touch are rescored.
+class CitationLedger:
+	def __init__(self, current_year=None):
+		self.current_year = current_year or datetime.date.today().year
+		self._authors = pd.Index([], dtype=object)
+		self._papers = pd.Index([], dtype=object)
+		self._keys = np.empty(0, dtype=np.int64)
+		self._citations = np.empty(0, dtype=np.float64)
+		self._first_years = np.empty(0, dtype=np.float64)
+		self._pending = []
+		self._metrics = pd.DataFrame(
+			{column: pd.Series(dtype=METRIC_DTYPES[column]) for column in METRIC_COLUMNS},
+			index=pd.Index([], dtype=object, name='author'))
+		self.rows_ingested = 0
+
+	def _encode(self, attribute, values):
+		index = getattr(self, attribute)
+		codes = index.get_indexer(values)
+		new = codes < 0
+		if new.any():
+			index = index.append(pd.Index(pd.unique(values[new])))
+			setattr(self, attribute, index)
+			codes[new] = index.get_indexer(values[new])
+		return codes.astype(np.int64)
+
+	def add_chunk(self, chunk):
+		author_codes = self._encode('_authors', chunk['author'].to_numpy(dtype=object))
+		paper_codes = self._encode('_papers', chunk['paper'].to_numpy(dtype=object))
+		keys, inverse = np.unique((author_codes << 32) | paper_codes, return_inverse=True)
+		self._pending.append((keys, np.bincount(inverse, weights=chunk['citations'].to_numpy(dtype=np.float64))))
+
+		years = np.full(len(self._authors), np.nan)
+		np.fmin.at(years, author_codes, chunk['year'].to_numpy(dtype=np.float64))
+		grown = np.full(len(self._authors), np.nan)
+		grown[:len(self._first_years)] = self._first_years
+		self._first_years = np.fmin(grown, years)
+		self.rows_ingested += len(chunk)
+
+	def ingest(self, source, chunksize=CHUNK_ROWS, progress=None):
+		# A file is added whole or not at all: if reading it fails partway, the chunks already
+		# staged are dropped, so ingesting the file again never counts their rows twice. (The
+		# indexes and arrays below are only ever replaced, never changed in place.)
+		state = (self._authors, self._papers, self._first_years, len(self._pending), self.rows_ingested)
+		try:
+			for chunk in read_citation_export(source, chunksize=chunksize):
+				self.add_chunk(chunk)
+				if progress is not None:
+					progress(self.rows_ingested)
+		except BaseException:
+			self._authors, self._papers, self._first_years, staged, self.rows_ingested = state
+			del self._pending[staged:]
+			raise
+		return self
+
+	def _merge_pending(self):
+		keys, inverse = np.unique(np.concatenate([keys for keys, _ in self._pending]), return_inverse=True)
+		sums = np.bincount(inverse, weights=np.concatenate([sums for _, sums in self._pending]))
+		self._pending = []
+
+		positions = np.searchsorted(self._keys, keys)
+		found = positions < len(self._keys)
+		found[found] = self._keys[positions[found]] == keys[found]
+		self._citations[positions[found]] += sums[found]
+		self._keys = np.insert(self._keys, positions[~found], keys[~found])
+		self._citations = np.insert(self._citations, positions[~found], sums[~found])
+		return np.unique(keys >> 32)
+
+	def metrics(self):
+		touched = self._merge_pending() if self._pending else []
+		if len(touched):
+			starts = np.searchsorted(self._keys, touched << 32)
+			ends = np.searchsorted(self._keys, (touched + 1) << 32)
+			rows = np.concatenate([np.arange(start, end) for start, end in zip(starts, ends)])
+
+			author_codes, scores = _score(self._keys[rows] >> 32, self._citations[rows])
+			rescored = pd.DataFrame(scores, index=pd.Index(self._authors[author_codes], name='author'))
+			rescored['first_year'] = self._first_years[author_codes]
+			career_years = np.clip(self.current_year - rescored['first_year'] + 1, 1, None)
+			rescored['m_quotient'] = (rescored['h_index'] / career_years).round(2)
+			self._metrics = pd.concat([self._metrics.drop(rescored.index, errors='ignore'), rescored[METRIC_COLUMNS]])
+		return self._metrics.sort_index()
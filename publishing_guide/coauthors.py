@@ -0,0 +1,239 @@
+import numpy as np
+import pandas as pd
+
+from publishing_guide.citations import CHUNK_ROWS, read_citation_export
+
+# Papers with more authors than this (consortium papers) say little about who actually works
+# together and would add O(n^2) edges each, so they are left out of the graph
+MAX_AUTHORS_PER_PAPER = 50
+BETWEENNESS_SAMPLES = 32
+LABEL_PROPAGATION_ROUNDS = 20
+
+
+def _expand(indptr, nodes):
+	# Positions in the CSR arrays of every neighbour entry of `nodes`, plus the owning node of each
+	starts = indptr[nodes]
+	counts = indptr[nodes + 1] - starts
+	shift = np.repeat(np.cumsum(counts) - counts - starts, counts)
+	return np.arange(len(shift)) - shift, np.repeat(nodes, counts)
+
+
+def _group_sum(keys, values):
+	# Sorted distinct keys and the sum of values for each
+	order = np.argsort(keys)
+	keys = keys[order]
+	starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]]) if len(keys) else np.empty(0, dtype=np.int64)
+	return keys[starts], np.add.reduceat(values[order].astype(np.float64), starts) if len(keys) else np.empty(0)
+
+
+# Undirected weighted co-authorship graph in CSR form: the collaborators of author i are
+# indices[indptr[i]:indptr[i + 1]], with Newman's weighting (each paper with n authors adds
+# 1 / (n - 1) to every pair). Derived measures are computed on first use and cached.
+class CoauthorGraph:
+	def __init__(self, authors, indptr, indices, weights, papers):
+		self.authors = authors
+		self.indptr = indptr
+		self.indices = indices
+		self.weights = weights
+		self.papers = papers
+		self._cache = {}
+
+	def __len__(self):
+		return len(self.authors)
+
+	@property
+	def edge_count(self):
+		return len(self.indices) // 2
+
+	@classmethod
+	def from_pairs(cls, author_names, paper_ids, max_authors=MAX_AUTHORS_PER_PAPER):
+		frame = pd.DataFrame({'author': author_names, 'paper': paper_ids}).drop_duplicates()
+		author_codes, authors = pd.factorize(frame['author'])
+		paper_codes, _ = pd.factorize(frame['paper'])
+		n = len(authors)
+		papers = np.bincount(author_codes, minlength=n)
+
+		order = np.argsort(paper_codes, kind='stable')
+		author_codes, paper_codes = author_codes[order].astype(np.int64), paper_codes[order]
+		team = np.bincount(paper_codes)
+		keep = (team[paper_codes] >= 2) & (team[paper_codes] <= max_authors)
+		author_codes, paper_codes = author_codes[keep], paper_codes[keep]
+		pair_weight = 1.0 / (team[paper_codes] - 1)
+
+		# Rows of one paper are contiguous, so every co-author pair is (row, row + offset) for
+		# some offset below the team size: one vectorised pass per offset
+		sources, targets, weights = [], [], []
+		for offset in range(1, min(max_authors, int(team.max(initial=1)))):
+			same = paper_codes[offset:] == paper_codes[:-offset]
+			if not same.any():
+				break
+			sources.append(author_codes[:-offset][same])
+			targets.append(author_codes[offset:][same])
+			weights.append(pair_weight[offset:][same])
+		if sources:
+			u, v, w = np.concatenate(sources), np.concatenate(targets), np.concatenate(weights)
+		else:
+			u = v = np.empty(0, dtype=np.int64)
+			w = np.empty(0)
+		low, high = np.minimum(u, v), np.maximum(u, v)
+		edges, edge_weights = _group_sum(low * n + high, w)
+		low, high = edges // n, edges % n
+
+		# Both directions, sorted by source, as int32 CSR
+		source = np.concatenate([low, high])
+		target = np.concatenate([high, low])
+		weight = np.concatenate([edge_weights, edge_weights])
+		order = np.lexsort((target, source))
+		indptr = np.zeros(n + 1, dtype=np.int64)
+		np.cumsum(np.bincount(source, minlength=n), out=indptr[1:])
+		return cls(
+			pd.Index(authors), indptr, target[order].astype(np.int32), weight[order].astype(np.float32), papers)
+
+	@classmethod
+	def read_csv(cls, source, chunksize=CHUNK_ROWS, max_authors=MAX_AUTHORS_PER_PAPER, progress=None):
+		# Same export format as the citation calculator: `author` (';'-separated) and `paper`
+		names, papers = [], []
+		rows = 0
+		for chunk in read_citation_export(source, chunksize=chunksize):
+			names.append(chunk['author'].to_numpy(dtype=object))
+			papers.append(chunk['paper'].to_numpy(dtype=object))
+			rows += len(chunk)
+			if progress is not None:
+				progress(rows)
+		if not names:
+			raise ValueError("The publication export has no rows")
+		return cls.from_pairs(np.concatenate(names), np.concatenate(papers), max_authors)
+
+	def _cached(self, key, compute):
+		if key not in self._cache:
+			self._cache[key] = compute()
+		return self._cache[key]
+
+	def degree(self):
+		return np.diff(self.indptr)
+
+	def strength(self):
+		return self._cached('strength', lambda: np.bincount(
+			np.repeat(np.arange(len(self)), self.degree()), weights=self.weights, minlength=len(self)))
+
+	def _brandes(self, source, betweenness):
+		# Unweighted shortest paths from one source, one BFS level at a time with array
+		# operations, then Brandes' dependency accumulation back up the levels
+		n = len(self)
+		distance = np.full(n, -1, dtype=np.int32)
+		sigma = np.zeros(n)
+		distance[source], sigma[source] = 0, 1.0
+		frontier = np.array([source], dtype=np.int64)
+		levels = []
+		depth = 0
+		while len(frontier):
+			positions, parents = _expand(self.indptr, frontier)
+			children = self.indices[positions]
+			unseen = distance[children] < 0
+			distance[children[unseen]] = depth + 1
+			on_path = distance[children] == depth + 1
+			parents, children = parents[on_path], children[on_path]
+			if not len(children):
+				break
+			# Path counts into the next level; bincount over all authors is cheaper than sorting
+			sigma += np.bincount(children, weights=sigma[parents], minlength=n)
+			levels.append((parents, children))
+			frontier = np.flatnonzero(distance == depth + 1) if len(children) > n // 8 else np.unique(children)
+			depth += 1
+
+		delta = np.zeros(n)
+		for parents, children in reversed(levels):
+			delta += np.bincount(parents, weights=sigma[parents] / sigma[children] * (1 + delta[children]), minlength=n)
+		delta[source] = 0
+		betweenness += delta
+
+	def betweenness(self, samples=BETWEENNESS_SAMPLES, seed=0):
+		# Brandes from a random sample of sources, scaled up to estimate the exact values
+		# (normalised to the share of shortest paths through each author)
+		def compute():
+			n = len(self)
+			if n < 3:
+				return np.zeros(n)
+			sources = np.random.default_rng(seed).choice(n, size=min(samples, n), replace=False)
+			betweenness = np.zeros(n)
+			for source in sources:
+				self._brandes(int(source), betweenness)
+			return betweenness * (n / len(sources)) / ((n - 1) * (n - 2))
+		return self._cached(('betweenness', samples, seed), compute)
+
+	def communities(self, rounds=LABEL_PROPAGATION_ROUNDS, seed=0):
+		# Weighted label propagation. Each round a random half of the active authors adopts the
+		# label with the largest total edge weight among their collaborators (keeping their own
+		# on ties; updating only half avoids the oscillation of fully synchronous updates). Only
+		# authors next to a change stay active, so late rounds touch a small part of the graph.
+		# Returns dense community ids.
+		def compute():
+			n = len(self)
+			rng = np.random.default_rng(seed)
+			labels = np.arange(n, dtype=np.int64)
+			active = np.flatnonzero(self.degree() > 0)
+			for _ in range(rounds):
+				if not len(active):
+					break
+				positions, owners = _expand(self.indptr, active)
+				keys, totals = _group_sum(owners * n + labels[self.indices[positions]], self.weights[positions])
+				nodes, candidates = keys // n, keys % n
+				starts = np.flatnonzero(np.r_[True, nodes[1:] != nodes[:-1]])
+				best = np.repeat(np.maximum.reduceat(totals, starts), np.diff(np.r_[starts, len(nodes)]))
+				is_best = totals >= best
+				keeps = np.zeros(n, dtype=bool)
+				keeps[nodes[is_best & (candidates == labels[nodes])]] = True
+				# Otherwise the first (smallest) best label of each author
+				picks = np.flatnonzero(is_best & ~keeps[nodes])
+				picks = picks[np.r_[True, nodes[picks][1:] != nodes[picks][:-1]]] if len(picks) else picks
+				wanting, wanted = nodes[picks], candidates[picks]
+				update = rng.random(len(wanting)) < 0.5
+				changed = wanting[update]
+				labels[changed] = wanted[update]
+				if not len(changed):
+					active = wanting
+					continue
+				positions, _ = _expand(self.indptr, changed)
+				marked = np.zeros(n, dtype=bool)
+				marked[self.indices[positions]] = True
+				marked[wanting[~update]] = True
+				active = np.flatnonzero(marked)
+			return pd.factorize(labels)[0]
+		return self._cached(('communities', rounds, seed), compute)
+
+	def summary(self, betweenness_samples=BETWEENNESS_SAMPLES):
+		communities = self.communities()
+		sizes = np.bincount(communities)
+		return pd.DataFrame({
+			'papers': self.papers,
+			'collaborators': self.degree(),
+			'collaboration_strength': self.strength().round(2),
+			'betweenness': self.betweenness(betweenness_samples),
+			'community': communities,
+			'community_size': sizes[communities],
+		}, index=pd.Index(self.authors, name='author'))
+
+	def suggest_collaborators(self, author, k=10):
+		# Friends-of-friends ranked by Adamic-Adar: shared collaborators count for more the
+		# fewer collaborators they have themselves
+		position = self.authors.get_indexer([author])[0]
+		if position < 0:
+			raise KeyError(author)
+		degree = self.degree()
+		neighbours = self.indices[self.indptr[position]:self.indptr[position + 1]].astype(np.int64)
+		if not len(neighbours):
+			return pd.DataFrame(columns=['author', 'score', 'shared_collaborators', 'same_community'])
+		positions, via = _expand(self.indptr, neighbours)
+		candidates = self.indices[positions].astype(np.int64)
+		fresh = ~np.isin(candidates, neighbours) & (candidates != position)
+		candidates, via = candidates[fresh], via[fresh]
+		nodes, scores = _group_sum(candidates, 1 / np.log(np.maximum(degree[via], 2)))
+		shared = np.bincount(np.searchsorted(nodes, candidates), minlength=len(nodes))
+		top = np.argsort(-scores, kind='stable')[:k]
+		communities = self.communities()
+		return pd.DataFrame({
+			'author': self.authors[nodes[top]],
+			'score': scores[top].round(3),
+			'shared_collaborators': shared[top],
+			'same_community': communities[nodes[top]] == communities[position],
+		})
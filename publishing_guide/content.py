@@ -0,0 +1,350 @@
+# Text and reference data shown by the app. Plain Python literals only, so importing this
+# module costs nothing and needs no third-party packages.
+
+PAGE_CSS = """
+<style>
+    .main-header {
+        font-size: 2.5rem;
+        color: #1E3A8A;
+        text-align: center;
+        margin-bottom: 1rem;
+    }
+    .sub-header {
+        font-size: 1.8rem;
+        color: #2563EB;
+        margin-top: 2rem;
+        margin-bottom: 1rem;
+    }
+    .topic-header {
+        font-size: 1.4rem;
+        color: #3B82F6;
+        margin-top: 1.5rem;
+        margin-bottom: 0.5rem;
+    }
+    .highlight {
+        background-color: #DBEAFE;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .warning {
+        background-color: #FEF2F2;
+        color: #B91C1C;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .success {
+        background-color: #ECFDF5;
+        color: #065F46;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        margin-bottom: 1rem;
+    }
+    .footnote {
+        font-size: 0.8rem;
+        color: #6B7280;
+        font-style: italic;
+    }
+</style>
+"""
+
+# Sidebar navigation, in reading order
+PAGES = [
+	"Introduction to Academic Publishing",
+	"Types of Publications",
+	"Types of Journals",
+	"Understanding Journal Metrics",
+	"Access Models: Open Access & Subscriptions",
+	"The Publication Process",
+	"Writing Your Research Paper",
+	"Submission & Peer Review",
+	"Predatory Journals: Warning Signs",
+	"Publishing Ethics",
+	"After Publication: Promotion & Impact"
+]
+
+
+# Publication formats, shared by the Types of Publications page and the manuscript length checker
+PUBLICATION_TYPES = {
+	"Original Research Articles": {
+		"description": "Present new, unpublished research, including methodology, results, and discussions",
+		"typical_length": "4,000-8,000 words",
+		"review_process": "Full peer review",
+		"example": "Smith et al. (2023) 'Novel approaches to quantum computing in environmental science', Nature",
+		"suitable_for": "Completed research projects with substantial findings"
+	},
+	"Review Articles": {
+		"description": "Synthesize and analyze existing research on a specific topic",
+		"typical_length": "6,000-10,000 words",
+		"review_process": "Full peer review",
+		"example": "Johnson & Garcia (2022) 'A decade of progress in CRISPR gene editing: A comprehensive review', Annual Review of Genetics",
+		"suitable_for": "Researchers with broad knowledge of a field wanting to provide an overview"
+	},
+	"Short Communications/Letters": {
+		"description": "Brief reports of significant, novel findings that warrant rapid publication",
+		"typical_length": "1,500-3,000 words",
+		"review_process": "Expedited peer review",
+		"example": "Chen et al. (2024) 'Rapid detection of viral mutations using AI algorithms', Science",
+		"suitable_for": "Time-sensitive findings or preliminary results of high importance"
+	},
+	"Case Studies/Reports": {
+		"description": "Detailed analysis of specific instances, patients, or phenomena",
+		"typical_length": "2,000-4,000 words",
+		"review_process": "Peer review",
+		"example": "Patel & Williams (2023) 'Management of rare neurological disorder: A case study', The Lancet Neurology",
+		"suitable_for": "Clinical observations, unique cases, or specific implementations"
+	},
+	"Methodological Papers": {
+		"description": "Present new experimental or computational methods, tests, or procedures",
+		"typical_length": "3,000-6,000 words",
+		"review_process": "Peer review with technical focus",
+		"example": "Martinez et al. (2024) 'A novel approach for single-cell RNA sequencing in limited samples', Nature Methods",
+		"suitable_for": "Researchers who have developed innovative techniques or improvements"
+	},
+	"Book Chapters": {
+		"description": "Contributions to edited volumes focusing on specific aspects of a broader topic",
+		"typical_length": "5,000-10,000 words",
+		"review_process": "Editor review, sometimes peer review",
+		"example": "Wilson (2023) 'Climate change impacts on urban infrastructure' in 'Climate Adaptation in Cities'",
+		"suitable_for": "Established researchers invited to contribute specialized knowledge"
+	},
+	"Conference Papers/Proceedings": {
+		"description": "Research presented at academic conferences, published in proceedings",
+		"typical_length": "2,000-5,000 words",
+		"review_process": "Varies (abstract review to full peer review)",
+		"example": "Rodriguez & Kim (2024) 'Machine learning for predicting protein structures', Proceedings of the 10th AI Conference",
+		"suitable_for": "Work in progress or completed research to be presented to peers"
+	},
+	"Commentaries/Perspectives": {
+		"description": "Expert opinions or insights on current issues, trends, or published research",
+		"typical_length": "1,000-3,000 words",
+		"review_process": "Editorial review",
+		"example": "Taylor (2023) 'The future of renewable energy policy', Energy Policy",
+		"suitable_for": "Experienced researchers offering context or opinion on important topics"
+	},
+	"Preprints": {
+		"description": "Preliminary versions of research papers shared before formal peer review",
+		"typical_length": "Varies by field",
+		"review_process": "No formal peer review",
+		"example": "Li et al. (2024) 'Preliminary evidence for exoplanet atmospheric composition', arXiv",
+		"suitable_for": "Researchers seeking early feedback or establishing priority"
+	}
+}
+
+
+# Journal metrics explained on the Understanding Journal Metrics page
+JOURNAL_METRICS = {
+	"Impact Factor (IF)": {
+		"description": "Average number of citations received per paper published in that journal during the two preceding years",
+		"publisher": "Clarivate Analytics (Web of Science)",
+		"strengths": "Widely recognized, long-established, simple to understand",
+		"limitations": "Can be manipulated, field-dependent, affected by outliers, short citation window",
+		"example": "Nature (2023): 49.962, NEJM (2023): 91.245"
+	},
+	"CiteScore": {
+		"description": "Similar to Impact Factor but counts citations over 4 years instead of 2",
+		"publisher": "Elsevier (Scopus)",
+		"strengths": "Larger citation window reduces annual fluctuations, covers more journals than IF",
+		"limitations": "Still field-dependent, can be influenced by self-citation practices",
+		"example": "Nature (2023): 45.3, Lancet (2023): 63.2"
+	},
+	"SCImago Journal Rank (SJR)": {
+		"description": "Measures weighted citations based on the prestige of the citing journal",
+		"publisher": "SCImago Lab (Scopus data)",
+		"strengths": "Considers citation quality not just quantity, mitigates field differences",
+		"limitations": "More complex to calculate and understand, less widely used",
+		"example": "Cell (2023): 13.48, JAMA (2023): 8.56"
+	},
+	"Source Normalized Impact per Paper (SNIP)": {
+		"description": "Measures contextual citation impact by weighting citations based on the total number of citations in a subject field",
+		"publisher": "CWTS (Leiden University)",
+		"strengths": "Normalizes for differences in citation practices between fields",
+		"limitations": "Complex methodology, less intuitive than simple ratios",
+		"example": "Science (2023): 7.52, Nature Materials (2023): 6.48"
+	},
+	"h-index for journals": {
+		"description": "A journal has an h-index of h if h of its papers have been cited at least h times",
+		"publisher": "Various",
+		"strengths": "Captures both productivity and citation impact, resistant to outliers",
+		"limitations": "Size-dependent, favors older journals, cumulative measure that always increases",
+		"example": "Nature (cumulative): 1120, Science (cumulative): 1089"
+	},
+	"Eigenfactor": {
+		"description": "Rates the total importance of a journal based on citations with a 5-year window, similar to Google's PageRank algorithm",
+		"publisher": "University of Washington",
+		"strengths": "Eliminates self-citations, accounts for prestige of citing journals, normalizes for field",
+		"limitations": "Complex algorithm less transparent to users",
+		"example": "Nature (2023): 1.56, Cell (2023): 0.67"
+	},
+	"Acceptance Rate": {
+		"description": "Percentage of submitted manuscripts that are accepted for publication",
+		"publisher": "Journals themselves (not always disclosed)",
+		"strengths": "Direct measure of selectivity and competition",
+		"limitations": "Not standardized, not consistently reported, affected by submission volume",
+		"example": "Science: ~7%, PLOS ONE: ~50%"
+	}
+}
+
+
+# IMRaD sections with guidance and an example for each (the example title and abstract seed the readability scorer)
+PAPER_SECTIONS = {
+	"Title": {
+		"purpose": "Concisely describe the paper's content and attract readers",
+		"tips": "Be specific, include key concepts, avoid jargon, keep under 15 words if possible",
+		"example": "CRISPR-Cas9 Gene Editing Reverses Antibiotic Resistance in Pathogenic E. coli Strains",
+		"common_mistakes": "Too vague, too technical, too long, or using unnecessary words like 'A study of...'"
+	},
+	"Abstract": {
+		"purpose": "Summarize the entire paper in a single paragraph",
+		"tips": "Include background, objective, methods, results, and conclusion in 150-300 words",
+		"example": "Antibiotic resistance poses a global health threat. Here we demonstrate that CRISPR-Cas9 gene editing can effectively reverse resistance to ampicillin in E. coli strains by targeting the beta-lactamase gene. We developed a modified delivery system using bacteriophage vectors that achieved 87% editing efficiency in vitro and 64% in mouse models. Treated bacterial populations showed renewed susceptibility to ampicillin treatment with MIC values comparable to non-resistant strains. These results demonstrate a potential strategy for combating antibiotic resistance in clinical settings.",
+		"common_mistakes": "Including too much detail, omitting key results, using undefined abbreviations, exceeding word limits"
+	},
+	"Introduction": {
+		"purpose": "Provide context, establish importance, and state research questions",
+		"tips": "Move from broad field to specific gap, clearly state objectives at the end",
+		"example": "Starting with the global problem of antibiotic resistance, narrowing to beta-lactam resistance mechanisms, identifying the specific gap in reversing established resistance, then stating the specific objective to use CRISPR-Cas9 to target resistance genes",
+		"common_mistakes": "Too long/short, failing to justify importance, unclear research question, excessive literature review"
+	},
+	"Methods": {
+		"purpose": "Describe how the research was conducted with enough detail for replication",
+		"tips": "Use subheadings, provide specific details of materials, procedures, and analyses",
+		"example": "Detailed sections on bacterial strain selection, CRISPR-Cas9 construct design, bacteriophage vector preparation, transfection protocols, and statistical analysis approaches",
+		"common_mistakes": "Insufficient detail for replication, excessive detail on standard procedures, poor organization, omitting statistical methods"
+	},
+	"Results": {
+		"purpose": "Present findings without interpretation",
+		"tips": "Use clear figures and tables, highlight key findings, organize logically",
+		"example": "Presenting editing efficiency data, antibiotic susceptibility testing results, and in vivo efficacy findings with appropriate statistical analyses and clear figures",
+		"common_mistakes": "Interpreting results (save for discussion), presenting raw data without analysis, poor figure design, redundant presentation"
+	},
+	"Discussion": {
+		"purpose": "Interpret results, place in context, address limitations, and suggest implications",
+		"tips": "Begin with key findings summary, compare with existing literature, acknowledge limitations, suggest applications",
+		"example": "Interpreting the significance of achieved editing efficiency, comparing with other approaches to combat resistance, discussing delivery challenges, addressing potential for resistance to the CRISPR system itself, and suggesting clinical applications",
+		"common_mistakes": "Simply repeating results, overinterpreting findings, ignoring limitations, making claims beyond the data"
+	},
+	"Conclusion": {
+		"purpose": "Summarize key findings and their importance",
+		"tips": "Brief, impactful, focuses on contribution to the field",
+		"example": "This work demonstrates that CRISPR-Cas9 gene editing can effectively reverse established antibiotic resistance in pathogenic bacteria, offering a potential new approach to address this critical public health challenge.",
+		"common_mistakes": "Introducing new information, being too vague, merely repeating the abstract"
+	},
+	"References": {
+		"purpose": "Acknowledge sources and provide evidence",
+		"tips": "Follow journal-specific format exactly, ensure all citations are included",
+		"example": "Comprehensive list of relevant literature formatted according to journal requirements (e.g., APA, Vancouver, Harvard styles)",
+		"common_mistakes": "Formatting inconsistencies, missing citations, excessive self-citation, outdated sources"
+	}
+}
+
+
+# Peer review models compared on the Submission & Peer Review page
+PEER_REVIEW_TYPES = {
+	"Single-blind": {
+		"description": "Reviewers know authors' identities, but authors don't know reviewers",
+		"advantages": "Reviewers can assess based on authors' previous work and reputation",
+		"disadvantages": "Potential bias based on author's institution, nationality, or reputation",
+		"common in": "Many traditional journals across disciplines"
+	},
+	"Double-blind": {
+		"description": "Neither reviewers nor authors know each other's identities",
+		"advantages": "Reduces potential bias based on author characteristics",
+		"disadvantages": "Authors can sometimes be identified by self-citations or specific methods",
+		"common in": "Social sciences, humanities, some medical journals"
+	},
+	"Open peer review": {
+		"description": "Reviewer and author identities are disclosed to each other",
+		"advantages": "Transparency, accountability, potential for more constructive feedback",
+		"disadvantages": "Junior reviewers may be hesitant to criticize senior authors",
+		"common in": "BMJ, BioMed Central journals, growing trend in scientific publishing"
+	},
+	"Transparent peer review": {
+		"description": "Review reports are published alongside the article (with or without reviewer names)",
+		"advantages": "Shows the development of the paper, allows evaluation of review quality",
+		"disadvantages": "May make reviewers more cautious in their critiques",
+		"common in": "Nature Communications, EMBO journals, PeerJ"
+	},
+	"Collaborative peer review": {
+		"description": "Reviewers interact with each other, sometimes with authors, during the review process",
+		"advantages": "Allows discussion and consensus-building among reviewers",
+		"disadvantages": "More time-consuming, potential for dominant personalities to influence",
+		"common in": "eLife, F1000Research"
+	},
+	"Post-publication peer review": {
+		"description": "Articles are published first, then openly reviewed and discussed",
+		"advantages": "Rapid publication, community involvement in evaluation",
+		"disadvantages": "Potential damage if significant flaws discovered after publication",
+		"common in": "F1000Research, ScienceOpen, PubPeer comments"
+	}
+}
+
+
+# Editorial decisions and what each one means for the author
+EDITORIAL_DECISIONS = {
+	"Accept": "Paper is accepted as is or with minimal copyediting changes. Very rare for first submissions.",
+	"Minor Revisions": "Paper is provisionally accepted pending small changes. Typically doesn't require full re-review.",
+	"Major Revisions": "Substantial changes needed but editors see potential. Will require thorough re-review.",
+	"Reject and Resubmit": "Current version rejected but a substantially revised version would be considered as a new submission.",
+	"Reject": "Paper is not suitable for the journal. May be due to quality issues or lack of fit with journal scope."
+}
+
+
+# Red flags of predatory journals, grouped by category
+WARNING_CATEGORIES = [
+	"Communication and Solicitation",
+	"Website and Presentation",
+	"Editorial Board and Peer Review",
+	"Publication Metrics and Indexing",
+	"Fees and Transparency",
+	"Content and Quality"
+]
+
+WARNING_SIGNS = {
+	"Communication and Solicitation": [
+		"Unsolicited emails with effusive praise for your previous work",
+		"Promises of rapid peer review (e.g., 'decision in 1 week')",
+		"Invitations to submit to journals outside your field of expertise",
+		"Poor grammar and spelling in communications",
+		"Overly flattering or personal tone in solicitation emails"
+	],
+	"Website and Presentation": [
+		"Poorly designed, unprofessional website with broken links",
+		"Spelling and grammatical errors throughout the site",
+		"Mixing different scientific fields without clear sections",
+		"Missing or vague contact information (e.g., no physical address)",
+		"Journal name mimicking a well-established journal",
+		"Use of terms like 'International', 'Global', or 'World' to seem legitimate"
+	],
+	"Editorial Board and Peer Review": [
+		"Editorial board members not listed or with no affiliations",
+		"Board members listed without their knowledge or permission",
+		"No information about the peer review process",
+		"Extremely brief peer review timeframes (days rather than weeks)",
+		"Single person serving as editor for multiple journals",
+		"No expertise in the field evident among editors"
+	],
+	"Publication Metrics and Indexing": [
+		"False claims about impact factor or invented metrics",
+		"Claims of indexing in major databases that cannot be verified",
+		'Using misleading metrics (e.g., "Journal Impact Factor" instead of official "Impact Factor")',
+		"Claiming to be indexed in Google Scholar (which isn't a selective index)",
+		"Falsely claiming to be included in Web of Science or Scopus"
+	],
+	"Fees and Transparency": [
+		"Hidden fees revealed only after acceptance",
+		"Unclear information about APCs on the website",
+		"No clear policies on copyright and licensing",
+		"Absence of retraction, correction, or ethics policies",
+		"No information about digital preservation"
+	],
+	"Content and Quality": [
+		"Previously published papers with minimal editing",
+		"Articles on topics outside the journal's stated scope",
+		"Obvious lack of copyediting in published articles",
+		"Low-quality figures and tables in published papers",
+		"Extremely short or extremely long articles without justification",
+		"Papers accepted without revisions despite obvious flaws"
+	]
+}
@@ -0,0 +1,153 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide.storage import data_path, ensure_parent
+
+DEFAULT_CACHE_DIR = data_path('eigenfactor')
+
+# Eigenfactor counts citations made in the census year to items from the five years before it
+CITATION_WINDOW = 5
+ALPHA = 0.85
+
+
+# Column-stochastic journal citation matrix kept as CSR-style arrays sorted by cited journal:
+# H[cited, citing] = share of the citing journal's outgoing (non-self) citations
+class CitationGraph:
+	def __init__(self, journals, cited, citing, weights, articles):
+		self.journals = journals
+		self.cited = cited
+		self.citing = citing
+		self.weights = weights
+		self.articles = articles
+
+	def __len__(self):
+		return len(self.journals)
+
+	@classmethod
+	def from_edges(cls, citing_journals, cited_journals, article_counts):
+		journals = pd.Index(pd.unique(np.concatenate([
+			np.asarray(article_counts.index, dtype=object),
+			np.asarray(citing_journals, dtype=object),
+			np.asarray(cited_journals, dtype=object),
+		])))
+		citing = journals.get_indexer(citing_journals)
+		cited = journals.get_indexer(cited_journals)
+
+		# Self-citations are excluded before normalising, as in the published method
+		keep = citing != cited
+		n = len(journals)
+		pairs, counts = np.unique(cited[keep].astype(np.int64) * n + citing[keep], return_counts=True)
+		cited, citing = pairs // n, pairs % n
+		outgoing = np.bincount(citing, weights=counts, minlength=n)
+		weights = counts / outgoing[citing]
+
+		articles = article_counts.reindex(journals).fillna(0).to_numpy(dtype=np.float64)
+		return cls(journals, cited, citing, weights, articles)
+
+	def multiply(self, vector):
+		return np.bincount(self.cited, weights=self.weights * vector[self.citing], minlength=len(self.journals))
+
+	def article_share(self):
+		total = self.articles.sum()
+		if total == 0:
+			return np.full(len(self.journals), 1 / len(self.journals))
+		return self.articles / total
+
+	def dangling(self):
+		return np.bincount(self.citing, minlength=len(self.journals)) == 0
+
+
+def influence_vector(graph, start=None, alpha=ALPHA, tol=1e-10, max_iter=1000):
+	# Power iteration of the Eigenfactor random walk: follow a citation with probability alpha,
+	# otherwise (or from a journal that cites nothing) teleport in proportion to article counts
+	articles = graph.article_share()
+	dangling = graph.dangling()
+	vector = articles.copy() if start is None else start / start.sum()
+
+	for iteration in range(1, max_iter + 1):
+		updated = alpha * graph.multiply(vector)
+		updated += (alpha * vector[dangling].sum() + (1 - alpha)) * articles
+		residual = np.abs(updated - vector).sum()
+		vector = updated
+		if residual < tol:
+			break
+	return vector, iteration
+
+
+def eigenfactor_scores(graph, start=None, **kwargs):
+	vector, iterations = influence_vector(graph, start=start, **kwargs)
+	flow = graph.multiply(vector)
+	eigenfactor = 100 * flow / flow.sum()
+	article_share = graph.article_share()
+	with np.errstate(divide='ignore', invalid='ignore'):
+		article_influence = np.where(article_share > 0, 0.01 * eigenfactor / article_share, np.nan)
+	table = pd.DataFrame({
+		'articles': graph.articles.astype(np.int64),
+		'eigenfactor': eigenfactor,
+		'article_influence': article_influence,
+	}, index=pd.Index(graph.journals, name='journal'))
+	return table, vector, iterations
+
+
+def _empty_table():
+	return pd.DataFrame({
+		'articles': pd.Series(dtype=np.int64),
+		'eigenfactor': pd.Series(dtype=np.float64),
+		'article_influence': pd.Series(dtype=np.float64),
+	}, index=pd.Index([], dtype=object, name='journal'))
+
+
+def _cache_path(cache_dir, year):
+	return os.path.join(cache_dir, f'year={year}.npz')
+
+
+def _load_cached(cache_dir, year):
+	path = _cache_path(cache_dir, year)
+	if not os.path.exists(path):
+		return None
+	with np.load(path, allow_pickle=False) as data:
+		return {key: data[key] for key in data.files}
+
+
+# Eigenfactor for a census year from the journal metrics engine's citation partitions. The
+# result and its influence vector are cached on disk keyed by the source rows, and the
+# previous year's vector (when cached) seeds the power iteration.
+def compute(engine, year, cache_dir=DEFAULT_CACHE_DIR):
+	source_key = engine.source_key(year - CITATION_WINDOW, year)
+	cached = _load_cached(cache_dir, year)
+	if cached is not None and str(cached['source_key']) == source_key:
+		table = pd.DataFrame({
+			'articles': cached['articles'],
+			'eigenfactor': cached['eigenfactor'],
+			'article_influence': cached['article_influence'],
+		}, index=pd.Index(cached['journals'], name='journal'))
+		return table.sort_values('eigenfactor', ascending=False)
+
+	refs = engine.references(year, window=CITATION_WINDOW)
+	refs = refs[refs['cited_year'] < year]
+	articles = engine.items(range(year - CITATION_WINDOW, year))
+	graph = CitationGraph.from_edges(refs['citing_journal'].to_numpy(), refs['journal'].to_numpy(), articles)
+	# No journals in the window (the ledger's earliest year), or no citations between them: there
+	# is no citation flow to score
+	if len(graph) == 0 or len(graph.weights) == 0:
+		return _empty_table()
+
+	start = None
+	previous = _load_cached(cache_dir, year - 1)
+	if previous is not None:
+		start = pd.Series(previous['vector'], index=previous['journals']).reindex(graph.journals).to_numpy()
+		start = np.where(np.isnan(start), graph.article_share(), start)
+
+	table, vector, _ = eigenfactor_scores(graph, start=start)
+	np.savez(
+		ensure_parent(_cache_path(cache_dir, year)),
+		source_key=np.array(source_key),
+		journals=np.asarray(graph.journals, dtype=str),
+		vector=vector,
+		articles=table['articles'].to_numpy(),
+		eigenfactor=table['eigenfactor'].to_numpy(),
+		article_influence=table['article_influence'].to_numpy(),
+	)
+	return table.sort_values('eigenfactor', ascending=False)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import shutil
+import threading
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide.storage import data_path, load_columns, save_columns
+
+DEFAULT_CACHE_DIR = data_path('journal_metrics')
+DUMP_COLUMNS = ['citing_paper', 'cited_paper', 'journal', 'year']
+
+# Longest window any metric looks back over (CiteScore: the year plus the three before it)
+WINDOW = 3
+
+
+def read_citation_dump(source, chunksize=500_000):
+	# One row per reference: `journal` and `year` belong to the citing paper. Papers without
+	# references appear once with an empty cited_paper so they still count as published items.
+	for chunk in pd.read_csv(source, chunksize=chunksize, dtype={'citing_paper': str, 'cited_paper': str, 'journal': str}):
+		chunk.columns = [column.strip().lower() for column in chunk.columns]
+		missing = set(DUMP_COLUMNS) - set(chunk.columns)
+		if missing:
+			raise ValueError(f"Citation dump is missing column(s): {', '.join(sorted(missing))}")
+		chunk = chunk[DUMP_COLUMNS].dropna(subset=['citing_paper', 'journal', 'year'])
+		chunk['cited_paper'] = chunk['cited_paper'].fillna('')
+		chunk['year'] = chunk['year'].astype(int)
+		yield chunk
+
+
+def _fingerprint(frame):
+	hashed = pd.util.hash_pandas_object(frame, index=False).to_numpy()
+	return f'{len(frame)}:{int(hashed.sum(dtype=np.uint64))}'
+
+
+# Raw rows and per-year aggregates are kept as one columnar partition per citing year.
+# A year's aggregates depend on its own rows and on the papers published in the WINDOW
+# years before it, so adding a year only rebuilds that year (and any later ones within
+# the window), and each metric only reads the partitions its window covers.
+class JournalMetricsEngine:
+	def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+		self.cache_dir = cache_dir
+		self._manifest_path = os.path.join(cache_dir, 'manifest.json')
+		self._metrics = {}
+		# One engine is shared by every session of the app
+		self._lock = threading.RLock()
+		if os.path.exists(self._manifest_path):
+			with open(self._manifest_path) as handle:
+				self.manifest = {int(year): entry for year, entry in json.load(handle).items()}
+		else:
+			self.manifest = {}
+
+	def years(self):
+		return sorted(self.manifest)
+
+	def _partition(self, kind, year):
+		return os.path.join(self.cache_dir, kind, f'year={year}')
+
+	def _write(self, directory, frame):
+		staging = directory + '.tmp'
+		shutil.rmtree(staging, ignore_errors=True)
+		save_columns(staging, frame)
+		shutil.rmtree(directory, ignore_errors=True)
+		os.replace(staging, directory)
+
+	def _save_manifest(self):
+		os.makedirs(self.cache_dir, exist_ok=True)
+		with open(self._manifest_path, 'w') as handle:
+			json.dump({str(year): entry for year, entry in sorted(self.manifest.items())}, handle, indent=1)
+
+	def _raw(self, year):
+		if year not in self.manifest:
+			return pd.DataFrame({column: pd.Series(dtype=str) for column in ['citing_paper', 'cited_paper', 'journal']})
+		return load_columns(self._partition('raw', year), ['citing_paper', 'cited_paper', 'journal'])
+
+	def _dependency_key(self, year):
+		return self.source_key(year - WINDOW, year)
+
+	def add_citations(self, rows):
+		# Replaces the raw partition of every citing year present in `rows` (a DataFrame or an
+		# iterable of chunks) and rebuilds only the aggregates whose inputs changed.
+		chunks = [rows] if isinstance(rows, pd.DataFrame) else list(rows)
+		if not chunks:
+			return []
+		with self._lock:
+			return self._add_frame(pd.concat(chunks, ignore_index=True))
+
+	def _add_frame(self, frame):
+		for year, year_rows in frame.groupby('year'):
+			year_rows = year_rows[['citing_paper', 'cited_paper', 'journal']].sort_values(['citing_paper', 'cited_paper'])
+			fingerprint = _fingerprint(year_rows)
+			if self.manifest.get(year, {}).get('raw') == fingerprint:
+				continue
+			self._write(self._partition('raw', year), year_rows)
+			self.manifest[year] = {'raw': fingerprint, 'aggregates': None}
+
+		rebuilt = []
+		for year in self.years():
+			key = self._dependency_key(year)
+			if self.manifest[year]['aggregates'] != key:
+				self._build_aggregates(year)
+				self.manifest[year]['aggregates'] = key
+				rebuilt.append(year)
+		if rebuilt:
+			self._save_manifest()
+			self._metrics = {
+				year: table for year, table in self._metrics.items()
+				if not any(year - WINDOW <= changed <= year for changed in rebuilt)
+			}
+		return rebuilt
+
+	def source_key(self, first_year, last_year):
+		# Identifies the raw rows behind any computation over this span of years
+		with self._lock:
+			parts = [self.manifest[y]['raw'] if y in self.manifest else '-' for y in range(first_year, last_year + 1)]
+		return hashlib.sha1('|'.join(parts).encode()).hexdigest()
+
+	def references(self, year, window=WINDOW):
+		# References made in `year` to papers published in that year or the `window` years
+		# before it, resolved to the citing and cited journals
+		with self._lock:
+			raws = {y: self._raw(y) for y in range(year - window, year + 1)}
+		papers = pd.concat(
+			[raw.drop_duplicates('citing_paper').assign(year=y) for y, raw in raws.items()],
+			ignore_index=True).drop_duplicates('citing_paper', keep='last')
+		lookup = pd.Index(papers['citing_paper'])
+
+		refs = raws[year][raws[year]['cited_paper'] != '']
+		position = lookup.get_indexer(refs['cited_paper'])
+		found = position >= 0
+		refs = pd.DataFrame({
+			'citing_paper': refs['citing_paper'].to_numpy()[found],
+			'citing_journal': refs['journal'].to_numpy()[found],
+			'journal': papers['journal'].to_numpy()[position[found]],
+			'cited_year': papers['year'].to_numpy()[position[found]],
+		})
+		return refs[refs['cited_year'] <= year]
+
+	def _build_aggregates(self, year):
+		current = self._raw(year)
+		items = current.drop_duplicates('citing_paper').groupby('journal').size().rename('count').reset_index()
+
+		refs = self.references(year)
+		cites = refs.groupby(['journal', 'cited_year']).size().rename('count').reset_index()
+
+		# SNIP's database citation potential: for each journal, the mean number of active
+		# references (to the three preceding years) in the papers that cite it
+		active = refs[refs['cited_year'] < year]
+		active_refs = active.groupby('citing_paper').size().rename('active_refs')
+		citing = active[['citing_paper', 'journal']].drop_duplicates().join(active_refs, on='citing_paper')
+		potential = citing.groupby('journal').agg(
+			citing_papers=('citing_paper', 'size'), active_refs=('active_refs', 'sum')).reset_index()
+
+		base = self._partition('aggregates', year)
+		self._write(os.path.join(base, 'items'), items)
+		self._write(os.path.join(base, 'cites'), cites)
+		self._write(os.path.join(base, 'potential'), potential)
+
+	def _aggregate(self, kind, year, columns):
+		directory = os.path.join(self._partition('aggregates', year), kind)
+		if year not in self.manifest or not os.path.isdir(directory):
+			return pd.DataFrame({column: [] for column in columns})
+		return load_columns(directory, columns)
+
+	def items(self, years):
+		frames = [self._aggregate('items', y, ['journal', 'count']) for y in years]
+		return pd.concat(frames).groupby('journal')['count'].sum()
+
+	def metrics(self, year):
+		with self._lock:
+			if year not in self._metrics:
+				self._metrics[year] = self._compute(year)
+			return self._metrics[year].copy()
+
+	def _compute(self, year):
+		cites = self._aggregate('cites', year, ['journal', 'cited_year', 'count'])
+
+		# Impact Factor: citations this year to items from the two preceding years
+		two_year = cites[cites['cited_year'].isin([year - 1, year - 2])].groupby('journal')['count'].sum()
+		impact_factor = two_year / self.items([year - 1, year - 2])
+
+		# CiteScore: citations over four years to items published in those same four years
+		window_years = list(range(year - WINDOW, year + 1))
+		window_cites = pd.concat([
+			cites_year[cites_year['cited_year'] >= year - WINDOW]
+			for cites_year in (self._aggregate('cites', y, ['journal', 'cited_year', 'count']) for y in window_years)
+		]).groupby('journal')['count'].sum()
+		window_items = self.items(window_years)
+		citescore = window_cites / window_items
+
+		# SNIP: raw impact per paper over the three preceding years, divided by the journal's
+		# citation potential relative to the median journal
+		snip_cites = cites[cites['cited_year'].between(year - WINDOW, year - 1)].groupby('journal')['count'].sum()
+		raw_impact = snip_cites / self.items(range(year - WINDOW, year))
+		potential = self._aggregate('potential', year, ['journal', 'citing_papers', 'active_refs']).set_index('journal')
+		citation_potential = potential['active_refs'] / potential['citing_papers']
+		relative_potential = citation_potential / citation_potential.median()
+		snip = raw_impact / relative_potential
+
+		table = pd.DataFrame({
+			'items': window_items,
+			'impact_factor': impact_factor,
+			'citescore': citescore,
+			'snip': snip,
+		}).replace([np.inf, -np.inf], np.nan)
+		table.index.name = 'journal'
+		return table[table['items'].notna()].round(3).sort_values('impact_factor', ascending=False)
@@ -0,0 +1,256 @@
+import argparse
+import hashlib
+import json
+import math
+import multiprocessing
+import os
+import re
+import threading
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide import readability, recommender
+from publishing_guide.storage import data_path
+
+DEFAULT_TABLE_DIR = data_path('keyword_background')
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9]*(?:['-][a-z0-9]+)*|[.,;:!?()\[\]{}\"“”]")
+STOPWORDS = recommender.STOPWORDS | frozenset("""
+abstract aim aims approach approaches based show shows shown showed find finds found findings result results
+method methods new novel propose proposed present presents provide provides provided use used uses first one two three
+well may might also including include includes however therefore thus whereas among across different various several
+significant significantly important high higher low lower large small increase increased decrease decreased effect
+effects level levels role roles analysis analyses data work investigate investigated examine examined suggest suggests
+""".split())
+MAX_PHRASE_WORDS = 3
+# Phrase length bonus: "gene editing" is a better index term than "gene" and "editing" alone
+LENGTH_WEIGHT = {1: 1.0, 2: 1.5, 3: 1.8}
+# Nominal corpus size for the fallback table derived from the bundled word ranks
+RANKED_DOCUMENTS = 1_000_000
+# Costs measured for a typical abstract (~220 words): extracting one item, starting the spawned
+# worker pool (interpreter, imports, table load), one batch round trip to a started pool, and
+# pickling one item and its result. A batch only goes to the pool when that saves time.
+ITEM_SECONDS = 1.5e-3
+POOL_START_SECONDS = 1.3
+POOL_DISPATCH_SECONDS = 0.02
+ITEM_TRANSFER_SECONDS = 1e-4
+
+
+def term_hash(term):
+	return int.from_bytes(hashlib.blake2b(term.encode('utf-8'), digest_size=8).digest(), 'little')
+
+
+def _hashes(terms):
+	return np.fromiter((term_hash(term) for term in terms), dtype=np.uint64, count=len(terms))
+
+
+def candidate_phrases(text):
+	# RAKE-style candidates: runs of content words between stopwords and punctuation, and
+	# every 1..MAX_PHRASE_WORDS-gram inside each run
+	phrases = []
+	run = []
+	for token in TOKEN_RE.findall(text.lower()) + ['.']:
+		if token[0].isalpha() and token not in STOPWORDS and len(token) > 2:
+			run.append(token)
+			continue
+		for size in range(1, MAX_PHRASE_WORDS + 1):
+			phrases.extend(' '.join(run[start:start + size]) for start in range(len(run) - size + 1))
+		run = []
+	return phrases
+
+
+# Document frequencies of words and phrases, as sorted 64-bit term hashes with a parallel
+# counts array. Saved tables are memory-mapped, so every session (and every worker process of
+# a batch run) shares one copy of the pages through the OS cache.
+class BackgroundTable:
+	def __init__(self, hashes, documents, total):
+		self.hashes = hashes
+		self.documents = documents
+		self.total = total
+
+	def __len__(self):
+		return len(self.hashes)
+
+	@classmethod
+	def build(cls, texts, min_documents=2):
+		counts = Counter()
+		total = 0
+		for text in texts:
+			counts.update(set(candidate_phrases(text)))
+			total += 1
+		terms = [term for term, count in counts.items() if count >= min_documents]
+		hashes = _hashes(terms)
+		order = np.argsort(hashes)
+		documents = np.fromiter((counts[term] for term in terms), dtype=np.uint32, count=len(terms))
+		return cls(hashes[order], documents[order], total)
+
+	@classmethod
+	def from_word_ranks(cls, words=None):
+		# Fallback when no corpus table has been built: the bundled rank-ordered common-word list,
+		# with Zipf-like document frequencies. Words missing from it count as rare.
+		words = list(words or readability.common_words_ranked())
+		hashes = _hashes(words)
+		documents = (RANKED_DOCUMENTS * 0.5 / (1 + np.arange(len(words)) / 10)).astype(np.uint32)
+		order = np.argsort(hashes)
+		return cls(hashes[order], documents[order], RANKED_DOCUMENTS)
+
+	def save(self, directory):
+		os.makedirs(directory, exist_ok=True)
+		np.save(os.path.join(directory, 'hashes.npy'), self.hashes)
+		np.save(os.path.join(directory, 'documents.npy'), self.documents)
+		with open(os.path.join(directory, 'meta.json'), 'w') as handle:
+			json.dump({'documents': self.total, 'terms': len(self.hashes)}, handle)
+
+	@classmethod
+	def load(cls, directory=DEFAULT_TABLE_DIR):
+		if not os.path.exists(os.path.join(directory, 'meta.json')):
+			return cls.from_word_ranks()
+		with open(os.path.join(directory, 'meta.json')) as handle:
+			meta = json.load(handle)
+		return cls(
+			np.load(os.path.join(directory, 'hashes.npy'), mmap_mode='r'),
+			np.load(os.path.join(directory, 'documents.npy'), mmap_mode='r'),
+			meta['documents'],
+		)
+
+	def idf(self, terms):
+		hashes = _hashes(terms)
+		positions = np.searchsorted(self.hashes, hashes)
+		positions = np.minimum(positions, max(len(self.hashes) - 1, 0))
+		documents = np.zeros(len(terms), dtype=np.float64)
+		if len(self.hashes):
+			found = self.hashes[positions] == hashes
+			documents[found] = self.documents[positions[found]]
+		return np.log((self.total + 1) / (documents + 1))
+
+
+def extract(text, table, title='', k=10):
+	# [(phrase, score)] best first. Score = frequency in the text (title mentions count
+	# double) x background IDF x phrase-length weight; a phrase at least half of whose words
+	# are already in better-scored picks is dropped, so "editing" does not follow "gene editing".
+	counts = Counter(candidate_phrases(text))
+	for phrase in candidate_phrases(title):
+		counts[phrase] += 2
+	if not counts:
+		return []
+	phrases = list(counts)
+	scores = (
+		np.fromiter(counts.values(), dtype=np.float64, count=len(phrases))
+		* table.idf(phrases)
+		* np.array([LENGTH_WEIGHT[phrase.count(' ') + 1] for phrase in phrases])
+	)
+	chosen = []
+	covered = set()
+	for index in np.argsort(-scores, kind='stable'):
+		phrase = phrases[index]
+		words = phrase.split()
+		if 2 * sum(word in covered for word in words) >= len(words):
+			continue
+		chosen.append((phrase, round(float(scores[index]), 3)))
+		covered.update(words)
+		if len(chosen) == k:
+			break
+	return chosen
+
+
+_worker_table = None
+
+
+def _init_worker(directory):
+	global _worker_table
+	_worker_table = BackgroundTable.load(directory)
+
+
+def _extract_items(items, table, k):
+	return [', '.join(phrase for phrase, _ in extract(text, table, title, k)) for title, text in items]
+
+
+def _extract_many(items, k):
+	return _extract_items(items, _worker_table, k)
+
+
+def usable_cpus():
+	# CPUs this process may run on (os.cpu_count counts the machine's, not the container's share)
+	if hasattr(os, 'sched_getaffinity'):
+		return len(os.sched_getaffinity(0))
+	return os.cpu_count() or 1
+
+
+def parallel_worthwhile(count, processes, started=False):
+	if processes < 2:
+		return False
+	saved = count * (ITEM_SECONDS * (1 - 1 / processes) - ITEM_TRANSFER_SECONDS)
+	return saved > POOL_DISPATCH_SECONDS + (0 if started else POOL_START_SECONDS)
+
+
+_pool = None
+_pool_key = None
+_pool_lock = threading.Lock()
+
+
+def _shared_pool(processes, directory):
+	# One pool per process, started on first use and kept for later batches, so its startup is
+	# paid once. Spawned rather than forked: the caller is usually a threaded web server.
+	global _pool, _pool_key
+	with _pool_lock:
+		if _pool is None or _pool_key != (processes, directory):
+			if _pool is not None:
+				_pool.shutdown(wait=False)
+			context = multiprocessing.get_context('spawn')
+			_pool = ProcessPoolExecutor(processes, mp_context=context, initializer=_init_worker, initargs=(directory,))
+			_pool_key = (processes, directory)
+		return _pool
+
+
+def shutdown_pool():
+	global _pool, _pool_key
+	with _pool_lock:
+		if _pool is not None:
+			_pool.shutdown()
+		_pool, _pool_key = None, None
+
+
+def extract_batch(titles, abstracts, directory=DEFAULT_TABLE_DIR, k=8, processes=None, table=None):
+	# Suggested keywords for a whole publication list. Lists large enough to repay the pool's
+	# costs are split across worker processes that each memory-map the same background table.
+	items = [
+		('' if pd.isna(title) else str(title), '' if pd.isna(abstract) else str(abstract))
+		for title, abstract in zip(titles, abstracts)
+	]
+	processes = processes or usable_cpus()
+	started = _pool is not None and _pool_key == (processes, directory)
+	if not parallel_worthwhile(len(items), processes, started):
+		return _extract_items(items, table if table is not None else BackgroundTable.load(directory), k)
+
+	size = max(25, math.ceil(len(items) / (processes * 4)))
+	chunks = [items[start:start + size] for start in range(0, len(items), size)]
+	pool = _shared_pool(processes, directory)
+	return [keywords for part in pool.map(_extract_many, chunks, [k] * len(chunks)) for keywords in part]
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Build the keyword background-frequency table from a text corpus.")
+	parser.add_argument('corpus', nargs='+', help="CSV files (every text column is used) or plain-text files, one document per line")
+	parser.add_argument('-o', '--output', default=DEFAULT_TABLE_DIR)
+	parser.add_argument('--min-documents', type=int, default=2)
+	args = parser.parse_args(argv)
+
+	def documents():
+		for path in args.corpus:
+			if path.lower().endswith('.csv'):
+				for chunk in pd.read_csv(path, dtype=str, chunksize=50_000):
+					yield from chunk.fillna('').agg(' . '.join, axis=1)
+			else:
+				with open(path, encoding='utf-8', errors='replace') as handle:
+					yield from handle
+
+	table = BackgroundTable.build(documents(), min_documents=args.min_documents)
+	table.save(args.output)
+	print(f"Saved {len(table)} terms from {table.total} documents to {args.output}")
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,294 @@
+import codecs
+import io
+import os
+import re
+import zipfile
+import xml.etree.ElementTree as ET
+
+# Canonical sections, in the order of the guide's "Standard Paper Structure (IMRaD)"
+SECTIONS = ['Title', 'Abstract', 'Introduction', 'Methods', 'Results', 'Discussion', 'Conclusion', 'References']
+FRONT_MATTER = 'Front matter'
+OTHER = 'Other'
+BODY_SECTIONS = ['Introduction', 'Methods', 'Results', 'Discussion', 'Conclusion']
+
+# Limits taken from the Title and Abstract tips on the Writing page
+TITLE_MAX_WORDS = 15
+ABSTRACT_RANGE = (150, 300)
+
+SECTION_ALIASES = {
+	'title': 'Title',
+	'abstract': 'Abstract',
+	'summary': 'Abstract',
+	'introduction': 'Introduction',
+	'background': 'Introduction',
+	'methods': 'Methods',
+	'method': 'Methods',
+	'methodology': 'Methods',
+	'materials and methods': 'Methods',
+	'methods and materials': 'Methods',
+	'experimental': 'Methods',
+	'experimental section': 'Methods',
+	'results': 'Results',
+	'findings': 'Results',
+	'results and discussion': 'Results',
+	'discussion': 'Discussion',
+	'conclusion': 'Conclusion',
+	'conclusions': 'Conclusion',
+	'concluding remarks': 'Conclusion',
+	'references': 'References',
+	'bibliography': 'References',
+	'literature cited': 'References',
+	'works cited': 'References',
+	'acknowledgements': OTHER,
+	'acknowledgments': OTHER,
+	'appendix': OTHER,
+	'supplementary material': OTHER,
+	'funding': OTHER,
+	'author contributions': OTHER,
+	'conflict of interest': OTHER,
+	'data availability': OTHER,
+}
+
+HEADING_NUMBER_RE = re.compile(r'^(?:\d+(?:\.\d+)*[.)]?|[ivxlc]+[.)])\s+', re.IGNORECASE)
+MARKDOWN_HEADING_RE = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+TEX_SECTION_RE = re.compile(r'\\(?:chapter|section|subsection)\*?\s*(?:\[[^\]]*\])?\s*\{([^}]*)\}')
+TEX_NON_TEXT_RE = re.compile(
+	r'\\(?:begin|end|label|ref|eqref|autoref|cite[a-zA-Z]*|includegraphics|usepackage|documentclass|bibliographystyle)'
+	r'\*?(?:\[[^\]]*\])*\{[^}]*\}')
+TEX_COMMAND_RE = re.compile(r'\\[a-zA-Z@]+\*?|[{}$&_^~\\]')
+
+WORD_NS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+
+
+def classify_heading(text):
+	name = HEADING_NUMBER_RE.sub('', text.strip()).strip(' :.').lower()
+	return SECTION_ALIASES.get(name)
+
+
+def iter_lines(stream, encoding='utf-8'):
+	# Decodes a binary stream incrementally so a large upload is never held as one string
+	decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+	pending = ''
+	for block in iter(lambda: stream.read(1 << 20), b''):
+		pending += decoder.decode(block)
+		# Any line ending (\n, \r\n or a lone \r) ends a line; a trailing \r waits for the next
+		# block in case its \n is there
+		lines = pending.splitlines(keepends=True)
+		unfinished = lines and (lines[-1].endswith('\r') or lines[-1].splitlines()[0] == lines[-1])
+		pending = lines.pop() if unfinished else ''
+		for line in lines:
+			yield line.splitlines()[0]
+	pending += decoder.decode(b'', final=True)
+	yield from pending.splitlines()
+
+
+def _plain_blocks(stream):
+	for line in iter_lines(stream):
+		stripped = line.strip()
+		# Plain-text headings are short lines that name a known section on their own
+		if stripped and len(stripped) < 60 and classify_heading(stripped):
+			yield stripped, None
+		else:
+			yield None, line
+
+
+def _markdown_blocks(stream):
+	seen_heading = False
+	for line in iter_lines(stream):
+		match = MARKDOWN_HEADING_RE.match(line)
+		if match:
+			level, text = len(match.group(1)), match.group(2)
+			# The first top-level heading of a markdown manuscript is its title, unless it names a section
+			if level == 1 and not seen_heading and classify_heading(text) is None:
+				seen_heading = True
+				yield 'Title', text
+				continue
+			seen_heading = True
+			yield text, None
+		else:
+			yield None, line
+
+
+def _tex_blocks(stream):
+	in_document = False
+	for line in iter_lines(stream):
+		line = line.split('%', 1)[0] if '%' in line and '\\%' not in line else line
+		if '\\title{' in line:
+			yield 'Title', TEX_COMMAND_RE.sub(' ', line.split('\\title{', 1)[1])
+			continue
+		if '\\begin{document}' in line:
+			in_document = True
+			continue
+		if not in_document:
+			continue
+		if '\\begin{abstract}' in line:
+			yield 'Abstract', None
+			continue
+		if '\\begin{thebibliography}' in line or '\\bibliography{' in line or '\\printbibliography' in line:
+			yield 'References', None
+			continue
+		match = TEX_SECTION_RE.search(line)
+		if match:
+			# Text around the command on the same line belongs to the sections either side of it
+			if line[:match.start()].strip():
+				yield None, _tex_text(line[:match.start()])
+			yield match.group(1), None
+			if line[match.end():].strip():
+				yield None, _tex_text(line[match.end():])
+			continue
+		yield None, _tex_text(line)
+
+
+def _tex_text(line):
+	return TEX_COMMAND_RE.sub(' ', TEX_NON_TEXT_RE.sub(' ', line))
+
+
+def _docx_blocks(stream):
+	# Streams word/document.xml with iterparse and drops each top-level body element once it
+	# has been read, so memory stays flat however long the thesis is
+	with zipfile.ZipFile(stream) as archive, archive.open('word/document.xml') as document:
+		depth = 0
+		body = None
+		for event, element in ET.iterparse(document, events=('start', 'end')):
+			if event == 'start':
+				depth += 1
+				if element.tag == WORD_NS + 'body':
+					body = element
+				continue
+			depth -= 1
+			if element.tag == WORD_NS + 'p':
+				text = ''.join(node.text or '' for node in element.iter(WORD_NS + 't'))
+				style = element.find(f'{WORD_NS}pPr/{WORD_NS}pStyle')
+				style = style.get(WORD_NS + 'val', '') if style is not None else ''
+				if style == 'Title':
+					yield 'Title', text
+				elif style.lower().startswith('heading') or (text and len(text) < 60 and classify_heading(text)):
+					yield text, None
+				else:
+					yield None, text
+			if body is not None and depth == 2:
+				body.remove(element)
+
+
+READERS = {
+	'.txt': _plain_blocks,
+	'.md': _markdown_blocks,
+	'.markdown': _markdown_blocks,
+	'.tex': _tex_blocks,
+	'.docx': _docx_blocks,
+}
+
+
+def _read(stream, filename, consume):
+	extension = os.path.splitext(filename)[1].lower()
+	if extension not in READERS:
+		raise ValueError(f"Unsupported manuscript format '{extension}'. Use .docx, .tex, .md or .txt.")
+	if isinstance(stream, (bytes, bytearray)):
+		stream = io.BytesIO(stream)
+
+	try:
+		return consume(READERS[extension](stream))
+	except (KeyError, zipfile.BadZipFile, ET.ParseError) as error:
+		raise ValueError(f"{filename} is not a readable {extension} manuscript") from error
+
+
+def count_section_words(stream, filename):
+	# Returns {section: words} in reading order. Unrecognised headings (subsections, numbered
+	# sub-headings) stay in the section they appear in.
+	return _read(stream, filename, _count)
+
+
+def extract_text(stream, filename):
+	# Plain text of the whole manuscript, headings included, one block per line
+	return _read(stream, filename, lambda blocks: '\n'.join(
+		text if text is not None else heading for heading, text in blocks))
+
+
+def extract_paragraphs(stream, filename):
+	# [(section, paragraph)] in reading order, headings as paragraphs of their own. Text
+	# formats break paragraphs at blank lines; .docx has one paragraph per element.
+	one_per_block = os.path.splitext(filename)[1].lower() == '.docx'
+	return _read(stream, filename, lambda blocks: list(_paragraphs(blocks, one_per_block)))
+
+
+def _paragraphs(blocks, one_per_block):
+	section = FRONT_MATTER
+	lines = []
+	for heading, text in blocks:
+		if heading is not None:
+			if lines:
+				yield section, ' '.join(lines)
+				lines = []
+			classified = heading if heading in SECTIONS else classify_heading(heading)
+			if classified is not None:
+				section = classified
+			yield section, (heading if text is None else text).strip()
+			if heading == 'Title':
+				section = FRONT_MATTER
+			continue
+		if text is not None and text.strip():
+			lines.append(text.strip())
+			if not one_per_block:
+				continue
+		if lines:
+			yield section, ' '.join(lines)
+			lines = []
+	if lines:
+		yield section, ' '.join(lines)
+
+
+def _count(blocks):
+	counts = {}
+	current = FRONT_MATTER
+	for heading, text in blocks:
+		if heading is not None:
+			section = heading if heading in SECTIONS else classify_heading(heading)
+			if section is not None:
+				current = section
+				counts.setdefault(current, 0)
+			if text is None:
+				continue
+		if text:
+			counts[current] = counts.get(current, 0) + len(text.split())
+			# Title lines carry their own text; anything after them is front matter again
+			if heading == 'Title':
+				current = FRONT_MATTER
+	return counts
+
+
+def parse_length_range(typical_length):
+	# "4,000-8,000 words" -> (4000, 8000); descriptive lengths such as "Varies by field" -> None
+	numbers = [int(value.replace(',', '')) for value in re.findall(r'\d[\d,]*', typical_length)]
+	return (numbers[0], numbers[1]) if len(numbers) >= 2 else None
+
+
+def _status(words, low, high):
+	if low is not None and words < low:
+		return 'Below range'
+	if high is not None and words > high:
+		return 'Above range'
+	return 'Within range'
+
+
+def length_report(counts, typical_length):
+	rows = []
+	for section in [FRONT_MATTER] + SECTIONS + [OTHER]:
+		if section not in counts:
+			continue
+		if section == 'Title':
+			target, status = f'up to {TITLE_MAX_WORDS}', _status(counts[section], None, TITLE_MAX_WORDS)
+		elif section == 'Abstract':
+			target, status = '{}-{}'.format(*ABSTRACT_RANGE), _status(counts[section], *ABSTRACT_RANGE)
+		else:
+			target, status = '', ''
+		rows.append({'section': section, 'words': counts[section], 'target': target, 'status': status})
+
+	body_words = sum(counts.get(section, 0) for section in BODY_SECTIONS)
+	limits = parse_length_range(typical_length)
+	rows.append({
+		'section': 'Main text (Introduction to Conclusion)',
+		'words': body_words,
+		'target': typical_length,
+		'status': _status(body_words, *limits) if limits else 'No fixed range',
+	})
+	return rows
@@ -0,0 +1,316 @@
+import argparse
+import hashlib
+import os
+import re
+import sqlite3
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide import manuscript
+from publishing_guide.storage import data_path, ensure_parent
+
+DEFAULT_INDEX_PATH = data_path('overlap_index.sqlite')
+
+WORD_RE = re.compile(r'[^\W_]+')
+SHINGLE_WORDS = 5
+
+# 63 bands of 2 rows: pairs with word-shingle Jaccard similarity of 0.2 become candidates
+# nine times in ten, 0.3 almost always, and unrelated papers (< 0.02) about one time in forty
+BANDS = 63
+ROWS = 2
+NUM_PERM = BANDS * ROWS
+SEED = 20240501
+
+# Jaccard similarity says little about containment: three paragraphs copied from a 10,000-word
+# paper share all their shingles with it but have a Jaccard similarity near 0.03, which no
+# banding finds. Queries of up to SHORT_QUERY_SHINGLES shingles are therefore looked up
+# directly in a postings table of every document's shingle ids that are 0 mod POSTING_SAMPLE;
+# the same shingles are sampled on both sides, so a copied passage of 100 words or more is
+# found however long the paper it came from.
+POSTING_SAMPLE = 8
+SHORT_QUERY_SHINGLES = 2000
+SCHEME = f'{SHINGLE_WORDS}w:{BANDS}x{ROWS}:{SEED}:{POSTING_SAMPLE}'
+
+# Shingles are hashed in blocks so a book-length manuscript never builds a NUM_PERM x n matrix at once
+HASH_BLOCK = 8192
+MIN_PASSAGE_WORDS = 12
+
+_MIX_1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX_2 = np.uint64(0x94D049BB133111EB)
+_rng = np.random.default_rng(SEED)
+_PERM_A = _rng.integers(1, 2 ** 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_PERM_B = _rng.integers(0, 2 ** 63, NUM_PERM, dtype=np.uint64)
+
+
+def _mix(values):
+	# splitmix64 finaliser, applied element-wise with wrapping uint64 arithmetic
+	values = values ^ (values >> np.uint64(30))
+	values = values * _MIX_1
+	values = values ^ (values >> np.uint64(27))
+	values = values * _MIX_2
+	return values ^ (values >> np.uint64(31))
+
+
+def words(text):
+	return WORD_RE.findall(text.lower())
+
+
+def shingle_hashes(tokens, k=SHINGLE_WORDS):
+	# One 64-bit hash per run of k consecutive words (in word order, duplicates kept)
+	word_hashes = np.fromiter((zlib.crc32(token.encode('utf-8')) for token in tokens), dtype=np.uint64, count=len(tokens))
+	if len(word_hashes) == 0:
+		return word_hashes
+	k = min(k, len(word_hashes))
+	count = len(word_hashes) - k + 1
+	hashes = word_hashes[:count].copy()
+	for offset in range(1, k):
+		hashes = _mix(hashes) ^ word_hashes[offset:offset + count]
+	return _mix(hashes)
+
+
+def signature(shingles):
+	# MinHash: the minimum of NUM_PERM multiply-shift hashes over the document's shingle set
+	shingles = np.unique(shingles)
+	result = np.full(NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint64)
+	for start in range(0, len(shingles), HASH_BLOCK):
+		block = shingles[start:start + HASH_BLOCK]
+		hashed = (_PERM_A[:, None] * block[None, :] + _PERM_B[:, None]) >> np.uint64(32)
+		np.minimum(result, hashed.min(axis=1), out=result)
+	return result.astype(np.uint32)
+
+
+def band_keys(sig):
+	# One signed 64-bit bucket key per band, with the band number folded in so equal rows in
+	# different bands never share a bucket
+	rows = sig.astype(np.uint64).reshape(BANDS, ROWS)
+	keys = np.arange(BANDS, dtype=np.uint64)
+	for column in range(ROWS):
+		keys = _mix(keys ^ rows[:, column])
+	return keys.view(np.int64)
+
+
+def shingle_ids(shingles):
+	# Sorted distinct 32-bit shingle ids, the form shingle sets are stored and compared in
+	return np.unique((shingles >> np.uint64(32)).astype(np.uint32))
+
+
+def sampled_ids(ids):
+	return ids[ids % POSTING_SAMPLE == 0]
+
+
+def _pack_shingles(ids):
+	# Delta-encoded and deflated
+	return zlib.compress(np.diff(ids, prepend=np.uint32(0)).astype('<u4').tobytes())
+
+
+def _unpack_shingles(blob):
+	return np.cumsum(np.frombuffer(zlib.decompress(blob), dtype='<u4'), dtype=np.uint32)
+
+
+# Documents, their MinHash signatures and compressed shingle sets live in one SQLite file.
+# The buckets table maps each LSH band key to the documents that hash into it, so a check
+# reads BANDS index entries and then the shingle sets of the few candidates it finds; short
+# checks read the postings of their sampled shingle ids instead.
+class OverlapIndex:
+	def __init__(self, path=DEFAULT_INDEX_PATH):
+		self.path = path
+		# One index is shared by every session of the app
+		self._lock = threading.RLock()
+		self._connection = sqlite3.connect(ensure_parent(path), check_same_thread=False)
+		with self._connection as connection:
+			connection.executescript("""
+				CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+				CREATE TABLE IF NOT EXISTS documents (
+					id INTEGER PRIMARY KEY,
+					name TEXT NOT NULL UNIQUE,
+					fingerprint TEXT NOT NULL,
+					words INTEGER NOT NULL,
+					signature BLOB NOT NULL,
+					shingles BLOB NOT NULL
+				);
+				CREATE TABLE IF NOT EXISTS buckets (
+					bucket INTEGER NOT NULL,
+					document INTEGER NOT NULL,
+					PRIMARY KEY (bucket, document)
+				) WITHOUT ROWID;
+				CREATE INDEX IF NOT EXISTS buckets_by_document ON buckets (document);
+				CREATE TABLE IF NOT EXISTS postings (
+					shingle INTEGER NOT NULL,
+					document INTEGER NOT NULL,
+					PRIMARY KEY (shingle, document)
+				) WITHOUT ROWID;
+				CREATE INDEX IF NOT EXISTS postings_by_document ON postings (document);
+			""")
+			connection.execute("INSERT OR IGNORE INTO meta VALUES ('scheme', ?)", (SCHEME,))
+		scheme = self._connection.execute("SELECT value FROM meta WHERE key = 'scheme'").fetchone()[0]
+		if scheme != SCHEME:
+			raise ValueError(f"{path} was built with a different shingling/LSH scheme ({scheme}); rebuild it")
+
+	def __len__(self):
+		with self._lock:
+			return self._connection.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+	def close(self):
+		self._connection.close()
+
+	def names(self):
+		with self._lock:
+			return [name for name, in self._connection.execute("SELECT name FROM documents ORDER BY name")]
+
+	def add_documents(self, documents):
+		# Adds or replaces (name, text) pairs in one transaction. Documents whose text is
+		# unchanged since they were indexed are skipped; returns the number (re)indexed.
+		added = 0
+		with self._lock, self._connection as connection:
+			for name, text in documents:
+				fingerprint = hashlib.sha1(text.encode('utf-8')).hexdigest()
+				existing = connection.execute("SELECT id, fingerprint FROM documents WHERE name = ?", (name,)).fetchone()
+				if existing is not None and existing[1] == fingerprint:
+					continue
+				if existing is not None:
+					connection.execute("DELETE FROM buckets WHERE document = ?", (existing[0],))
+					connection.execute("DELETE FROM postings WHERE document = ?", (existing[0],))
+					connection.execute("DELETE FROM documents WHERE id = ?", (existing[0],))
+
+				tokens = words(text)
+				shingles = shingle_hashes(tokens)
+				if len(shingles) == 0:
+					continue
+				sig = signature(shingles)
+				ids = shingle_ids(shingles)
+				document = connection.execute(
+					"INSERT INTO documents (name, fingerprint, words, signature, shingles) VALUES (?, ?, ?, ?, ?)",
+					(name, fingerprint, len(tokens), sig.tobytes(), _pack_shingles(ids))).lastrowid
+				connection.executemany(
+					"INSERT OR IGNORE INTO buckets VALUES (?, ?)",
+					((int(key), document) for key in band_keys(sig)))
+				connection.executemany(
+					"INSERT INTO postings VALUES (?, ?)",
+					((int(shingle), document) for shingle in sampled_ids(ids)))
+				added += 1
+		return added
+
+	def add_document(self, name, text):
+		return self.add_documents([(name, text)])
+
+	def remove(self, name):
+		with self._lock, self._connection as connection:
+			connection.execute("DELETE FROM buckets WHERE document IN (SELECT id FROM documents WHERE name = ?)", (name,))
+			connection.execute("DELETE FROM postings WHERE document IN (SELECT id FROM documents WHERE name = ?)", (name,))
+			connection.execute("DELETE FROM documents WHERE name = ?", (name,))
+
+	def _candidates(self, sig, ids, exclude=None):
+		# Documents sharing a sampled shingle with a short query, or an LSH band with a long one
+		sample = sampled_ids(ids)
+		if 0 < len(ids) <= SHORT_QUERY_SHINGLES and len(sample):
+			table, column, keys = 'postings', 'shingle', [int(shingle) for shingle in sample]
+		else:
+			table, column, keys = 'buckets', 'bucket', [int(key) for key in band_keys(sig)]
+		with self._lock:
+			return self._connection.execute(f"""
+				SELECT d.name, d.words, d.signature, d.shingles
+				FROM documents d
+				WHERE d.id IN (SELECT document FROM {table} WHERE {column} IN ({','.join('?' * len(keys))}))
+				AND d.name IS NOT ?
+			""", keys + [exclude]).fetchall()
+
+	def check(self, text, exclude=None, min_containment=0.02):
+		# Previous papers sharing text with `text`, most overlapping first. Only LSH candidates
+		# have their shingle sets compared exactly:
+		#   containment - share of the manuscript's shingles that also occur in the paper
+		#   jaccard     - shingles in common over shingles in either
+		shingles = shingle_hashes(words(text))
+		columns = ['document', 'words', 'containment', 'jaccard', 'estimated_jaccard', 'matching_bands']
+		if len(shingles) == 0:
+			return pd.DataFrame(columns=columns)
+		sig = signature(shingles)
+		ids = shingle_ids(shingles)
+
+		rows = []
+		for name, word_count, other_sig, blob in self._candidates(sig, ids, exclude):
+			other = _unpack_shingles(blob)
+			other_sig = np.frombuffer(other_sig, dtype=np.uint32)
+			shared = np.count_nonzero(np.isin(ids, other, assume_unique=True))
+			containment = shared / len(ids)
+			if containment < min_containment:
+				continue
+			rows.append({
+				'document': name,
+				'words': word_count,
+				'containment': containment,
+				'jaccard': shared / (len(ids) + len(other) - shared),
+				'estimated_jaccard': float(np.mean(other_sig == sig)),
+				'matching_bands': int(np.count_nonzero((other_sig == sig).reshape(BANDS, ROWS).all(axis=1))),
+			})
+		return pd.DataFrame(rows, columns=columns).sort_values('containment', ascending=False, ignore_index=True)
+
+	def passages(self, text, name, min_words=MIN_PASSAGE_WORDS):
+		# Runs of the manuscript covered by shingles that also occur in the named paper
+		with self._lock:
+			row = self._connection.execute("SELECT shingles FROM documents WHERE name = ?", (name,)).fetchone()
+		if row is None:
+			return []
+		matches = list(WORD_RE.finditer(text))
+		shingles = shingle_hashes([match.group().lower() for match in matches])
+		if len(shingles) == 0:
+			return []
+		found = np.isin((shingles >> np.uint64(32)).astype(np.uint32), _unpack_shingles(row[0]))
+
+		# A matched shingle covers its k words; coverage runs of min_words or more are reported
+		k = len(matches) - len(shingles) + 1
+		coverage = np.zeros(len(matches) + 1, dtype=np.int64)
+		np.add.at(coverage, np.flatnonzero(found), 1)
+		np.add.at(coverage, np.flatnonzero(found) + k, -1)
+		covered = np.concatenate(([False], np.cumsum(coverage)[:-1] > 0, [False]))
+		edges = np.flatnonzero(np.diff(covered.astype(np.int8)))
+		return [
+			text[matches[start].start():matches[end - 1].end()]
+			for start, end in zip(edges[::2], edges[1::2])
+			if end - start >= min_words
+		]
+
+
+def iter_corpus(paths):
+	# (name, text) for every supported manuscript file under the given files or directories
+	for path in paths:
+		if os.path.isdir(path):
+			files = sorted(
+				os.path.join(root, filename)
+				for root, _, filenames in os.walk(path)
+				for filename in filenames
+			)
+		else:
+			files = [path]
+		for filename in files:
+			if os.path.splitext(filename)[1].lower() not in manuscript.READERS:
+				continue
+			with open(filename, 'rb') as stream:
+				try:
+					yield filename, manuscript.extract_text(stream, filename)
+				except ValueError as error:
+					print(f"Skipping {error}")
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Add previous papers to the local text-overlap index.")
+	parser.add_argument('paths', nargs='+', help="Manuscript files (.docx, .tex, .md, .txt) or directories of them")
+	parser.add_argument('-i', '--index', default=DEFAULT_INDEX_PATH)
+	parser.add_argument('--batch', type=int, default=1000, help="Documents per transaction")
+	args = parser.parse_args(argv)
+
+	index = OverlapIndex(args.index)
+	batch, added = [], 0
+	for document in iter_corpus(args.paths):
+		batch.append(document)
+		if len(batch) >= args.batch:
+			added += index.add_documents(batch)
+			batch = []
+	added += index.add_documents(batch)
+	print(f"Indexed {added} new or changed documents; {len(index)} documents in {args.index}")
+
+
+if __name__ == '__main__':
+	main()
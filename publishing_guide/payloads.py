@@ -0,0 +1,163 @@
+import argparse
+import importlib
+import json
+import os
+import re
+import sys
+
+from publishing_guide import telemetry
+
+BUDGETS_PATH = os.environ.get(
+	'PUBLISHING_GUIDE_PAYLOAD_BUDGETS',
+	os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'payload_budgets.json'))
+MEDIA_URL_RE = re.compile(r'/media/([0-9a-f]+\.\w+)')
+MEDIA_ELEMENTS = frozenset(['imgs', 'image', 'download_button', 'audio', 'video'])
+
+# Per render: delta messages, websocket bytes (all forward messages, as sent) and bytes of
+# media files (chart images, downloads) the browser then fetches over HTTP. The bundled
+# budgets allow about 50% over each page's size when they were set (page defaults, no uploads);
+# pages missing from the file get the default, and an entry only needs the limits it changes.
+DEFAULT_BUDGET = {'messages': 250, 'bytes': 160 * 1024, 'media_bytes': 1024 * 1024}
+
+_messages = telemetry.histogram(
+	'publishing_guide_render_messages', "Delta messages sent for one page render", ['page'],
+	buckets=(10, 25, 50, 100, 150, 200, 300, 500, 1000))
+_bytes = telemetry.histogram(
+	'publishing_guide_render_bytes', "Websocket bytes sent for one page render", ['page'],
+	buckets=(8192, 32768, 65536, 131072, 262144, 524288, 1048576, 4194304))
+_overruns = telemetry.counter('publishing_guide_payload_overruns_total', "Page renders over their payload budget", ['page', 'limit'])
+
+# Latest measurement per page in this process (read by the budget check below)
+renders = {}
+
+
+def load_budgets(path=BUDGETS_PATH):
+	if not os.path.exists(path):
+		return {}
+	with open(path) as handle:
+		budgets = json.load(handle)
+	for page, budget in budgets.items():
+		unknown = set(budget) - set(DEFAULT_BUDGET)
+		if unknown:
+			raise ValueError(f"Unknown budget limit(s) for '{page}': {', '.join(sorted(unknown))}")
+	return budgets
+
+
+_loaded_budgets = None
+
+
+def _budgets():
+	# The budgets file is read once per process
+	global _loaded_budgets
+	if _loaded_budgets is None:
+		_loaded_budgets = load_budgets()
+	return _loaded_budgets
+
+
+def budget_for(page, budgets):
+	return {**DEFAULT_BUDGET, **budgets.get(page, {})}
+
+
+def overruns(measurement, budget):
+	return {limit: (measurement[limit], allowed) for limit, allowed in budget.items() if measurement[limit] > allowed}
+
+
+def _media_bytes(names):
+	from streamlit.runtime import Runtime
+
+	if not names or not Runtime.exists():
+		return 0
+	storage = Runtime.instance().media_file_mgr._storage
+	total = 0
+	for name in names:
+		try:
+			total += len(storage.get_file(name).content)
+		except Exception:
+			# Already evicted from the media store; nothing left to count
+			pass
+	return total
+
+
+# Counts what one script run sends to the browser by wrapping the session's enqueue callback
+# (the point where Streamlit hands a ForwardMsg to the websocket). Messages the browser
+# already has are sent as short references, and are counted at that size.
+class PayloadMeter:
+	def __init__(self, ctx):
+		self.messages = 0
+		self.bytes = 0
+		self.media = set()
+		self._ctx = ctx
+		enqueue = ctx._enqueue
+		# A rerun interrupted by a newer one never called finish(); unwrap its meter
+		previous = getattr(enqueue, '__self__', None)
+		if isinstance(previous, PayloadMeter):
+			enqueue = previous._enqueue
+		self._enqueue = enqueue
+		ctx._enqueue = self._record
+
+	def _record(self, msg):
+		self.bytes += msg.ByteSize()
+		if msg.WhichOneof('type') == 'delta':
+			self.messages += 1
+			if msg.delta.new_element.WhichOneof('type') in MEDIA_ELEMENTS:
+				self.media.update(MEDIA_URL_RE.findall(str(msg.delta.new_element)))
+		self._enqueue(msg)
+
+	def finish(self, page, budgets=None):
+		self._ctx._enqueue = self._enqueue
+		measurement = {'messages': self.messages, 'bytes': self.bytes, 'media_bytes': _media_bytes(self.media)}
+		renders[page] = measurement
+		_messages.observe(self.messages, page)
+		_bytes.observe(self.bytes, page)
+		over = overruns(measurement, budget_for(page, _budgets() if budgets is None else budgets))
+		for limit in over:
+			_overruns.inc(page, limit)
+		return measurement, over
+
+
+def check_pages(app_path, pages=None, budgets=None, timeout=120):
+	# Renders every page with Streamlit's AppTest (no browser or server) and measures each
+	# render; the app updates `renders` in this module as it runs in this process
+	from streamlit.testing.v1 import AppTest
+
+	budgets = load_budgets() if budgets is None else budgets
+	app = AppTest.from_file(app_path, default_timeout=timeout).run()
+	if app.exception:
+		raise RuntimeError(f"The app failed to start: {app.exception[0].message}")
+	results = []
+	for page in app.sidebar.radio[0].options:
+		if pages and page not in pages:
+			continue
+		app.sidebar.radio[0].set_value(page).run()
+		if app.exception:
+			raise RuntimeError(f"'{page}' failed to render: {app.exception[0].message}")
+		measurement = renders[page]
+		results.append({'page': page, **measurement, 'over': overruns(measurement, budget_for(page, budgets))})
+	return results
+
+
+def main(argv=None):
+	from publishing_guide import warmup
+
+	parser = argparse.ArgumentParser(description="Render every page and fail if one exceeds its payload budget.")
+	parser.add_argument('--app', default=warmup.APP_PATH)
+	parser.add_argument('--budgets', default=BUDGETS_PATH, help="JSON file of per-page limits (messages, bytes, media_bytes)")
+	parser.add_argument('--page', action='append', help="Only check this page (repeatable)")
+	args = parser.parse_args(argv)
+
+	# Run as `python -m`, this file is __main__; the app records into the imported module
+	module = importlib.import_module('publishing_guide.payloads')
+	results = module.check_pages(args.app, args.page, load_budgets(args.budgets))
+	failed = False
+	for result in results:
+		status = 'OVER' if result['over'] else 'ok'
+		print(f"{status:4}  {result['messages']:5} msgs  {result['bytes'] / 1024:8.1f} KiB  "
+			  f"{result['media_bytes'] / 1024:8.1f} KiB media  {result['page']}")
+		for limit, (value, allowed) in result['over'].items():
+			print(f"      {limit}: {value:,} > {allowed:,}")
+			failed = True
+	return 1 if failed else 0
+
+
+if __name__ == '__main__':
+	sys.exit(main())
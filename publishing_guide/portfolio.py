@@ -0,0 +1,222 @@
+import contextlib
+import datetime
+import queue
+import sqlite3
+
+import pandas as pd
+
+from publishing_guide.storage import data_path, ensure_parent
+
+DEFAULT_PORTFOLIO_PATH = data_path('portfolio.sqlite')
+POOL_SIZE = 8
+
+STAGES = ['Drafting', 'Internal review', 'Submitted', 'Under review', 'Revision', 'Accepted', 'Published', 'Rejected']
+# Manuscripts in these stages are finished: their last stage is not drawn up to today
+CLOSED_STAGES = {'Published', 'Rejected'}
+STAGE_COLORS = {
+	'Drafting': '#9CA3AF',
+	'Internal review': '#6B7280',
+	'Submitted': '#60A5FA',
+	'Under review': '#2563EB',
+	'Revision': '#F59E0B',
+	'Accepted': '#34D399',
+	'Published': '#047857',
+	'Rejected': '#DC2626',
+}
+CSV_COLUMNS = {'title', 'journal', 'stage', 'lead_author', 'started', 'deadline'}
+
+
+def _date(value):
+	if value is None or value == '' or (not isinstance(value, str) and pd.isna(value)):
+		return None
+	return pd.Timestamp(value).strftime('%Y-%m-%d')
+
+
+def _stage(stage):
+	match = next((known for known in STAGES if known.lower() == str(stage).strip().lower()), None)
+	if match is None:
+		raise ValueError(f"Unknown stage '{stage}'; expected one of: {', '.join(STAGES)}")
+	return match
+
+
+# A fixed set of SQLite connections shared by every session. The database runs in WAL mode,
+# so readers never wait for the writer and each other; writes are serialised by SQLite itself
+# (busy_timeout makes a second writer wait instead of failing).
+class ConnectionPool:
+	def __init__(self, path, size=POOL_SIZE):
+		self.path = ensure_parent(path)
+		self._idle = queue.LifoQueue()
+		for _ in range(size):
+			connection = sqlite3.connect(self.path, check_same_thread=False, timeout=30)
+			connection.execute("PRAGMA journal_mode = WAL")
+			connection.execute("PRAGMA synchronous = NORMAL")
+			connection.execute("PRAGMA foreign_keys = ON")
+			self._idle.put(connection)
+
+	@contextlib.contextmanager
+	def connection(self):
+		connection = self._idle.get()
+		try:
+			with connection:
+				yield connection
+		finally:
+			self._idle.put(connection)
+
+	def close(self):
+		while not self._idle.empty():
+			self._idle.get_nowait().close()
+
+
+# Manuscripts of a lab and the dates each one entered each stage. The current stage, journal
+# and deadline are indexed for the dashboard filters; the stage history feeds the Gantt view.
+# History entries are ordered by date and then by insertion id, so stages entered on the same
+# day keep the order they were entered in.
+class PortfolioTracker:
+	def __init__(self, path=DEFAULT_PORTFOLIO_PATH, pool_size=POOL_SIZE):
+		self.path = path
+		self.pool = ConnectionPool(path, pool_size)
+		with self.pool.connection() as connection:
+			# Files written before the history had an id are copied into the new table once
+			history_columns = [row[1] for row in connection.execute("PRAGMA table_info(stage_history)")]
+			migrate = bool(history_columns) and 'id' not in history_columns
+			if migrate:
+				connection.execute("ALTER TABLE stage_history RENAME TO stage_history_without_id")
+			connection.executescript("""
+				CREATE TABLE IF NOT EXISTS manuscripts (
+					id INTEGER PRIMARY KEY,
+					title TEXT NOT NULL,
+					lead_author TEXT NOT NULL DEFAULT '',
+					journal TEXT NOT NULL DEFAULT '',
+					stage TEXT NOT NULL,
+					started TEXT NOT NULL,
+					deadline TEXT,
+					updated TEXT NOT NULL
+				);
+				CREATE TABLE IF NOT EXISTS stage_history (
+					id INTEGER PRIMARY KEY,
+					manuscript INTEGER NOT NULL REFERENCES manuscripts (id) ON DELETE CASCADE,
+					stage TEXT NOT NULL,
+					entered TEXT NOT NULL
+				);
+				CREATE INDEX IF NOT EXISTS stage_history_by_manuscript ON stage_history (manuscript, entered, id);
+				CREATE INDEX IF NOT EXISTS manuscripts_by_stage ON manuscripts (stage, deadline);
+				CREATE INDEX IF NOT EXISTS manuscripts_by_journal ON manuscripts (journal);
+				CREATE INDEX IF NOT EXISTS manuscripts_by_deadline ON manuscripts (deadline) WHERE deadline IS NOT NULL;
+			""")
+			if migrate:
+				connection.execute(
+					"INSERT INTO stage_history (manuscript, stage, entered) "
+					"SELECT manuscript, stage, entered FROM stage_history_without_id ORDER BY manuscript, entered")
+				connection.execute("DROP TABLE stage_history_without_id")
+
+	def close(self):
+		self.pool.close()
+
+	def __len__(self):
+		with self.pool.connection() as connection:
+			return connection.execute("SELECT COUNT(*) FROM manuscripts").fetchone()[0]
+
+	def add_many(self, records):
+		# (title, journal, stage, lead_author, started, deadline) tuples in one transaction;
+		# returns the number added
+		today = datetime.date.today().isoformat()
+		rows = [
+			(str(title).strip(), journal or '', _stage(stage), lead_author or '', _date(started) or today, _date(deadline))
+			for title, journal, stage, lead_author, started, deadline in records
+		]
+		with self.pool.connection() as connection:
+			for title, journal, stage, lead_author, started, deadline in rows:
+				manuscript = connection.execute(
+					"INSERT INTO manuscripts (title, lead_author, journal, stage, started, deadline, updated) "
+					"VALUES (?, ?, ?, ?, ?, ?, ?)",
+					(title, lead_author, journal, stage, started, deadline, today)).lastrowid
+				connection.execute(
+					"INSERT INTO stage_history (manuscript, stage, entered) VALUES (?, ?, ?)", (manuscript, stage, started))
+		return len(rows)
+
+	def add(self, title, journal='', stage=STAGES[0], lead_author='', started=None, deadline=None):
+		self.add_many([(title, journal, stage, lead_author, started, deadline)])
+
+	def import_csv(self, source):
+		frame = pd.read_csv(source, dtype=str).fillna('')
+		frame.columns = [column.strip().lower().replace(' ', '_') for column in frame.columns]
+		if 'title' not in frame:
+			raise ValueError("The manuscript list needs a 'title' column")
+		for column in CSV_COLUMNS - set(frame.columns):
+			frame[column] = STAGES[0] if column == 'stage' else ''
+		frame = frame[frame['title'].str.strip() != '']
+		return self.add_many(frame[['title', 'journal', 'stage', 'lead_author', 'started', 'deadline']].itertuples(index=False))
+
+	def move(self, manuscript, stage, when=None):
+		# Moving a manuscript to the stage it is in changes nothing
+		stage, when = _stage(stage), _date(when) or datetime.date.today().isoformat()
+		with self.pool.connection() as connection:
+			moved = connection.execute(
+				"UPDATE manuscripts SET stage = ?, updated = ? WHERE id = ? AND stage != ?",
+				(stage, when, manuscript, stage)).rowcount
+			if moved:
+				connection.execute(
+					"INSERT INTO stage_history (manuscript, stage, entered) VALUES (?, ?, ?)", (manuscript, stage, when))
+
+	def set_deadline(self, manuscript, deadline):
+		with self.pool.connection() as connection:
+			connection.execute("UPDATE manuscripts SET deadline = ? WHERE id = ?", (_date(deadline), manuscript))
+
+	def remove(self, manuscript):
+		with self.pool.connection() as connection:
+			connection.execute("DELETE FROM manuscripts WHERE id = ?", (manuscript,))
+
+	def _where(self, stages=None, journal=None, due_before=None):
+		clauses, parameters = [], []
+		if stages:
+			clauses.append(f"stage IN ({','.join('?' * len(stages))})")
+			parameters.extend(stages)
+		if journal:
+			clauses.append("journal = ?")
+			parameters.append(journal)
+		if due_before is not None:
+			clauses.append("deadline <= ?")
+			parameters.append(_date(due_before))
+		return (' WHERE ' + ' AND '.join(clauses) if clauses else ''), parameters
+
+	def manuscripts(self, stages=None, journal=None, due_before=None, limit=None):
+		where, parameters = self._where(stages, journal, due_before)
+		query = f"SELECT * FROM manuscripts{where} ORDER BY deadline IS NULL, deadline, id"
+		if limit:
+			query += f" LIMIT {int(limit)}"
+		with self.pool.connection() as connection:
+			return pd.read_sql_query(query, connection, params=parameters)
+
+	def journals(self):
+		with self.pool.connection() as connection:
+			return [journal for journal, in connection.execute(
+				"SELECT DISTINCT journal FROM manuscripts WHERE journal != '' ORDER BY journal")]
+
+	def stage_counts(self):
+		with self.pool.connection() as connection:
+			counts = dict(connection.execute("SELECT stage, COUNT(*) FROM manuscripts GROUP BY stage").fetchall())
+		return pd.Series({stage: counts.get(stage, 0) for stage in STAGES}, name='manuscripts')
+
+	def segments(self, manuscripts):
+		# (manuscript, stage, start, end) for every stage each manuscript has passed through; a stage
+		# lasts until the next one was entered, and the current one until today unless it is final
+		ids = [int(manuscript) for manuscript in manuscripts]
+		if not ids:
+			return pd.DataFrame(columns=['manuscript', 'stage', 'start', 'end'])
+		today = datetime.date.today().isoformat()
+		with self.pool.connection() as connection:
+			connection.execute("CREATE TEMP TABLE IF NOT EXISTS selected (id INTEGER PRIMARY KEY)")
+			connection.execute("DELETE FROM selected")
+			connection.executemany("INSERT OR IGNORE INTO selected VALUES (?)", ((manuscript,) for manuscript in ids))
+			frame = pd.read_sql_query(f"""
+				SELECT h.manuscript, h.stage, h.entered AS start,
+					COALESCE(
+						LEAD(h.entered) OVER (PARTITION BY h.manuscript ORDER BY h.entered, h.id),
+						CASE WHEN h.stage IN ({','.join('?' * len(CLOSED_STAGES))}) THEN h.entered ELSE ? END
+					) AS end
+				FROM stage_history h JOIN selected s ON s.id = h.manuscript
+				ORDER BY h.manuscript, h.entered, h.id
+			""", connection, params=[*sorted(CLOSED_STAGES), today])
+		frame['start'] = pd.to_datetime(frame['start'])
+		frame['end'] = pd.to_datetime(frame['end'])
+		return frame
@@ -0,0 +1,180 @@
+import argparse
+import cProfile
+import hmac
+import os
+import re
+import sys
+import threading
+import time
+from collections import Counter
+
+from publishing_guide.storage import data_path
+
+DEFAULT_PROFILE_DIR = data_path('profiles')
+SAMPLE_INTERVAL = 0.005
+KEEP_PROFILES = 50
+
+# PUBLISHING_GUIDE_PROFILE lists the pages to profile on every rerun (comma-separated titles,
+# or "all"). Any single rerun can also be profiled with ?profile=<token> when
+# PUBLISHING_GUIDE_ADMIN_TOKEN is set; without a token the query parameter is ignored.
+# Both are read once at import, so with profiling off a rerun costs one set lookup.
+PROFILED_PAGES = frozenset(page.strip() for page in os.environ.get('PUBLISHING_GUIDE_PROFILE', '').split(',') if page.strip())
+ADMIN_TOKEN = os.environ.get('PUBLISHING_GUIDE_ADMIN_TOKEN', '')
+PROFILE_MODE = os.environ.get('PUBLISHING_GUIDE_PROFILE_MODE', 'sample')
+
+# Profile running on each script thread. A rerun that is interrupted (a widget change triggers
+# a new one) never reaches finish(); its profile is closed when the next one starts.
+_active = {}
+
+
+def _frame_name(code):
+	return f'{os.path.basename(code.co_filename)}:{code.co_name}'
+
+
+def _slug(text):
+	return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')[:60] or 'rerun'
+
+
+def rotate(directory, keep=KEEP_PROFILES):
+	# Newest files are kept; rotation runs after every write, so the folder never grows past `keep`
+	entries = sorted((entry for entry in os.scandir(directory) if entry.is_file()), key=lambda entry: entry.stat().st_mtime, reverse=True)
+	for entry in entries[keep:]:
+		try:
+			os.remove(entry.path)
+		except FileNotFoundError:
+			pass
+
+
+# Samples the stack of one thread (the Streamlit script thread) from a background thread,
+# so the profiled code runs unmodified. Output is in the folded format read by flamegraph.pl,
+# speedscope and inferno: one line per distinct stack, root first, with its sample count.
+class SamplingProfiler:
+	def __init__(self, thread_id=None, interval=SAMPLE_INTERVAL):
+		self.thread_id = thread_id or threading.get_ident()
+		self.interval = interval
+		self.stacks = Counter()
+		self._stopped = threading.Event()
+		self._thread = None
+
+	def _sample(self):
+		own_file = __file__
+		while not self._stopped.wait(self.interval):
+			frame = sys._current_frames().get(self.thread_id)
+			if frame is None:
+				break
+			names = []
+			while frame is not None:
+				if frame.f_code.co_filename != own_file:
+					names.append(_frame_name(frame.f_code))
+				frame = frame.f_back
+			self.stacks[';'.join(reversed(names))] += 1
+
+	def start(self):
+		self._thread = threading.Thread(target=self._sample, name='publishing-guide-profiler', daemon=True)
+		self._thread.start()
+		return self
+
+	def stop(self):
+		self._stopped.set()
+		self._thread.join()
+		return self
+
+	def folded(self):
+		return ''.join(f'{stack} {count}\n' for stack, count in self.stacks.most_common())
+
+	def write(self, path):
+		with open(path, 'w', encoding='utf-8') as handle:
+			handle.write(self.folded())
+
+
+# cProfile records every call: exact counts and times, at several times the sampler's overhead.
+# The .prof file opens in snakeviz or `python -m pstats`.
+class DeterministicProfiler:
+	def __init__(self):
+		self.profile = cProfile.Profile()
+
+	def start(self):
+		self.profile.enable()
+		return self
+
+	def stop(self):
+		self.profile.disable()
+		return self
+
+	def write(self, path):
+		self.profile.dump_stats(path)
+
+
+class RerunProfile:
+	def __init__(self, label, mode=PROFILE_MODE, directory=DEFAULT_PROFILE_DIR, keep=KEEP_PROFILES):
+		if mode not in ('sample', 'deterministic'):
+			raise ValueError(f"Unknown profiling mode '{mode}' (use 'sample' or 'deterministic')")
+		self.label = label
+		self.directory = directory
+		self.keep = keep
+		self.extension = '.folded' if mode == 'sample' else '.prof'
+		self.profiler = SamplingProfiler() if mode == 'sample' else DeterministicProfiler()
+		self.started = time.time()
+		self.thread_id = threading.get_ident()
+		previous = _active.get(self.thread_id)
+		if previous is not None:
+			previous.finish()
+		_active[self.thread_id] = self
+		self.profiler.start()
+
+	def finish(self):
+		if _active.get(self.thread_id) is self:
+			del _active[self.thread_id]
+		self.profiler.stop()
+		os.makedirs(self.directory, exist_ok=True)
+		stamp = time.strftime('%Y%m%d-%H%M%S', time.localtime(self.started)) + f'-{int(self.started * 1000) % 1000:03d}'
+		path = os.path.join(self.directory, f'{stamp}-{_slug(self.label)}{self.extension}')
+		self.profiler.write(path)
+		rotate(self.directory, self.keep)
+		return path
+
+
+def requested(page, token=None):
+	if page in PROFILED_PAGES or 'all' in PROFILED_PAGES:
+		return True
+	return bool(token and ADMIN_TOKEN and hmac.compare_digest(str(token), ADMIN_TOKEN))
+
+
+def start(page, token=None):
+	# Returns a running profile for this rerun, or None (the common case) when profiling is off
+	if not requested(page, token):
+		return None
+	return RerunProfile(page)
+
+
+def merge(paths):
+	# Several folded profiles of the same page add up to one flamegraph with more samples
+	total = Counter()
+	for path in paths:
+		with open(path, encoding='utf-8') as handle:
+			for line in handle:
+				stack, _, count = line.rstrip('\n').rpartition(' ')
+				if stack:
+					total[stack] += int(count)
+	return ''.join(f'{stack} {count}\n' for stack, count in total.most_common())
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Merge folded rerun profiles into one flamegraph input.")
+	parser.add_argument('paths', nargs='*', help="Folded profiles (default: every .folded file in the profile folder)")
+	parser.add_argument('-d', '--directory', default=DEFAULT_PROFILE_DIR)
+	parser.add_argument('-p', '--page', help="Only profiles of this page")
+	args = parser.parse_args(argv)
+
+	paths = args.paths
+	if not paths:
+		if not os.path.isdir(args.directory):
+			parser.error(f"No profiles in {args.directory}")
+		paths = sorted(entry.path for entry in os.scandir(args.directory) if entry.name.endswith('.folded'))
+	if args.page:
+		paths = [path for path in paths if path.endswith(f'-{_slug(args.page)}.folded')]
+	sys.stdout.write(merge(paths))
+
+
+if __name__ == '__main__':
+	main()
@@ -0,0 +1,166 @@
+import functools
+import os
+import re
+
+import numpy as np
+import pandas as pd
+
+from publishing_guide import telemetry
+
+WORD_LIST_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resources', 'common_words.txt')
+
+# One pass over the text yields abbreviations (kept whole so their dot does not end a
+# sentence), numbers, words and runs of sentence-ending punctuation. Abbreviations that often
+# close a sentence ("... and so on, etc.") only count as such before a lowercase word, a number or
+# punctuation that cannot start a sentence; titles (Dr., Prof.) and cf. come before capitals.
+TOKEN_RE = re.compile(
+	r"(?:e\.g|i\.e|cf|dr|prof)\.(?!\w)"
+	r"|(?:et al|etc|vs|approx|figs?|eqs?|no)\.(?=\s*[,;:)\]]|\s+[(\[]?(?-i:[a-z\d]))"
+	r"|[a-z]\.(?=\s+(?-i:[a-z]))"
+	r"|\d+(?:[.,]\d+)*"
+	r"|[^\W\d_]+(?:['’-][^\W\d_]+)*"
+	r"|[.!?]+",
+	re.IGNORECASE)
+VOWEL_GROUP_RE = re.compile(r'[aeiouy]+')
+INFLECTIONS = ('ies', 'es', 's', 'ed', 'ing', 'ly', "'s")
+
+SCORE_COLUMNS = [
+	'words', 'sentences', 'flesch_reading_ease', 'flesch_kincaid_grade', 'gunning_fog', 'smog', 'coleman_liau',
+	'mean_sentence_length', 'p90_sentence_length', 'long_sentence_share', 'jargon_density',
+]
+LONG_SENTENCE = 30
+
+
+@functools.lru_cache(maxsize=1)
+def common_words_ranked(path=WORD_LIST_PATH):
+	# The bundled list, most frequent first
+	with open(path, encoding='utf-8') as handle:
+		return tuple(line.strip() for line in handle if line.strip() and not line.startswith('#'))
+
+
+@functools.lru_cache(maxsize=1)
+def common_words(path=WORD_LIST_PATH):
+	return frozenset(common_words_ranked(path))
+
+
+@functools.lru_cache(maxsize=200_000)
+def syllables(word):
+	word = word.lower()
+	count = len(VOWEL_GROUP_RE.findall(word))
+	if word.endswith('e') and not word.endswith(('le', 'ee')) and count > 1:
+		count -= 1
+	return max(count, 1)
+
+
+@functools.lru_cache(maxsize=200_000)
+def is_jargon(word):
+	# Acronyms (DNA, CRISPR) are always specialist; other words are if neither they nor a
+	# simple uninflected form appear in the bundled common-word table. Abbreviation tokens
+	# (e.g., et al., initials) keep their dot and are never jargon.
+	if word.endswith('.'):
+		return False
+	if len(word) > 1 and word.isupper():
+		return True
+	lowered = word.lower()
+	vocabulary = common_words()
+	if lowered in vocabulary or len(lowered) <= 2:
+		return False
+	for suffix in INFLECTIONS:
+		if lowered.endswith(suffix) and lowered[:-len(suffix)] in vocabulary:
+			return False
+	if lowered.endswith(('ied', 'ies')) and lowered[:-3] + 'y' in vocabulary:
+		return False
+	return True
+
+
+telemetry.watch_lru_cache('syllables', syllables)
+telemetry.watch_lru_cache('jargon', is_jargon)
+
+
+def _token_features(tokens):
+	# Features are computed once per distinct token and broadcast back with the inverse index
+	unique, inverse = np.unique(np.asarray(tokens, dtype=object).astype(str), return_inverse=True)
+	is_end = np.array([token[0] in '.!?' for token in unique])
+	is_number = np.array([token[0].isdigit() for token in unique])
+	is_word = ~is_end
+	letters = np.array([sum(char.isalpha() for char in token) for token in unique])
+	syllable_counts = np.array([syllables(token) if not number else 1 for token, number in zip(unique, is_number)])
+	jargon = np.array([not number and not end and is_jargon(token) for token, number, end in zip(unique, is_number, is_end)])
+	return {
+		'end': is_end[inverse],
+		'word': is_word[inverse],
+		'letters': np.where(is_word, letters, 0)[inverse],
+		'syllables': np.where(is_word, syllable_counts, 0)[inverse],
+		'complex': (is_word & (syllable_counts >= 3))[inverse],
+		'jargon': jargon[inverse],
+	}, unique, inverse
+
+
+def score_texts(texts):
+	# Vectorised batch path: tokens from every text are pooled, featurised per distinct
+	# token, and reduced to per-text totals with bincount over the text index
+	texts = ['' if text is None or (isinstance(text, float) and np.isnan(text)) else str(text) for text in texts]
+	token_lists = [TOKEN_RE.findall(text) for text in texts]
+	lengths = np.array([len(tokens) for tokens in token_lists])
+	n_docs = len(texts)
+	if lengths.sum() == 0:
+		return pd.DataFrame(0.0, index=range(n_docs), columns=SCORE_COLUMNS)
+
+	doc = np.repeat(np.arange(n_docs), lengths)
+	features, _, _ = _token_features([token for tokens in token_lists for token in tokens])
+
+	def per_doc(values):
+		return np.bincount(doc, weights=values, minlength=n_docs)
+
+	words = per_doc(features['word'])
+
+	# Sentence ids run across the whole pool; a text's final sentence needs no terminator
+	sentence_id = np.cumsum(features['end']) - features['end'] + np.cumsum(np.r_[0, np.diff(doc) != 0])
+	sentence_words = np.bincount(sentence_id, weights=features['word'])
+	sentence_doc = np.zeros(len(sentence_words), dtype=np.int64)
+	sentence_doc[sentence_id] = doc
+	nonempty = sentence_words > 0
+	sentence_words, sentence_doc = sentence_words[nonempty], sentence_doc[nonempty]
+	sentences = np.bincount(sentence_doc, minlength=n_docs).astype(np.float64)
+	long_sentences = np.bincount(sentence_doc, weights=sentence_words > LONG_SENTENCE, minlength=n_docs)
+	p90 = pd.Series(sentence_words).groupby(sentence_doc).quantile(0.9).reindex(range(n_docs)).to_numpy()
+
+	with np.errstate(divide='ignore', invalid='ignore'):
+		words_per_sentence = words / sentences
+		syllables_per_word = per_doc(features['syllables']) / words
+		complex_share = per_doc(features['complex']) / words
+		table = pd.DataFrame({
+			'words': words.astype(np.int64),
+			'sentences': sentences.astype(np.int64),
+			'flesch_reading_ease': 206.835 - 1.015 * words_per_sentence - 84.6 * syllables_per_word,
+			'flesch_kincaid_grade': 0.39 * words_per_sentence + 11.8 * syllables_per_word - 15.59,
+			'gunning_fog': 0.4 * (words_per_sentence + 100 * complex_share),
+			'smog': 1.043 * np.sqrt(per_doc(features['complex']) * 30 / sentences) + 3.1291,
+			'coleman_liau': 0.0588 * (100 * per_doc(features['letters']) / words) - 0.296 * (100 * sentences / words) - 15.8,
+			'mean_sentence_length': words_per_sentence,
+			'p90_sentence_length': p90,
+			'long_sentence_share': long_sentences / sentences,
+			'jargon_density': per_doc(features['jargon']) / words,
+		})
+	return table.replace([np.inf, -np.inf], np.nan).round(2)
+
+
+def score_text(text):
+	scores = score_texts([text]).iloc[0].to_dict()
+	scores['words'], scores['sentences'] = int(scores['words']), int(scores['sentences'])
+	tokens = TOKEN_RE.findall(text or '')
+	sentence_lengths, current = [], 0
+	for token in tokens:
+		if token[0] in '.!?':
+			if current:
+				sentence_lengths.append(current)
+			current = 0
+		else:
+			current += 1
+	if current:
+		sentence_lengths.append(current)
+	scores['sentence_lengths'] = sentence_lengths
+	scores['jargon_terms'] = pd.Series(
+		[token for token in tokens if token[0] not in '.!?' and not token[0].isdigit() and is_jargon(token)],
+		dtype=object).value_counts().head(15).to_dict()
+	return scores
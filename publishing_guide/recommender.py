@@ -0,0 +1,165 @@
+import argparse
+import csv
+import re
+from collections import Counter
+
+import numpy as np
+
+from publishing_guide.storage import data_path, ensure_parent
+
+DEFAULT_INDEX_PATH = data_path('journal_index.npz')
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9]+(?:-[a-z0-9]+)*")
+STOPWORDS = frozenset("""
+a about above after again against all also am an and any are as at be because been before being below between both
+but by can could did do does doing down during each few for from further had has have having he her here hers him his
+how however i if in into is it its itself just me more most my no nor not now of off on once only or other our ours out
+over own paper papers research same she should so some study studies such than that the their theirs them then there
+these they this those through to too under until up upon using very via was we were what when where which while who whom
+why will with within without would you your journal journals publishes published publication scope articles article
+""".split())
+
+
+def tokenize(text):
+	return [token for token in TOKEN_RE.findall(text.lower()) if token not in STOPWORDS]
+
+
+def _pack_strings(values):
+	# One newline-joined UTF-8 buffer is far smaller than a fixed-width unicode array
+	return np.frombuffer('\n'.join(values).encode('utf-8'), dtype=np.uint8)
+
+
+def _unpack_strings(buffer):
+	text = buffer.tobytes().decode('utf-8')
+	return text.split('\n') if text else []
+
+
+# BM25 weights stored term-major (CSC of the journal x term matrix), so a query is a
+# sparse matrix-vector product over only the postings of its own terms
+class JournalIndex:
+	def __init__(self, journals, terms, term_ptr, doc_ids, weights):
+		self.journals = journals
+		self.terms = terms
+		self.vocabulary = {term: i for i, term in enumerate(terms)}
+		self.term_ptr = term_ptr
+		self.doc_ids = doc_ids
+		self.weights = weights
+
+	def __len__(self):
+		return len(self.journals)
+
+	@classmethod
+	def build(cls, documents, k1=1.2, b=0.75):
+		# documents: iterable of (journal name, scope statement + sample abstracts)
+		journals = []
+		vocabulary = {}
+		term_ids, doc_ids, term_freqs, doc_lengths = [], [], [], []
+
+		for doc_id, (journal, text) in enumerate(documents):
+			journals.append(journal)
+			counts = Counter(tokenize(text))
+			doc_lengths.append(sum(counts.values()))
+			for term, tf in counts.items():
+				term_ids.append(vocabulary.setdefault(term, len(vocabulary)))
+				doc_ids.append(doc_id)
+				term_freqs.append(tf)
+
+		term_ids = np.asarray(term_ids, dtype=np.int32)
+		doc_ids = np.asarray(doc_ids, dtype=np.int32)
+		term_freqs = np.asarray(term_freqs, dtype=np.float32)
+		doc_lengths = np.asarray(doc_lengths, dtype=np.float32)
+
+		n_docs = len(journals)
+		n_terms = len(vocabulary)
+		df = np.bincount(term_ids, minlength=n_terms).astype(np.float32)
+		idf = np.log1p((n_docs - df + 0.5) / (df + 0.5))
+		avg_length = doc_lengths.mean() if n_docs else 1.0
+		norm = k1 * (1 - b + b * doc_lengths[doc_ids] / max(avg_length, 1.0))
+		weights = idf[term_ids] * term_freqs * (k1 + 1) / (term_freqs + norm)
+
+		order = np.argsort(term_ids, kind='stable')
+		term_ptr = np.zeros(n_terms + 1, dtype=np.int64)
+		np.cumsum(df.astype(np.int64), out=term_ptr[1:])
+
+		terms = [None] * n_terms
+		for term, i in vocabulary.items():
+			terms[i] = term
+
+		return cls(journals, terms, term_ptr, doc_ids[order], weights[order].astype(np.float32))
+
+	@classmethod
+	def from_csv(cls, path, k1=1.2, b=0.75):
+		# Expects 'journal' and 'scope' columns; an optional 'abstract' column may repeat the journal across rows
+		texts = {}
+		with open(path, newline='', encoding='utf-8') as handle:
+			for row in csv.DictReader(handle):
+				journal = row['journal'].strip()
+				parts = texts.setdefault(journal, [])
+				parts.append(row.get('scope') or '')
+				parts.append(row.get('abstract') or '')
+		return cls.build(((journal, ' '.join(parts)) for journal, parts in texts.items()), k1=k1, b=b)
+
+	def save(self, path=DEFAULT_INDEX_PATH):
+		np.savez(
+			ensure_parent(path),
+			journals=_pack_strings(self.journals),
+			terms=_pack_strings(self.terms),
+			term_ptr=self.term_ptr,
+			doc_ids=self.doc_ids,
+			weights=self.weights,
+		)
+		return path
+
+	@classmethod
+	def load(cls, path=DEFAULT_INDEX_PATH):
+		with np.load(path, allow_pickle=False) as data:
+			return cls(
+				_unpack_strings(data['journals']),
+				_unpack_strings(data['terms']),
+				data['term_ptr'],
+				data['doc_ids'],
+				data['weights'],
+			)
+
+	def scores(self, text, title=''):
+		# Title words count double: they are the author's own summary of the topic
+		query = Counter(tokenize(text))
+		for term in tokenize(title):
+			query[term] += 2
+
+		postings, weights = [], []
+		for term, count in query.items():
+			term_id = self.vocabulary.get(term)
+			if term_id is None:
+				continue
+			start, end = self.term_ptr[term_id], self.term_ptr[term_id + 1]
+			postings.append(self.doc_ids[start:end])
+			weights.append(self.weights[start:end] * count)
+
+		if not postings:
+			return np.zeros(len(self.journals), dtype=np.float64)
+		return np.bincount(np.concatenate(postings), weights=np.concatenate(weights), minlength=len(self.journals))
+
+	def recommend(self, abstract, title='', k=10):
+		scores = self.scores(abstract, title)
+		k = min(k, int(np.count_nonzero(scores)))
+		if k == 0:
+			return []
+		top = np.argpartition(-scores, k - 1)[:k]
+		top = top[np.argsort(-scores[top])]
+		return [(self.journals[i], float(scores[i])) for i in top]
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(description="Build the local journal recommender index from a scope corpus CSV.")
+	parser.add_argument('corpus', help="CSV with 'journal', 'scope' and optional 'abstract' columns")
+	parser.add_argument('-o', '--output', default=DEFAULT_INDEX_PATH)
+	args = parser.parse_args(argv)
+
+	index = JournalIndex.from_csv(args.corpus)
+	index.save(args.output)
+	print(f"Indexed {len(index)} journals and {len(index.terms)} terms into {args.output}")
+
+
+if __name__ == '__main__':
+	main()
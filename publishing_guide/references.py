@@ -0,0 +1,404 @@
+import difflib
+import io
+import os
+import re
+import unicodedata
+from collections import defaultdict
+
+import pandas as pd
+
+from publishing_guide.manuscript import iter_lines
+
+FORMATS = {'.bib': 'bibtex', '.bibtex': 'bibtex', '.ris': 'ris', '.txt': 'plain'}
+RESULT_COLUMNS = [
+	'entry', 'key', 'first_author', 'year', 'title', 'journal', 'doi', 'issn', 'problems', 'duplicate_of', 'match',
+	'similarity',
+]
+
+# Crossref's recommended pattern for modern DOIs, applied after stripping resolver prefixes
+DOI_RE = re.compile(r'^10\.\d{4,9}/[-._;()/:<>\[\]A-Za-z0-9]+$')
+DOI_PREFIX_RE = re.compile(r'^(?:https?://(?:dx\.)?doi\.org/|doi:\s*)', re.IGNORECASE)
+DOI_IN_TEXT_RE = re.compile(r'\b(?:https?://(?:dx\.)?doi\.org/|doi:\s*)?(10\.\d{4,9}/\S+)', re.IGNORECASE)
+ISSN_RE = re.compile(r'^(\d{4})-?(\d{3}[\dX])$', re.IGNORECASE)
+YEAR_RE = re.compile(r'\((\d{4})[a-z]?\)|\b(1[5-9]\d\d|20\d\d)[a-z]?\b')
+
+BIBTEX_ENTRY_RE = re.compile(r'@\s*([A-Za-z]+)\s*\{')
+BIBTEX_KEY_RE = re.compile(r'@\s*([A-Za-z]+)\s*\{\s*([^,\s]*)\s*,?')
+BIBTEX_FIELD_RE = re.compile(r'[\s,]*([A-Za-z][\w:.+-]*)\s*=\s*')
+BIBTEX_BARE_RE = re.compile(r'[^,}#\s]+')
+BIBTEX_CONCAT_RE = re.compile(r'\s*#\s*')
+BIBTEX_SKIPPED = {'comment', 'string', 'preamble'}
+LATEX_RE = re.compile(r'\\[A-Za-z]+\s*|\\.|[{}]')
+
+RIS_LINE_RE = re.compile(r'^([A-Z][A-Z0-9])  -\s?(.*)$')
+RIS_FIELDS = {
+	'TI': 'title', 'T1': 'title', 'CT': 'title',
+	'AU': 'authors', 'A1': 'authors',
+	'PY': 'year', 'Y1': 'year', 'DA': 'year',
+	'JO': 'journal', 'JF': 'journal', 'T2': 'journal', 'JA': 'journal',
+	'DO': 'doi', 'SN': 'issn', 'ID': 'key',
+}
+PLAIN_NUMBER_RE = re.compile(r'^\s*(?:\[\d+\]|\d+[.)])\s+')
+# A sentence break in a plain reference is a full stop followed by a capital or digit, so
+# "E. coli" stays inside the title
+PLAIN_BREAK_RE = re.compile(r'[.?!]\s+(?=[A-Z0-9"“])')
+
+# Near-duplicates are only compared within a block; a block shared by more entries than this
+# (a generic title such as "Introduction") is too unselective to be worth scanning
+MAX_BLOCK = 200
+NEAR_DUPLICATE_SIMILARITY = 0.9
+
+
+def _record(**fields):
+	record = {'key': '', 'title': '', 'authors': [], 'year': '', 'journal': '', 'doi': '', 'issn': '', 'problems': []}
+	record.update(fields)
+	return record
+
+
+def _read_braced(text, start):
+	# Returns the end of the {...} group opening at `start`, honouring nesting (one past the
+	# end of the text when the group is never closed)
+	depth = 0
+	for position in range(start, len(text)):
+		if text[position] == '{' and text[position - 1] != '\\':
+			depth += 1
+		elif text[position] == '}' and text[position - 1] != '\\':
+			depth -= 1
+			if depth == 0:
+				return position + 1
+	return len(text) + 1
+
+
+def _bibtex_value(text, position, macros):
+	parts = []
+	while position < len(text):
+		char = text[position]
+		if char == '{':
+			end = _read_braced(text, position)
+			parts.append(text[position + 1:end - 1])
+		elif char == '"':
+			end = position + 1
+			depth = 0
+			while end < len(text) and not (text[end] == '"' and depth == 0):
+				depth += {'{': 1, '}': -1}.get(text[end], 0)
+				end += 1
+			parts.append(text[position + 1:end])
+			end += 1
+		else:
+			match = BIBTEX_BARE_RE.match(text, position)
+			if match is None:
+				break
+			# Bare words are @string macros (or month abbreviations, kept as written)
+			parts.append(macros.get(match.group().lower(), match.group()))
+			end = match.end()
+		position = end
+		# String concatenation: "a" # {b}
+		hash_match = BIBTEX_CONCAT_RE.match(text, position)
+		if not hash_match:
+			break
+		position = hash_match.end()
+	return ''.join(parts), position
+
+
+def _bibtex_fields(text, position, macros):
+	fields = {}
+	while True:
+		match = BIBTEX_FIELD_RE.match(text, position)
+		if match is None:
+			return fields
+		value, position = _bibtex_value(text, match.end(), macros)
+		fields[match.group(1).lower()] = ' '.join(value.split())
+
+
+def _parse_bibtex_entry(text, macros):
+	header = BIBTEX_KEY_RE.match(text)
+	fields = _bibtex_fields(text, header.end(), macros)
+
+	record = _record(
+		key=header.group(2),
+		title=fields.get('title', ''),
+		authors=[name.strip() for name in re.split(r'\s+and\s+', fields.get('author', '')) if name.strip()],
+		year=fields.get('year', ''),
+		journal=fields.get('journal', fields.get('booktitle', '')),
+		doi=fields.get('doi', ''),
+		issn=fields.get('issn', ''),
+	)
+	if not text.rstrip().endswith('}'):
+		record['problems'].append('unterminated entry')
+	return record
+
+
+def _bibtex_records(lines):
+	# Entries are gathered line by line until their braces balance, so the file is never
+	# held in memory; a new '@' at the start of a line ends an unterminated entry
+	buffer, depth = [], 0
+	for line in lines:
+		if buffer and depth > 0 and line.lstrip().startswith('@') and BIBTEX_ENTRY_RE.match(line.lstrip()):
+			yield '\n'.join(buffer)
+			buffer, depth = [], 0
+		if not buffer:
+			match = BIBTEX_ENTRY_RE.search(line)
+			if match is None:
+				continue
+			line = line[match.start():]
+		buffer.append(line)
+		depth += line.count('{') - line.count('\\{') - line.count('}') + line.count('\\}')
+		if depth <= 0:
+			yield '\n'.join(buffer)
+			buffer, depth = [], 0
+	if buffer:
+		yield '\n'.join(buffer)
+
+
+def parse_bibtex(lines):
+	macros = {}
+	for text in _bibtex_records(lines):
+		kind = BIBTEX_ENTRY_RE.match(text).group(1).lower()
+		if kind == 'string':
+			macros.update(_bibtex_fields(text, text.index('{') + 1, macros))
+		if kind in BIBTEX_SKIPPED:
+			continue
+		yield _parse_bibtex_entry(text, macros)
+
+
+def parse_ris(lines):
+	record = None
+	for line in lines:
+		match = RIS_LINE_RE.match(line.rstrip('\r'))
+		if match is None:
+			continue
+		tag, value = match.group(1), match.group(2).strip()
+		if tag == 'TY':
+			record = _record()
+		elif record is None:
+			continue
+		elif tag == 'ER':
+			yield record
+			record = None
+		elif tag in RIS_FIELDS:
+			field = RIS_FIELDS[tag]
+			if field == 'authors':
+				record['authors'].append(value)
+			elif field == 'year':
+				record['year'] = record['year'] or value[:4]
+			elif not record[field]:
+				record[field] = value
+	if record is not None:
+		record['problems'].append('unterminated entry')
+		yield record
+
+
+def _parse_plain_reference(text):
+	text = ' '.join(PLAIN_NUMBER_RE.sub('', text).split())
+	doi_match = DOI_IN_TEXT_RE.search(text)
+	doi = doi_match.group(1).rstrip('.,;') if doi_match else ''
+	if doi_match:
+		text = (text[:doi_match.start()] + text[doi_match.end():]).strip()
+
+	# Author-date styles: "Authors (Year). Title. Journal, ..." ; otherwise the title is taken
+	# as the second sentence ("Authors. Title. Journal. Year")
+	year_match = YEAR_RE.search(text)
+	year = (year_match.group(1) or year_match.group(2)) if year_match else ''
+	if year_match and year_match.start() < len(text) / 2:
+		authors = text[:year_match.start()]
+		rest = text[year_match.end():].lstrip(' .,:)')
+	else:
+		authors, rest = (PLAIN_BREAK_RE.split(text, maxsplit=1) + [''])[:2]
+	title, rest = (PLAIN_BREAK_RE.split(rest, maxsplit=1) + [''])[:2]
+	journal = re.split(r'[.,(]|\d', rest, maxsplit=1)[0]
+	first_author = authors.split(',')[0].strip()
+	return _record(
+		title=title.strip(' "\'“”'),
+		authors=[first_author] if first_author else [],
+		year=year,
+		journal=journal.strip(),
+		doi=doi,
+	)
+
+
+def parse_plain(lines):
+	# One reference per line, unless the list is numbered ("[12] ..." / "12. ..."), in which
+	# case wrapped lines are joined until the next number or blank line
+	numbered = None
+	current = []
+	for line in lines:
+		stripped = line.strip()
+		starts = bool(PLAIN_NUMBER_RE.match(line))
+		if numbered is None and stripped:
+			numbered = starts
+		if current and (not stripped or starts or not numbered):
+			yield _parse_plain_reference(' '.join(current))
+			current = []
+		if stripped:
+			current.append(stripped)
+	if current:
+		yield _parse_plain_reference(' '.join(current))
+
+
+PARSERS = {'bibtex': parse_bibtex, 'ris': parse_ris, 'plain': parse_plain}
+
+
+def parse_references(stream, filename):
+	extension = os.path.splitext(filename)[1].lower()
+	if extension not in FORMATS:
+		raise ValueError(f"Unsupported reference format '{extension}'. Use .bib, .ris or .txt.")
+	if isinstance(stream, (bytes, bytearray)):
+		stream = io.BytesIO(stream)
+	return PARSERS[FORMATS[extension]](iter_lines(stream))
+
+
+def normalize_doi(doi):
+	return DOI_PREFIX_RE.sub('', doi.strip()).rstrip('.').lower()
+
+
+def issn_problem(issn):
+	match = ISSN_RE.match(issn.strip())
+	if match is None:
+		return f"malformed ISSN '{issn}'"
+	digits = match.group(1) + match.group(2).upper()
+	total = sum(int(digit) * weight for digit, weight in zip(digits[:7], range(8, 1, -1)))
+	check = (11 - total % 11) % 11
+	if digits[7] != ('X' if check == 10 else str(check)):
+		return f"ISSN check digit fails '{issn}'"
+	return None
+
+
+def normalize_text(text):
+	text = LATEX_RE.sub('', text)
+	text = unicodedata.normalize('NFKD', text).encode('ascii', 'ignore').decode('ascii').lower()
+	return ' '.join(re.findall(r'[a-z0-9]+', text))
+
+
+def surname(author):
+	# "Smith, J." / "Jane Smith" / "Smith J" (Vancouver) -> "smith"
+	if ',' in author:
+		parts = normalize_text(author.split(',')[0]).split()
+		return parts[-1] if parts else ''
+	parts = normalize_text(author).split()
+	if not parts:
+		return ''
+	return parts[0] if len(parts) > 1 and len(parts[-1]) <= 2 else parts[-1]
+
+
+# Deduplicates entries as they stream in. Every entry is compared only with earlier entries
+# that share its DOI, its exact normalised hash, or one of its blocking keys (first-author
+# surname + year, first four and last four title words), never with the whole library.
+class ReferenceLibrary:
+	def __init__(self, similarity=NEAR_DUPLICATE_SIMILARITY, max_block=MAX_BLOCK):
+		self.similarity = similarity
+		self.max_block = max_block
+		self.rows = []
+		self._titles = []
+		self._years = []
+		self._by_doi = {}
+		self._by_hash = {}
+		self._blocks = defaultdict(list)
+
+	def __len__(self):
+		return len(self.rows)
+
+	def _canonical(self, entry):
+		duplicate_of = self.rows[entry]['duplicate_of']
+		return entry if duplicate_of is None else duplicate_of
+
+	def _near_duplicate(self, title, year, keys):
+		best, best_score = None, self.similarity
+		seen = set()
+		for key in keys:
+			block = self._blocks.get(key, ())
+			if len(block) > self.max_block:
+				continue
+			for other in block:
+				if other in seen:
+					continue
+				seen.add(other)
+				if year and self._years[other] and year != self._years[other]:
+					continue
+				matcher = difflib.SequenceMatcher(None, title, self._titles[other], autojunk=False)
+				if matcher.real_quick_ratio() < best_score or matcher.quick_ratio() < best_score:
+					continue
+				score = matcher.ratio()
+				if score >= best_score:
+					best, best_score = other, score
+		return best, best_score
+
+	def add(self, record):
+		entry = len(self.rows)
+		problems = list(record['problems'])
+		title = normalize_text(record['title'])
+		first_author = surname(record['authors'][0]) if record['authors'] else ''
+		year = record['year'].strip()[:4]
+
+		doi = normalize_doi(record['doi']) if record['doi'] else ''
+		if doi and not DOI_RE.match(doi):
+			problems.append(f"malformed DOI '{record['doi']}'")
+		for issn in filter(None, re.split(r'[,;\s]+', record['issn'])):
+			problem = issn_problem(issn)
+			if problem:
+				problems.append(problem)
+		if not title:
+			problems.append('missing title')
+		if not re.fullmatch(r'\d{4}', year):
+			problems.append('missing year' if not year else f"malformed year '{record['year']}'")
+			year = ''
+
+		duplicate_of, match, similarity = None, '', None
+		entry_hash = hash((title, year, first_author))
+		if doi and doi in self._by_doi:
+			duplicate_of, match, similarity = self._by_doi[doi], 'DOI', 1.0
+		elif title and entry_hash in self._by_hash:
+			duplicate_of, match, similarity = self._by_hash[entry_hash], 'exact', 1.0
+
+		title_words = title.split()
+		keys = [('title-start', ' '.join(title_words[:4])), ('title-end', ' '.join(title_words[-4:]))] if title_words else []
+		if first_author and year:
+			keys.append(('author-year', first_author, year))
+		if duplicate_of is None and title:
+			other, score = self._near_duplicate(title, year, keys)
+			if other is not None:
+				duplicate_of, match, similarity = other, 'near', round(score, 3)
+		if duplicate_of is not None:
+			duplicate_of = self._canonical(duplicate_of)
+
+		if doi:
+			self._by_doi.setdefault(doi, entry)
+		if title:
+			self._by_hash.setdefault(entry_hash, entry)
+		for key in keys:
+			self._blocks[key].append(entry)
+		self._titles.append(title)
+		self._years.append(year)
+
+		row = {
+			'entry': entry + 1,
+			'key': record['key'],
+			'first_author': first_author,
+			'year': year,
+			'title': record['title'],
+			'journal': record['journal'],
+			'doi': record['doi'],
+			'issn': record['issn'],
+			'problems': '; '.join(problems),
+			'duplicate_of': duplicate_of,
+			'match': match,
+			'similarity': similarity,
+		}
+		self.rows.append(row)
+		return row
+
+	def table(self):
+		table = pd.DataFrame(self.rows, columns=RESULT_COLUMNS)
+		# Entries are reported 1-based so they line up with the order in the file
+		table['duplicate_of'] = (table['duplicate_of'] + 1).astype('Int64')
+		return table
+
+
+def check_references(stream, filename, progress=None, every=500):
+	# Parses and checks a reference file in one streaming pass; `progress(entries)` is called
+	# every `every` entries so large libraries can report as they go
+	library = ReferenceLibrary()
+	for record in parse_references(stream, filename):
+		library.add(record)
+		if progress is not None and len(library) % every == 0:
+			progress(len(library))
+	return library
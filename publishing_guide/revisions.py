@@ -0,0 +1,274 @@
+import bisect
+import re
+from collections import OrderedDict
+
+SENTENCE_BREAK_RE = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9"“(\[])')
+WORD_RE = re.compile(r'\w+')
+
+# A deleted and an inserted paragraph in the same place are reported as one revised
+# paragraph when at least this share of their words is shared
+PAIR_SIMILARITY = 0.3
+
+
+def normalize(text):
+	return ' '.join(text.split())
+
+
+def sentences(paragraph):
+	return [sentence for sentence in SENTENCE_BREAK_RE.split(normalize(paragraph)) if sentence]
+
+
+def _middle_snake(a, a0, a1, b, b0, b1):
+	# Myers' bidirectional search: returns (x, y, u, v), the middle snake of an optimal edit
+	# path, in O(n + m) space. Forward diagonals k = x - y; backward ones are measured
+	# from the end of both sequences.
+	n, m = a1 - a0, b1 - b0
+	delta = n - m
+	odd = delta % 2 == 1
+	offset = n + m + 1
+	forward = [0] * (2 * offset + 1)
+	backward = [0] * (2 * offset + 1)
+	for d in range((n + m + 1) // 2 + 1):
+		for k in range(-d, d + 1, 2):
+			if k == -d or (k != d and forward[offset + k - 1] < forward[offset + k + 1]):
+				x = forward[offset + k + 1]
+			else:
+				x = forward[offset + k - 1] + 1
+			y = x - k
+			start_x, start_y = x, y
+			while x < n and y < m and a[a0 + x] == b[b0 + y]:
+				x += 1
+				y += 1
+			forward[offset + k] = x
+			if odd and -(d - 1) <= delta - k <= d - 1 and x + backward[offset + delta - k] >= n:
+				return start_x, start_y, x, y
+
+		for k in range(-d, d + 1, 2):
+			if k == -d or (k != d and backward[offset + k - 1] < backward[offset + k + 1]):
+				x = backward[offset + k + 1]
+			else:
+				x = backward[offset + k - 1] + 1
+			y = x - k
+			start_x, start_y = x, y
+			while x < n and y < m and a[a1 - 1 - x] == b[b1 - 1 - y]:
+				x += 1
+				y += 1
+			backward[offset + k] = x
+			if not odd and -d <= delta - k <= d and x + forward[offset + delta - k] >= n:
+				return n - x, m - y, n - start_x, m - start_y
+	raise AssertionError('no middle snake found')
+
+
+def _myers(a, a0, a1, b, b0, b1, out):
+	# Appends (tag, i1, i2, j1, j2) edits for a[a0:a1] -> b[b0:b1]; each recursion halves the
+	# edit distance, so the depth is O(log D) and no O(n * m) table is ever built
+	while a0 < a1 and b0 < b1 and a[a0] == b[b0]:
+		out.append(('equal', a0, a0 + 1, b0, b0 + 1))
+		a0 += 1
+		b0 += 1
+	suffix = 0
+	while a0 < a1 - suffix and b0 < b1 - suffix and a[a1 - 1 - suffix] == b[b1 - 1 - suffix]:
+		suffix += 1
+	a1, b1 = a1 - suffix, b1 - suffix
+
+	if a0 == a1 and b0 < b1:
+		out.append(('insert', a0, a0, b0, b1))
+	elif b0 == b1 and a0 < a1:
+		out.append(('delete', a0, a1, b0, b0))
+	elif a0 < a1 and set(a[a0:a1]).isdisjoint(b[b0:b1]):
+		# Nothing in common (a rewritten stretch): the search would cost O((n + m)^2) to find that out
+		out.append(('delete', a0, a1, b0, b0))
+		out.append(('insert', a1, a1, b0, b1))
+	elif a0 < a1:
+		x, y, u, v = _middle_snake(a, a0, a1, b, b0, b1)
+		_myers(a, a0, a0 + x, b, b0, b0 + y, out)
+		if u > x:
+			out.append(('equal', a0 + x, a0 + u, b0 + y, b0 + v))
+		_myers(a, a0 + u, a1, b, b0 + v, b1, out)
+
+	if suffix:
+		out.append(('equal', a1, a1 + suffix, b1, b1 + suffix))
+
+
+def _anchors(a, b):
+	# Patience anchoring: items occurring exactly once in each sequence, kept in the longest
+	# run that is increasing in both, pin the alignment before Myers fills the gaps
+	counts = {}
+	for item in a:
+		counts[item] = counts.get(item, 0) + 1
+	positions_b = {}
+	for j, item in enumerate(b):
+		if counts.get(item) == 1:
+			positions_b[item] = -1 if item in positions_b else j
+	pairs = [(i, positions_b[item]) for i, item in enumerate(a) if positions_b.get(item, -1) >= 0]
+
+	tails, tail_index, previous = [], [], [None] * len(pairs)
+	for index, (_, j) in enumerate(pairs):
+		slot = bisect.bisect_left(tails, j)
+		if slot == len(tails):
+			tails.append(j)
+			tail_index.append(index)
+		else:
+			tails[slot] = j
+			tail_index[slot] = index
+		previous[index] = tail_index[slot - 1] if slot else None
+	chain = []
+	index = tail_index[-1] if tail_index else None
+	while index is not None:
+		chain.append(pairs[index])
+		index = previous[index]
+	return chain[::-1]
+
+
+def opcodes(a, b, anchor=True):
+	# difflib-style (tag, i1, i2, j1, j2) opcodes with adjacent edits merged into 'replace'
+	edits = []
+	start_a = start_b = 0
+	for i, j in (_anchors(a, b) if anchor else []) + [(len(a), len(b))]:
+		_myers(a, start_a, i, b, start_b, j, edits)
+		if i < len(a):
+			edits.append(('equal', i, i + 1, j, j + 1))
+		start_a, start_b = i + 1, j + 1
+
+	merged = []
+	for tag, i1, i2, j1, j2 in edits:
+		if i1 == i2 and j1 == j2:
+			continue
+		if merged:
+			last_tag, last_i1, _, last_j1, _ = merged[-1]
+			if last_tag == tag or (last_tag != 'equal' and tag != 'equal'):
+				merged[-1] = (tag if last_tag == tag else 'replace', last_i1, i2, last_j1, j2)
+				continue
+		merged.append((tag, i1, i2, j1, j2))
+	return merged
+
+
+def _similarity(old, new):
+	old_words, new_words = set(WORD_RE.findall(old.lower())), set(WORD_RE.findall(new.lower()))
+	if not old_words or not new_words:
+		return 0.0
+	return len(old_words & new_words) / len(old_words | new_words)
+
+
+def _locations(paragraphs):
+	# "Methods, paragraph 3": each paragraph's section and its position within that section
+	seen = {}
+	locations = []
+	for section, _ in paragraphs:
+		seen[section] = seen.get(section, 0) + 1
+		locations.append(f'{section}, paragraph {seen[section]}')
+	return locations
+
+
+# Diffs two versions of a manuscript given as [(section, paragraph)] lists. Paragraphs are
+# compared by hash (anchored on paragraphs unique to both versions), and only paragraphs
+# that changed are diffed sentence by sentence. Sentence-level results are cached per
+# (old paragraph, new paragraph) pair, so re-running after a small edit only redoes the
+# paragraphs that were touched.
+class RevisionDiff:
+	def __init__(self, cache_size=4096):
+		self.cache_size = cache_size
+		self._sentence_diffs = OrderedDict()
+
+	def _sentence_changes(self, old, new):
+		key = (hash(old), hash(new))
+		if key in self._sentence_diffs:
+			self._sentence_diffs.move_to_end(key)
+			return self._sentence_diffs[key]
+		old_sentences, new_sentences = sentences(old), sentences(new)
+		changes = [
+			{'change': tag, 'old': ' '.join(old_sentences[i1:i2]), 'new': ' '.join(new_sentences[j1:j2])}
+			for tag, i1, i2, j1, j2 in opcodes([hash(s) for s in old_sentences], [hash(s) for s in new_sentences])
+			if tag != 'equal'
+		]
+		self._sentence_diffs[key] = changes
+		if len(self._sentence_diffs) > self.cache_size:
+			self._sentence_diffs.popitem(last=False)
+		return changes
+
+	def compare(self, old, new):
+		old_text = [normalize(text) for _, text in old]
+		new_text = [normalize(text) for _, text in new]
+		old_hashes = [hash(text) for text in old_text]
+		new_hashes = [hash(text) for text in new_text]
+		old_locations, new_locations = _locations(old), _locations(new)
+		codes = opcodes(old_hashes, new_hashes)
+
+		# Paragraphs deleted in one place and inserted unchanged in another were moved
+		deleted = {old_hashes[i] for tag, i1, i2, _, _ in codes if tag != 'equal' for i in range(i1, i2)}
+		inserted = {new_hashes[j] for tag, _, _, j1, j2 in codes if tag != 'equal' for j in range(j1, j2)}
+		moved = deleted & inserted
+		moved_from = {}
+		for tag, i1, i2, _, _ in codes:
+			if tag != 'equal':
+				for i in range(i1, i2):
+					moved_from.setdefault(old_hashes[i], i)
+
+		changes = []
+
+		def change(kind, i=None, j=None, details=()):
+			changes.append({
+				'change': kind,
+				'location': new_locations[j] if j is not None else f'{old_locations[i]} (original)',
+				'previous_location': old_locations[i] if i is not None else '',
+				'old': old_text[i] if i is not None else '',
+				'new': new_text[j] if j is not None else '',
+				'sentences': list(details),
+			})
+
+		for tag, i1, i2, j1, j2 in codes:
+			if tag == 'equal':
+				continue
+			removed = [i for i in range(i1, i2) if old_hashes[i] not in moved]
+			added = [j for j in range(j1, j2) if new_hashes[j] not in moved]
+			for j in range(j1, j2):
+				if new_hashes[j] in moved:
+					change('moved', moved_from[new_hashes[j]], j)
+
+			# Pair removed and added paragraphs in order when they share enough words
+			cursor = 0
+			for j in added:
+				match = next(
+					(k for k in range(cursor, len(removed))
+					 if _similarity(old_text[removed[k]], new_text[j]) >= PAIR_SIMILARITY),
+					None)
+				if match is None:
+					change('added', j=j)
+					continue
+				for k in range(cursor, match):
+					change('deleted', i=removed[k])
+				i = removed[match]
+				change('revised', i, j, self._sentence_changes(old_text[i], new_text[j]))
+				cursor = match + 1
+			for k in range(cursor, len(removed)):
+				change('deleted', i=removed[k])
+		return changes
+
+
+def summary(changes):
+	counts = {}
+	for item in changes:
+		counts[item['change']] = counts.get(item['change'], 0) + 1
+	return counts
+
+
+def change_map(changes):
+	# Markdown list of every change, ready to paste into a response-to-reviewers letter
+	lines = []
+	for item in changes:
+		if item['change'] == 'revised':
+			lines.append(f"- **{item['location']}**: revised")
+			for sentence in item['sentences']:
+				if sentence['change'] == 'insert':
+					lines.append(f"  - Added: \"{sentence['new']}\"")
+				elif sentence['change'] == 'delete':
+					lines.append(f"  - Removed: \"{sentence['old']}\"")
+				else:
+					lines.append(f"  - Changed \"{sentence['old']}\" to \"{sentence['new']}\"")
+		elif item['change'] == 'added':
+			lines.append(f"- **{item['location']}**: added \"{item['new']}\"")
+		elif item['change'] == 'deleted':
+			lines.append(f"- **{item['location']}**: removed \"{item['old']}\"")
+		else:
+			lines.append(f"- **{item['location']}**: moved from {item['previous_location']}")
+	return '\n'.join(lines)
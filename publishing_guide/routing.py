@@ -0,0 +1,58 @@
+import re
+from urllib.parse import quote, urlencode
+
+from publishing_guide import content
+
+# Deep links into the app: ?page=<slug> selects the page before anything renders and
+# ?item=<slug> preselects the page's explorer (the "learn more" selectbox). A section is the
+# URL fragment, #<heading anchor>, which Streamlit scrolls to once the heading is drawn.
+# A missing parameter means the first page or item, so plain URLs stay plain.
+
+
+def slugify(text):
+	return re.sub(r'[^a-z0-9]+', '-', text.lower()).strip('-')
+
+
+PAGE_SLUGS = {slugify(page): page for page in content.PAGES}
+
+# The explorer each page can preselect through `item`
+EXPLORERS = {
+	"Types of Publications": list(content.PUBLICATION_TYPES),
+	"Understanding Journal Metrics": list(content.JOURNAL_METRICS),
+	"Writing Your Research Paper": list(content.PAPER_SECTIONS),
+	"Submission & Peer Review": list(content.PEER_REVIEW_TYPES),
+}
+
+
+def _match(options, value):
+	# Accepts the slug or the option itself (any case); anything else matches nothing
+	if not value:
+		return None
+	slug = slugify(value)
+	return next((option for option in options if slugify(option) == slug), None)
+
+
+def resolve_page(value):
+	return _match(content.PAGES, value) or content.PAGES[0]
+
+
+def resolve_item(page, value):
+	options = EXPLORERS[page]
+	return _match(options, value) or options[0]
+
+
+def link(page, item=None, section=None, base_url=''):
+	# Shareable URL of a page, optionally with an explorer item and a section heading
+	if page not in PAGE_SLUGS.values():
+		raise ValueError(f"Unknown page: {page}")
+	params = {}
+	if page != content.PAGES[0]:
+		params['page'] = slugify(page)
+	if item is not None:
+		if page not in EXPLORERS or item not in EXPLORERS[page]:
+			raise ValueError(f"'{page}' has no explorer item '{item}'")
+		if item != EXPLORERS[page][0]:
+			params['item'] = slugify(item)
+	query = f'?{urlencode(params)}' if params else ''
+	fragment = f'#{quote(slugify(section))}' if section else ''
+	return f"{base_url.rstrip('/')}/{query}{fragment}"
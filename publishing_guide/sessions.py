@@ -0,0 +1,193 @@
+import os
+import sys
+import threading
+import time
+import types
+import weakref
+from collections import OrderedDict
+
+from publishing_guide import telemetry
+
+# Caps in MiB: artifacts kept for one browser session, and for all sessions of the process
+SESSION_ARTIFACT_MB = float(os.environ.get('PUBLISHING_GUIDE_SESSION_MB', 64))
+TOTAL_ARTIFACT_MB = float(os.environ.get('PUBLISHING_GUIDE_ARTIFACTS_MB', 512))
+MAX_OBJECTS = 200_000
+
+_stats = telemetry.Counter('session_artifacts', '', ['event'])
+telemetry.watch_cache('session_artifacts', lambda: tuple(_stats.values().get((event,), 0) for event in ('hits', 'misses', 'evictions')))
+
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, threading.Thread)
+
+
+def estimate_size(value):
+	# Deep size in bytes: containers and object attributes are followed, NumPy arrays count their
+	# buffers and pandas objects their deep memory usage. Objects shared between sessions
+	# (modules, classes, functions) are not followed. Stops after MAX_OBJECTS objects.
+	seen = set()
+	stack = [value]
+	total = 0
+	while stack and len(seen) < MAX_OBJECTS:
+		item = stack.pop()
+		if id(item) in seen or isinstance(item, _OPAQUE):
+			continue
+		seen.add(id(item))
+		usage = getattr(item, 'memory_usage', None)
+		if callable(usage) and hasattr(item, 'index'):
+			size = usage(deep=True)
+			total += int(size.sum() if hasattr(size, 'sum') else size)
+			continue
+		if hasattr(item, 'nbytes') and hasattr(item, 'dtype'):
+			# Includes the buffer only when the array owns it (not for views or memory-mapped files)
+			total += sys.getsizeof(item)
+			continue
+		total += sys.getsizeof(item)
+		if isinstance(item, (str, bytes, bytearray, int, float, complex, bool, type(None))):
+			continue
+		if isinstance(item, dict):
+			stack.extend(item.keys())
+			stack.extend(item.values())
+		elif isinstance(item, (list, tuple, set, frozenset)):
+			stack.extend(item)
+		else:
+			attributes = getattr(item, '__dict__', None)
+			if attributes is not None:
+				stack.append(attributes)
+			for slot in getattr(type(item), '__slots__', ()):
+				if hasattr(item, slot):
+					stack.append(getattr(item, slot))
+	return total
+
+
+# Results a session computes from its uploads (parsed files, reports, download payloads),
+# least recently used first. Anything evicted is simply recomputed on the next rerun that
+# needs it, so the caps bound memory without losing user data.
+class ArtifactCache:
+	def __init__(self, session_id, registry, max_bytes):
+		self.session_id = session_id
+		self.max_bytes = max_bytes
+		self.nbytes = 0
+		self.evictions = 0
+		self._registry = registry
+		self._entries = OrderedDict()
+		self._lock = threading.Lock()
+
+	def __len__(self):
+		return len(self._entries)
+
+	def oldest_use(self):
+		with self._lock:
+			if not self._entries:
+				return None
+			return next(iter(self._entries.values()))[2]
+
+	def evict_oldest(self):
+		with self._lock:
+			if not self._entries:
+				return 0
+			_, (_, size, _) = self._entries.popitem(last=False)
+			self.nbytes -= size
+			self.evictions += 1
+			_stats.inc('evictions')
+			return size
+
+	def get_or_create(self, key, build):
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is not None:
+				self._entries.move_to_end(key)
+				self._entries[key] = (entry[0], entry[1], time.monotonic())
+				_stats.inc('hits')
+				return entry[0]
+		_stats.inc('misses')
+		value = build()
+		self.put(key, value)
+		return value
+
+	def put(self, key, value):
+		size = estimate_size(value)
+		with self._lock:
+			if key in self._entries:
+				self.nbytes -= self._entries.pop(key)[1]
+			# Something bigger than the whole budget is used for this rerun but not kept
+			if size > self.max_bytes:
+				return value
+			self._entries[key] = (value, size, time.monotonic())
+			self.nbytes += size
+			while self.nbytes > self.max_bytes:
+				_, (_, evicted, _) = self._entries.popitem(last=False)
+				self.nbytes -= evicted
+				self.evictions += 1
+				_stats.inc('evictions')
+		self._registry.enforce()
+		return value
+
+
+# Process-wide view of every open session. Each session's ArtifactCache lives in its
+# st.session_state, so it is freed with the session; the registry only holds weak references.
+class SessionRegistry:
+	def __init__(self, session_bytes=SESSION_ARTIFACT_MB * 2 ** 20, total_bytes=TOTAL_ARTIFACT_MB * 2 ** 20):
+		self.session_bytes = session_bytes
+		self.total_bytes = total_bytes
+		self._caches = weakref.WeakValueDictionary()
+		self._usage = {}
+		# Reentrant: a cache's finalizer may run (on garbage collection) while this thread holds it
+		self._lock = threading.RLock()
+
+	def open(self, session_id):
+		cache = ArtifactCache(session_id, self, self.session_bytes)
+		with self._lock:
+			self._caches[session_id] = cache
+			self._usage[session_id] = {'state_bytes': 0, 'upload_bytes': 0, 'last_seen': time.time()}
+		weakref.finalize(cache, self._forget, session_id)
+		return cache
+
+	def _forget(self, session_id):
+		# Called when a session's cache is garbage-collected, from whichever thread collects it
+		with self._lock:
+			self._usage.pop(session_id, None)
+
+	def account(self, session_id, state_bytes, upload_bytes):
+		with self._lock:
+			self._usage[session_id] = {'state_bytes': state_bytes, 'upload_bytes': upload_bytes, 'last_seen': time.time()}
+
+	def enforce(self):
+		# Over the process cap, drop the least recently used artifact of any session until under it
+		with self._lock:
+			caches = list(self._caches.values())
+			total = sum(cache.nbytes for cache in caches)
+			while total > self.total_bytes:
+				candidates = [(cache.oldest_use(), cache) for cache in caches]
+				candidates = [(used, cache) for used, cache in candidates if used is not None]
+				if not candidates:
+					break
+				total -= min(candidates, key=lambda candidate: candidate[0])[1].evict_oldest()
+
+	def report(self):
+		with self._lock:
+			caches = dict(self._caches.items())
+			usage = dict(self._usage)
+		rows = []
+		for session_id, entry in usage.items():
+			cache = caches.get(session_id)
+			rows.append({
+				'session': session_id,
+				'state_bytes': entry['state_bytes'],
+				'upload_bytes': entry['upload_bytes'],
+				'artifact_bytes': cache.nbytes if cache is not None else 0,
+				'artifacts': len(cache) if cache is not None else 0,
+				'artifact_evictions': cache.evictions if cache is not None else 0,
+				'last_seen': entry['last_seen'],
+			})
+		return sorted(rows, key=lambda row: -(row['state_bytes'] + row['upload_bytes'] + row['artifact_bytes']))
+
+	def totals(self):
+		rows = self.report()
+		return {
+			(kind,): sum(row[f'{kind}_bytes'] for row in rows)
+			for kind in ('state', 'upload', 'artifact')
+		}
+
+
+REGISTRY = SessionRegistry()
+telemetry.gauge('publishing_guide_session_bytes', "Memory held by browser sessions, by kind", REGISTRY.totals, ['kind'])
+telemetry.gauge('publishing_guide_tracked_sessions', "Sessions with memory accounting", lambda: len(REGISTRY.report()))
@@ -0,0 +1,87 @@
+import threading
+
+from publishing_guide import telemetry
+
+# Process-wide instances of the expensive objects (memory-mapped tables, indexes, SQLite stores).
+# The app, the JSON API and the warm-up phase all go through these getters, so whatever the
+# warm-up loads before the server starts is what the first request uses.
+_objects = {}
+_locks = {}
+_registry_lock = threading.Lock()
+_hits = telemetry.Counter('shared_hits', '')
+_misses = telemetry.Counter('shared_misses', '')
+telemetry.watch_cache('shared', lambda: (_hits.total(), _misses.total(), 0))
+
+
+def get(key, load):
+	if key in _objects:
+		_hits.inc()
+		return _objects[key]
+	with _registry_lock:
+		lock = _locks.setdefault(key, threading.Lock())
+	# One lock per object: two different indexes can load at the same time, the same one only once
+	with lock:
+		if key not in _objects:
+			_misses.inc()
+			_objects[key] = load()
+	return _objects[key]
+
+
+def loaded():
+	return sorted(str(key[0]) for key in _objects)
+
+
+def keyword_table(directory=None):
+	from publishing_guide import keywords
+
+	directory = directory or keywords.DEFAULT_TABLE_DIR
+	return get(('keyword_table', directory), lambda: keywords.BackgroundTable.load(directory))
+
+
+def journal_index(path=None):
+	from publishing_guide import recommender
+
+	path = path or recommender.DEFAULT_INDEX_PATH
+	return get(('journal_index', path), lambda: recommender.JournalIndex.load(path))
+
+
+def journal_metrics_engine(cache_dir=None):
+	from publishing_guide import journal_metrics
+
+	cache_dir = cache_dir or journal_metrics.DEFAULT_CACHE_DIR
+	return get(('journal_metrics_engine', cache_dir), lambda: journal_metrics.JournalMetricsEngine(cache_dir))
+
+
+def overlap_index(path=None):
+	from publishing_guide import overlap
+
+	path = path or overlap.DEFAULT_INDEX_PATH
+	return get(('overlap_index', path), lambda: overlap.OverlapIndex(path))
+
+
+def altmetrics_store(path=None):
+	from publishing_guide import altmetrics
+
+	path = path or altmetrics.DEFAULT_STORE_PATH
+	return get(('altmetrics_store', path), lambda: altmetrics.AltmetricsStore(path))
+
+
+def portfolio_tracker(path=None):
+	from publishing_guide import portfolio
+
+	path = path or portfolio.DEFAULT_PORTFOLIO_PATH
+	return get(('portfolio_tracker', path), lambda: portfolio.PortfolioTracker(path))
+
+
+def revision_diff():
+	from publishing_guide import revisions
+
+	return get(('revision_diff',), revisions.RevisionDiff)
+
+
+def asset_manifest(directory=None):
+	from publishing_guide import assets
+
+	# Built (or brought up to date) on first use; a no-op when the warm-up already did it
+	directory = directory or assets.DEFAULT_ASSET_DIR
+	return get(('asset_manifest', directory), lambda: assets.build(directory=directory))
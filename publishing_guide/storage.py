@@ -0,0 +1,42 @@
+import os
+
+# Local corpora, indexes and caches live in ./data unless PUBLISHING_GUIDE_DATA points elsewhere
+DATA_DIR = os.environ.get(
+	'PUBLISHING_GUIDE_DATA',
+	os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'data')
+)
+
+
+def data_path(*parts):
+	return os.path.join(DATA_DIR, *parts)
+
+
+def ensure_parent(path):
+	parent = os.path.dirname(path)
+	if parent:
+		os.makedirs(parent, exist_ok=True)
+	return path
+
+
+# Column-per-file .npy tables: readable with mmap and without pyarrow. Text columns are
+# stored as fixed-width unicode so they never need pickling.
+def save_columns(directory, frame):
+	import numpy as np
+
+	os.makedirs(directory, exist_ok=True)
+	for column in frame.columns:
+		values = frame[column].to_numpy()
+		if values.dtype == object:
+			values = values.astype(str)
+		np.save(os.path.join(directory, f'{column}.npy'), values, allow_pickle=False)
+
+
+def load_columns(directory, columns, mmap=True):
+	import numpy as np
+	import pandas as pd
+
+	mode = 'r' if mmap else None
+	return pd.DataFrame({
+		column: np.load(os.path.join(directory, f'{column}.npy'), mmap_mode=mode, allow_pickle=False)
+		for column in columns
+	})
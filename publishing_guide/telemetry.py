@@ -0,0 +1,228 @@
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+
+def _escape(value):
+	return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _label_text(names, values, extra=()):
+	pairs = [*zip(names, values), *extra]
+	if not pairs:
+		return ''
+	return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+def _number(value):
+	if value == float('inf'):
+		return '+Inf'
+	return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+# Counters and histograms are written from the Streamlit script threads, the API's tool pool
+# and the warm-up thread. Each thread updates its own shard (a plain dict only it writes), so
+# recording a value takes no lock; a scrape copies and sums the shards. Shards of threads that
+# have finished (Streamlit starts a thread per rerun) are folded into one and dropped whenever a
+# new thread registers, so their number is bounded by the live threads even if nothing scrapes.
+class _Sharded:
+	kind = None
+
+	def __init__(self, name, documentation, labels=()):
+		self.name = name
+		self.documentation = documentation
+		self.labels = tuple(labels)
+		self._local = threading.local()
+		self._shards = []
+		self._retired = {}
+		self._lock = threading.Lock()
+
+	def _shard(self):
+		try:
+			return self._local.shard
+		except AttributeError:
+			shard = self._local.shard = {}
+			with self._lock:
+				self._fold_finished()
+				self._shards.append((threading.current_thread(), shard))
+			return shard
+
+	def _fold_finished(self):
+		# Called with the lock held
+		live = []
+		for thread, shard in self._shards:
+			if thread.is_alive():
+				live.append((thread, shard))
+			else:
+				self._merge(self._retired, shard.copy())
+		self._shards = live
+
+	def _merge(self, total, shard):
+		raise NotImplementedError
+
+	def values(self):
+		with self._lock:
+			self._fold_finished()
+			total = {}
+			self._merge(total, self._retired)
+			for _, shard in self._shards:
+				self._merge(total, shard.copy())
+		return total
+
+
+class Counter(_Sharded):
+	kind = 'counter'
+
+	def inc(self, *values, amount=1):
+		shard = self._shard()
+		shard[values] = shard.get(values, 0) + amount
+
+	def _merge(self, total, shard):
+		for key, value in shard.items():
+			total[key] = total.get(key, 0) + value
+
+	def total(self):
+		return sum(self.values().values())
+
+	def samples(self):
+		return [(self.name, self.labels, key, (), value) for key, value in sorted(self.values().items())]
+
+
+class Histogram(_Sharded):
+	kind = 'histogram'
+
+	def __init__(self, name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+		super().__init__(name, documentation, labels)
+		self.buckets = tuple(sorted(buckets))
+
+	def observe(self, value, *values):
+		shard = self._shard()
+		# Per-bucket (not cumulative) counts, then the sum and the count
+		state = shard.get(values)
+		if state is None:
+			state = shard[values] = [0] * (len(self.buckets) + 2)
+		for position, bound in enumerate(self.buckets):
+			if value <= bound:
+				state[position] += 1
+				break
+		state[-2] += value
+		state[-1] += 1
+
+	@contextmanager
+	def time(self, *values):
+		started = time.perf_counter()
+		try:
+			yield
+		finally:
+			self.observe(time.perf_counter() - started, *values)
+
+	def _merge(self, total, shard):
+		for key, state in shard.items():
+			state = list(state)
+			if key in total:
+				total[key] = [a + b for a, b in zip(total[key], state)]
+			else:
+				total[key] = state
+
+	def samples(self):
+		samples = []
+		for key, state in sorted(self.values().items()):
+			cumulative = 0
+			for bound, count in zip(self.buckets, state):
+				cumulative += count
+				samples.append((f'{self.name}_bucket', self.labels, key, (('le', _number(bound)),), cumulative))
+			samples.append((f'{self.name}_bucket', self.labels, key, (('le', '+Inf'),), state[-1]))
+			samples.append((f'{self.name}_sum', self.labels, key, (), state[-2]))
+			samples.append((f'{self.name}_count', self.labels, key, (), state[-1]))
+		return samples
+
+
+# Values that already exist elsewhere (open sessions, cache statistics) are read at scrape time.
+# The callback returns a number, or a dict of label-value tuples to numbers.
+class Callback:
+	def __init__(self, name, documentation, read, labels=(), kind='gauge'):
+		self.name = name
+		self.documentation = documentation
+		self.read = read
+		self.labels = tuple(labels)
+		self.kind = kind
+
+	def samples(self):
+		values = self.read()
+		if not isinstance(values, dict):
+			values = {(): values}
+		return [(self.name, self.labels, key, (), value) for key, value in sorted(values.items())]
+
+
+class Registry:
+	def __init__(self):
+		self._metrics = {}
+		self._lock = threading.Lock()
+
+	def register(self, metric):
+		# Get-or-create by name: the Streamlit script re-runs its definitions on every rerun
+		with self._lock:
+			return self._metrics.setdefault(metric.name, metric)
+
+	def render(self):
+		lines = []
+		for metric in list(self._metrics.values()):
+			try:
+				samples = metric.samples()
+			except Exception:
+				# A failing callback must not take the whole scrape down
+				continue
+			lines.append(f'# HELP {metric.name} {metric.documentation}')
+			lines.append(f'# TYPE {metric.name} {metric.kind}')
+			for name, label_names, values, extra, value in samples:
+				lines.append(f'{name}{_label_text(label_names, values, extra)} {_number(value)}')
+		return ('\n'.join(lines) + '\n').encode('utf-8')
+
+
+REGISTRY = Registry()
+
+
+def counter(name, documentation, labels=()):
+	return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def histogram(name, documentation, labels=(), buckets=DEFAULT_BUCKETS):
+	return REGISTRY.register(Histogram(name, documentation, labels, buckets))
+
+
+def gauge(name, documentation, read, labels=()):
+	return REGISTRY.register(Callback(name, documentation, read, labels))
+
+
+# Hits, misses and evictions of the process's caches, one label value per cache. Each entry
+# returns (hits, misses, evictions) when read.
+_caches = {}
+
+
+def watch_cache(name, read_stats):
+	_caches[name] = read_stats
+
+
+def watch_lru_cache(name, function):
+	# Every miss inserts an entry and only evictions remove them (nothing here calls cache_clear)
+	def read_stats():
+		info = function.cache_info()
+		return info.hits, info.misses, max(info.misses - info.currsize, 0)
+
+	watch_cache(name, read_stats)
+
+
+def _cache_stat(position):
+	return lambda: {(name,): read_stats()[position] for name, read_stats in list(_caches.items())}
+
+
+REGISTRY.register(Callback('publishing_guide_cache_hits_total', "Cache lookups answered from the cache", _cache_stat(0), ['cache'], 'counter'))
+REGISTRY.register(Callback('publishing_guide_cache_misses_total', "Cache lookups that had to compute the value", _cache_stat(1), ['cache'], 'counter'))
+REGISTRY.register(Callback('publishing_guide_cache_evictions_total', "Entries dropped to respect a cache's size limit", _cache_stat(2), ['cache'], 'counter'))
+
+
+def render():
+	return REGISTRY.render()
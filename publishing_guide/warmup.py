@@ -0,0 +1,146 @@
+import argparse
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+from publishing_guide import shared
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'publishh.py')
+SAMPLE_TEXT = (
+	"We measured the effect of peer review on the citation rates of published articles. "
+	"Articles that underwent open review received more citations over the following three years."
+)
+
+
+# Steps run in order; each loads something a first visitor would otherwise wait for. They go
+# through the same lru_caches and shared registry the app and the API use, so the work is done once.
+def _imports():
+	import publishing_guide
+
+	for name in publishing_guide.__all__:
+		importlib.import_module(f'publishing_guide.{name}')
+
+
+def _charts():
+	from publishing_guide import charts
+
+	for name in charts.STATIC_CHARTS:
+		charts.chart_image(name)
+	charts.chart_image('open_access', charts.COLUMN_WIDTH)
+
+
+def _assets():
+	shared.asset_manifest()
+
+
+def _readability():
+	from publishing_guide import readability
+
+	readability.common_words()
+	readability.score_text(SAMPLE_TEXT)
+
+
+def _keywords():
+	from publishing_guide import keywords
+
+	keywords.extract(SAMPLE_TEXT, shared.keyword_table())
+
+
+def _journal_index():
+	from publishing_guide import recommender
+
+	# The index is built offline; without one the recommender page only shows instructions
+	if os.path.exists(recommender.DEFAULT_INDEX_PATH):
+		shared.journal_index()
+
+
+def _journal_metrics():
+	engine = shared.journal_metrics_engine()
+	if engine.years():
+		engine.metrics(engine.years()[-1])
+
+
+def _stores():
+	shared.overlap_index()
+	shared.altmetrics_store()
+	shared.portfolio_tracker()
+
+
+STEPS = [
+	('imports', _imports),
+	('charts', _charts),
+	('assets', _assets),
+	('readability', _readability),
+	('keywords', _keywords),
+	('journal_index', _journal_index),
+	('journal_metrics', _journal_metrics),
+	('stores', _stores),
+]
+
+ready = threading.Event()
+_state = {'started': None, 'finished': None, 'steps': {}, 'errors': {}}
+_start_lock = threading.Lock()
+_thread = None
+
+
+def run():
+	# A failing step is recorded and skipped: the page it serves loads lazily as before,
+	# and the server still becomes ready
+	_state['started'] = time.time()
+	for name, step in STEPS:
+		began = time.perf_counter()
+		try:
+			step()
+		except Exception as error:
+			_state['errors'][name] = f'{type(error).__name__}: {error}'
+		_state['steps'][name] = round(time.perf_counter() - began, 4)
+	_state['finished'] = time.time()
+	ready.set()
+	return report()
+
+
+def start_background():
+	# Starts the warm-up once per process; later calls (every app session, the API) are no-ops
+	global _thread
+	with _start_lock:
+		if _thread is None and not ready.is_set():
+			_thread = threading.Thread(target=run, name='publishing-guide-warmup', daemon=True)
+			_thread.start()
+	return _thread
+
+
+def report():
+	started, finished = _state['started'], _state['finished']
+	return {
+		'ready': ready.is_set(),
+		'started': started,
+		'seconds': round((finished or time.time()) - started, 4) if started else None,
+		'steps': dict(_state['steps']),
+		'errors': dict(_state['errors']),
+		'loaded': shared.loaded(),
+	}
+
+
+def main(argv=None):
+	parser = argparse.ArgumentParser(
+		description="Warm up the guide (imports, charts, indexes) and then start the Streamlit server in the same process.")
+	parser.add_argument('--app', default=APP_PATH, help="Streamlit script to serve")
+	parser.add_argument('--check', action='store_true', help="Only run the warm-up and print its timings")
+	args, streamlit_args = parser.parse_known_args(argv)
+
+	result = run()
+	print(json.dumps(result, indent=1), file=sys.stderr)
+	if args.check:
+		return 1 if result['errors'] else 0
+
+	# The server only starts listening once everything above is loaded
+	from streamlit.web import cli
+
+	return cli.main(['run', args.app, *streamlit_args], prog_name='streamlit')
+
+
+if __name__ == '__main__':
+	sys.exit(main())
@@ -0,0 +1,58 @@
+import io
+import json
+
+from publishing_guide.altmetrics import AltmetricsStore
+
+
+def _dump(events, trailing_newline=True):
+	text = '\n'.join(json.dumps(event) for event in events)
+	return io.BytesIO((text + ('\n' if trailing_newline else '')).encode('utf-8'))
+
+
+def test_crossref_event_data_doi_comes_from_obj_id(tmp_path):
+	store = AltmetricsStore(str(tmp_path / 'store.sqlite'))
+	events = [
+		{'id': '5f6e1c2a-0000-4000-8000-000000000001', 'obj_id': 'https://doi.org/10.1234/ABC',
+		 'occurred_at': '2024-03-01T10:00:00Z', 'source_id': 'twitter', 'relation_type_id': 'discusses'},
+		{'id': '5f6e1c2a-0000-4000-8000-000000000002', 'obj_id': 'https://doi.org/10.1234/abc',
+		 'occurred_at': '2024-03-02T10:00:00Z', 'source_id': 'wikipedia', 'relation_type_id': 'references'},
+	]
+	assert store.ingest(_dump(events), 'crossref.jsonl') == 2
+	assert store.totals()['doi'].tolist() == ['10.1234/abc']
+
+
+def test_last_event_without_trailing_newline_is_ingested_once(tmp_path):
+	store = AltmetricsStore(str(tmp_path / 'store.sqlite'))
+	events = [{'doi': f'10.1234/{number}', 'timestamp': '2024-01-01'} for number in range(3)]
+	assert store.ingest(_dump(events, trailing_newline=False), 'dump.jsonl') == 3
+	assert store.ingest(_dump(events, trailing_newline=False), 'dump.jsonl') == 0
+	assert len(store) == 3
+
+
+def test_partially_written_last_line_waits_for_the_rest(tmp_path):
+	store = AltmetricsStore(str(tmp_path / 'store.sqlite'))
+	complete = json.dumps({'doi': '10.1234/a', 'timestamp': '2024-01-01'}) + '\n'
+	rest = json.dumps({'doi': '10.1234/b', 'timestamp': '2024-01-02'})
+	assert store.ingest(io.BytesIO((complete + rest[:20]).encode()), 'growing.jsonl') == 1
+	assert store.ingest(io.BytesIO((complete + rest + '\n').encode()), 'growing.jsonl') == 1
+	assert len(store) == 2
+
+
+def test_concurrent_ingests_of_one_dump_count_each_event_once(tmp_path):
+	path = str(tmp_path / 'store.sqlite')
+	first, second = AltmetricsStore(path), AltmetricsStore(path)
+	events = [{'doi': f'10.1234/{number}', 'timestamp': '2024-01-01'} for number in range(3)]
+	data = _dump(events).getvalue()
+
+	class RacingDump(io.BytesIO):
+		# The other session ingests the whole dump between this one's read and its commit
+		raced = False
+
+		def read(self, size=-1):
+			if not self.raced:
+				self.raced = True
+				second.ingest(io.BytesIO(data), 'dump.jsonl')
+			return super().read(size)
+
+	assert first.ingest(RacingDump(data), 'dump.jsonl') == 0
+	assert first.totals()['total'].sum() == 3
@@ -0,0 +1,58 @@
+import itertools
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from publishing_guide import apc
+
+
+def frames(options, priorities=None):
+	names = sorted({option[0] for option in options})
+	papers = pd.DataFrame({'paper': names, 'priority': [(priorities or {}).get(name, 1) for name in names]})
+	return papers, pd.DataFrame(options, columns=['paper', 'journal', 'route', 'apc'])
+
+
+def brute_force(papers, options, budget):
+	# Highest total priority over every choice of at most one option per paper
+	choices = [[None] + [row for row in options.itertuples() if row.paper == paper] for paper in papers['paper']]
+	best = 0
+	for plan in itertools.product(*choices):
+		chosen = [row for row in plan if row is not None]
+		if sum(row.apc for row in chosen) <= budget:
+			best = max(best, sum(int(papers.loc[papers['paper'] == row.paper, 'priority'].iloc[0]) for row in chosen))
+	return best
+
+
+def test_plan_matches_brute_force():
+	rng = np.random.default_rng(7)
+	options = [
+		(f'P{paper}', f'J{paper}{journal}', 'Gold', float(rng.integers(5, 40) * 100))
+		for paper in range(6) for journal in range(rng.integers(1, 4))
+	]
+	papers, options = frames(options, {f'P{paper}': int(rng.integers(1, 4)) for paper in range(6)})
+	for budget in [0, 1000, 4500, 9000]:
+		plan = apc.optimize(papers, options, budget, resolution=100)
+		assert plan['net_apc'].sum() <= budget
+		assert plan.loc[plan['open_access'], 'priority'].sum() == brute_force(papers, options, budget)
+
+
+def test_unknown_and_negative_apc():
+	papers, options = frames([('A', 'Gold journal', 'Gold', None), ('A', 'Diamond journal', 'Diamond', None), ('B', 'Other', 'Gold', None)])
+	plan = apc.optimize(papers, options, 100).set_index('paper')
+	assert plan.loc['A', 'journal'] == 'Diamond journal' and plan.loc['A', 'net_apc'] == 0
+	assert not plan.loc['B', 'open_access']
+	assert plan.loc['B', 'note'] == 'APC unknown for Other'
+
+	papers, options = frames([('A', 'Gold journal', 'Gold', -10)])
+	with pytest.raises(ValueError, match='Negative APC'):
+		apc.optimize(papers, options, 100)
+
+
+def test_large_budget_is_planned_in_coarser_steps(monkeypatch):
+	monkeypatch.setattr(apc, 'MAX_STEPS', 50)
+	papers, options = frames([('A', 'J1', 'Gold', 600_001), ('B', 'J2', 'Gold', 399_000), ('C', 'J3', 'Gold', 250)])
+	plan = apc.optimize(papers, options, 1_000_000, resolution=1)
+	# With 20,000-dollar steps A and B round up to 620,000 and 400,000, which do not fit together
+	assert plan['net_apc'].sum() <= 1_000_000
+	assert plan['open_access'].sum() == 2
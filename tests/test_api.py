@@ -0,0 +1,22 @@
+import socket
+
+import pytest
+
+from publishing_guide.api import ApiServer
+
+
+def test_start_in_thread_raises_when_the_port_is_taken():
+	with socket.socket() as taken:
+		taken.bind(('127.0.0.1', 0))
+		taken.listen()
+		server = ApiServer('127.0.0.1', taken.getsockname()[1])
+		with pytest.raises(OSError):
+			server.start_in_thread()
+
+
+def test_start_in_thread_returns_once_listening():
+	server = ApiServer('127.0.0.1', 0)
+	server.start_in_thread()
+	with socket.create_connection(('127.0.0.1', server.port), timeout=5) as connection:
+		connection.sendall(b'GET /health HTTP/1.1\r\nConnection: close\r\n\r\n')
+		assert connection.recv(64).startswith(b'HTTP/1.1 200')
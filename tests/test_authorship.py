@@ -0,0 +1,21 @@
+import io
+
+from publishing_guide.authorship import ADMINISTRATIVE, ContributionMatrix, classify_role
+
+
+def test_only_recognised_columns_are_roles():
+	source = io.StringIO(
+		"Author,Email,Conceptualization,Data management,Approved final version,Favourite colour\n"
+		"Ada,ada@example.org,x,x,yes,blue\n"
+		"Ben,ben@example.org,,x,yes,\n")
+	contributions = ContributionMatrix.read_csv(source)
+	assert contributions.roles == ['Conceptualization', 'Data management', 'Approved final version']
+	assert contributions.unrecognised == ['Favourite colour']
+	assert contributions.matrix.tolist() == [[True, True, True], [False, True, True]]
+
+
+def test_management_is_not_administrative():
+	assert classify_role('Data management') == 'substantial_contribution'
+	assert classify_role('Data curation') == 'substantial_contribution'
+	assert classify_role('Project administration') == ADMINISTRATIVE
+	assert classify_role('Funding') == ADMINISTRATIVE
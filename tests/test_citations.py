@@ -0,0 +1,44 @@
+import io
+
+import pandas as pd
+import pytest
+
+from publishing_guide.citations import CitationLedger
+
+EXPORT = """author,paper,citations,year
+Ada,p1,10,2015
+Ada,p2,8,2016
+Ada;Ben,p3,5,2018
+Ada,p4,4,2020
+Ada,p5,3,2021
+Ben,p6,1,2022
+"""
+
+
+def test_indices():
+	metrics = CitationLedger(current_year=2024).ingest(io.StringIO(EXPORT)).metrics()
+	ada = metrics.loc['Ada']
+	assert (ada['papers'], ada['citations'], ada['h_index'], ada['g_index'], ada['i10_index']) == (5, 30, 4, 5, 1)
+	assert ada['first_year'] == 2015 and ada['m_quotient'] == 0.4
+	ben = metrics.loc['Ben']
+	assert (ben['papers'], ben['h_index'], ben['g_index'], ben['i10_index']) == (2, 1, 2, 0)
+
+
+def test_appended_rows_rescore_their_authors():
+	whole = CitationLedger(current_year=2024).ingest(io.StringIO(EXPORT)).metrics()
+	lines = EXPORT.splitlines(keepends=True)
+	ledger = CitationLedger(current_year=2024)
+	ledger.ingest(io.StringIO(''.join(lines[:4])))
+	ledger.metrics()
+	ledger.ingest(io.StringIO(lines[0] + ''.join(lines[4:])))
+	pd.testing.assert_frame_equal(ledger.metrics(), whole)
+
+
+def test_failed_ingest_adds_nothing():
+	ledger = CitationLedger(current_year=2024).ingest(io.StringIO(EXPORT))
+	before = ledger.metrics()
+	broken = EXPORT + "Ada,p7,9,2023\nAda,p8,9,2023,extra\n"
+	with pytest.raises(pd.errors.ParserError):
+		ledger.ingest(io.StringIO(broken), chunksize=2)
+	assert ledger.rows_ingested == 7
+	pd.testing.assert_frame_equal(ledger.metrics(), before)
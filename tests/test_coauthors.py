@@ -0,0 +1,36 @@
+import numpy as np
+
+from publishing_guide.coauthors import CoauthorGraph
+
+
+def graph(edges):
+	# One two-author paper per edge
+	names = [name for edge in edges for name in edge]
+	papers = [f'p{index}' for index, edge in enumerate(edges) for _ in edge]
+	return CoauthorGraph.from_pairs(names, papers)
+
+
+def by_author(coauthors, values):
+	return {author: round(float(value), 3) for author, value in zip(coauthors.authors, values)}
+
+
+def test_betweenness_is_the_share_of_shortest_paths():
+	# Path a-b-c-d-e: c lies on 4 of the 6 paths between the other authors, b on 3
+	path = graph([('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'e')])
+	assert by_author(path, path.betweenness()) == {'a': 0.0, 'b': 0.5, 'c': 0.667, 'd': 0.5, 'e': 0.0}
+
+	# Every path between two leaves of a star goes through its centre; of the two shortest
+	# paths across a square, each corner carries half
+	star = graph([('hub', leaf) for leaf in 'abcdef'])
+	assert by_author(star, star.betweenness())['hub'] == 1.0
+	square = graph([('a', 'b'), ('b', 'c'), ('c', 'd'), ('d', 'a')])
+	assert set(by_author(square, square.betweenness()).values()) == {round(1 / 6, 3)}
+
+
+def test_sampled_betweenness_estimates_the_exact_values():
+	rng = np.random.default_rng(3)
+	edges = {tuple(sorted(pair)) for pair in rng.integers(0, 60, (150, 2)).astype(str) if pair[0] != pair[1]}
+	coauthors = graph(sorted(edges))
+	exact = coauthors.betweenness(samples=len(coauthors))
+	estimates = np.mean([coauthors.betweenness(samples=20, seed=seed) for seed in range(30)], axis=0)
+	assert np.abs(estimates - exact).max() < 0.05
@@ -0,0 +1,47 @@
+import pandas as pd
+
+from publishing_guide.journal_metrics import JournalMetricsEngine
+
+
+def rows(*records):
+	return pd.DataFrame(records, columns=['citing_paper', 'cited_paper', 'journal', 'year'])
+
+
+BASE = rows(
+	('a1', '', 'J', 2020), ('a2', '', 'J', 2020),
+	('b1', '', 'J', 2021),
+	('c1', 'a1', 'K', 2022), ('c1', 'a2', 'K', 2022), ('c1', 'b1', 'K', 2022), ('c2', 'a1', 'K', 2022),
+	('d1', 'a1', 'K', 2024), ('d1', 'b1', 'K', 2024),
+)
+
+
+def test_metric_windows(tmp_path):
+	engine = JournalMetricsEngine(str(tmp_path))
+	engine.add_citations(BASE)
+
+	metrics = engine.metrics(2022)
+	assert metrics.loc['J', 'items'] == 3
+	assert round(metrics.loc['J', 'impact_factor'], 3) == 1.333
+	assert round(metrics.loc['J', 'citescore'], 3) == 1.333
+
+	# 2024 looks back to 2022 (Impact Factor) and 2021 (CiteScore): a1 (2020) is outside both
+	# windows, b1 (2021) only inside CiteScore's, which counts its citations from 2022 and 2024
+	metrics = engine.metrics(2024)
+	assert pd.isna(metrics.loc['J', 'impact_factor'])
+	assert metrics.loc['J', 'items'] == 1
+	assert metrics.loc['J', 'citescore'] == 2
+
+
+def test_changed_year_invalidates_the_years_that_read_it(tmp_path):
+	engine = JournalMetricsEngine(str(tmp_path))
+	engine.add_citations(BASE)
+	assert engine.metrics(2022).loc['J', 'impact_factor'] > 1.3
+	assert engine.add_citations(BASE) == []
+
+	# Replacing 2021 rebuilds 2021 and the years whose window reaches back to it
+	assert engine.add_citations(rows(('b1', '', 'J', 2021), ('b2', '', 'J', 2021))) == [2021, 2022, 2024]
+	assert engine.metrics(2022).loc['J', 'impact_factor'] == 1.0
+	assert engine.metrics(2024).loc['J', 'citescore'] == 1
+
+	reopened = JournalMetricsEngine(str(tmp_path))
+	pd.testing.assert_frame_equal(reopened.metrics(2022), engine.metrics(2022))
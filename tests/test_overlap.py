@@ -0,0 +1,35 @@
+import random
+
+from publishing_guide.overlap import SHORT_QUERY_SHINGLES, OverlapIndex
+
+
+def paragraphs(seed, count, words=90):
+	rng = random.Random(seed)
+	vocabulary = [f'w{number}' for number in range(5000)]
+	return [' '.join(rng.choice(vocabulary) for _ in range(words)) for _ in range(count)]
+
+
+def test_excerpt_of_a_long_paper_is_found(tmp_path):
+	index = OverlapIndex(str(tmp_path / 'index.sqlite'))
+	paper = paragraphs(1, 120)
+	index.add_documents([('long paper', '\n\n'.join(paper)), ('other paper', '\n\n'.join(paragraphs(2, 40)))])
+
+	# Three paragraphs of a 10,800-word paper: Jaccard similarity about 0.025
+	excerpt = '\n\n'.join(paper[50:53])
+	matches = index.check(excerpt)
+	assert list(matches['document']) == ['long paper']
+	assert matches.loc[0, 'containment'] == 1.0
+	assert matches.loc[0, 'jaccard'] < 0.03
+	assert index.passages(excerpt, 'long paper') == [excerpt]
+
+
+def test_long_near_duplicate_is_found_through_lsh(tmp_path):
+	index = OverlapIndex(str(tmp_path / 'index.sqlite'))
+	paper = paragraphs(3, 40)
+	index.add_documents([('paper', '\n\n'.join(paper)), ('other paper', '\n\n'.join(paragraphs(4, 40)))])
+
+	revised = paper[:30] + paragraphs(5, 10)
+	assert sum(len(paragraph.split()) for paragraph in revised) > SHORT_QUERY_SHINGLES
+	matches = index.check('\n\n'.join(revised))
+	assert list(matches['document']) == ['paper']
+	assert 0.7 < matches.loc[0, 'containment'] < 0.8
@@ -0,0 +1,37 @@
+import sqlite3
+
+from publishing_guide.portfolio import PortfolioTracker
+
+
+def test_same_day_stages_keep_their_order(tmp_path):
+	tracker = PortfolioTracker(str(tmp_path / 'portfolio.sqlite'), pool_size=2)
+	tracker.add('Paper', stage='Drafting', started='2024-03-01')
+	manuscript = int(tracker.manuscripts()['id'][0])
+	for stage in ['Submitted', 'Under review', 'Revision', 'Under review']:
+		tracker.move(manuscript, stage, when='2024-05-02')
+	tracker.move(manuscript, 'Under review', when='2024-05-03')
+
+	segments = tracker.segments([manuscript])
+	assert list(segments['stage']) == ['Drafting', 'Submitted', 'Under review', 'Revision', 'Under review']
+	assert tracker.manuscripts()['stage'][0] == 'Under review'
+	tracker.close()
+
+
+def test_history_without_ids_is_migrated(tmp_path):
+	path = str(tmp_path / 'portfolio.sqlite')
+	tracker = PortfolioTracker(path, pool_size=1)
+	tracker.add('Paper', stage='Drafting', started='2024-03-01')
+	tracker.close()
+	with sqlite3.connect(path) as connection:
+		connection.executescript("""
+			CREATE TABLE old (manuscript INTEGER, stage TEXT, entered TEXT, PRIMARY KEY (manuscript, entered, stage)) WITHOUT ROWID;
+			INSERT INTO old SELECT manuscript, stage, entered FROM stage_history;
+			INSERT INTO old VALUES (1, 'Submitted', '2024-04-01');
+			DROP TABLE stage_history;
+			ALTER TABLE old RENAME TO stage_history;
+		""")
+
+	tracker = PortfolioTracker(path, pool_size=1)
+	tracker.move(1, 'Under review', when='2024-04-01')
+	assert list(tracker.segments([1])['stage']) == ['Drafting', 'Submitted', 'Under review']
+	tracker.close()
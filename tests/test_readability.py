@@ -0,0 +1,21 @@
+from publishing_guide.readability import TOKEN_RE, is_jargon, score_text
+
+
+def test_abbreviations_are_not_jargon():
+	text = "Smith et al. measured citations, e.g. in biology, i.e. across fields. They used CRISPR."
+	abbreviations = [token for token in TOKEN_RE.findall(text) if token.endswith('.') and token[0] not in '.!?']
+	assert abbreviations == ['et al.', 'e.g.', 'i.e.']
+	assert not any(is_jargon(token) for token in abbreviations)
+
+	terms = score_text(text)['jargon_terms']
+	assert 'CRISPR' in terms
+	assert not set(terms) & set(abbreviations)
+
+
+def test_abbreviation_can_end_a_sentence():
+	text = "We counted citations, downloads, etc. Then we compared fields, as in Fig. 2 and Smith et al. (2020)."
+	tokens = TOKEN_RE.findall(text)
+	assert 'etc.' not in tokens
+	assert ['etc', '.', 'Then'] == tokens[tokens.index('etc'):tokens.index('etc') + 3]
+	assert 'Fig.' in tokens and 'et al.' in tokens
+	assert score_text(text)['sentences'] == 2
@@ -0,0 +1,35 @@
+import io
+
+from publishing_guide.references import check_references, issn_problem, normalize_doi
+
+BIBTEX = r"""
+@article{first, author = {Smith, Jane}, title = {Open Access and Citation Advantage}, year = 2019,
+  journal = {Scientometrics}, doi = {https://doi.org/10.1007/S11192-019-03000-1}, issn = {0138-9130}}
+@article{same_doi, author = {J. Smith}, title = {A different title entirely}, year = 2019, doi = {doi:10.1007/s11192-019-03000-1.}}
+@article{exact, author = {Smith, J.}, title = {Open access and citation advantage.}, year = {2019}}
+@article{near, author = {Smith, J.}, title = {Open access and the citation advantage}, year = {2019}}
+@article{other_year, author = {Smith, J.}, title = {Open access and citation advantage}, year = {2021}}
+@article{broken, author = {Doe, A.}, title = {Unrelated}, year = {20x9}, doi = {10.12/bad}, issn = {0138-9131}}
+"""
+
+
+def test_normalize_doi():
+	assert normalize_doi('https://dx.doi.org/10.1000/ABC.') == '10.1000/abc'
+	assert normalize_doi(' DOI: 10.1000/abc ') == '10.1000/abc'
+
+
+def test_duplicates_and_problems():
+	table = check_references(io.BytesIO(BIBTEX.encode()), 'library.bib').table().set_index('key')
+	assert (table.loc['same_doi', 'duplicate_of'], table.loc['same_doi', 'match']) == (1, 'DOI')
+	assert (table.loc['exact', 'duplicate_of'], table.loc['exact', 'match']) == (1, 'exact')
+	# Every duplicate points at the first entry of its group
+	assert (table.loc['near', 'duplicate_of'], table.loc['near', 'match']) == (1, 'near')
+	assert 0.9 <= table.loc['near', 'similarity'] < 1
+	assert table.loc['other_year', 'match'] == ''
+
+	problems = table.loc['broken', 'problems']
+	assert "malformed DOI '10.12/bad'" in problems
+	assert "malformed year '20x9'" in problems
+	assert "ISSN check digit fails '0138-9131'" in problems
+	assert table.loc['first', 'problems'] == ''
+	assert issn_problem('0138-9130') is None
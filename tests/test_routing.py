@@ -0,0 +1,37 @@
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from publishing_guide import content
+from publishing_guide.routing import EXPLORERS, link, resolve_item, resolve_page, slugify
+
+
+def test_resolve_page():
+	assert resolve_page('predatory-journals-warning-signs') == 'Predatory Journals: Warning Signs'
+	assert resolve_page('PUBLISHING ETHICS') == 'Publishing Ethics'
+	for value in [None, '', 'nonsense']:
+		assert resolve_page(value) == content.PAGES[0]
+
+
+def test_resolve_item():
+	page = 'Submission & Peer Review'
+	options = EXPLORERS[page]
+	assert resolve_item(page, slugify(options[1])) == options[1]
+	assert resolve_item(page, options[2].upper()) == options[2]
+	assert resolve_item(page, 'nonsense') == options[0]
+	assert resolve_item(page, None) == options[0]
+
+
+def test_links_resolve_back():
+	# Every page and explorer item survives a round trip through its link
+	for page in content.PAGES:
+		for item in EXPLORERS.get(page, [None]):
+			query = parse_qs(urlsplit(link(page, item)).query)
+			assert resolve_page(query.get('page', [None])[0]) == page
+			if item is not None:
+				assert resolve_item(page, query.get('item', [None])[0]) == item
+	assert link(content.PAGES[0]) == '/'
+	assert link('Publishing Ethics', section='Authorship Issues', base_url='https://guide.example/') == \
+		'https://guide.example/?page=publishing-ethics#authorship-issues'
+	with pytest.raises(ValueError):
+		link('Publishing Ethics', item='Impact Factor')
@@ -0,0 +1,21 @@
+import threading
+
+from publishing_guide.telemetry import Counter, Histogram
+
+
+def _run_threads(record, count):
+	for _ in range(count):
+		thread = threading.Thread(target=record)
+		thread.start()
+		thread.join()
+
+
+def test_finished_threads_are_folded_without_a_scrape():
+	counter = Counter('test_counter', '', ['page'])
+	histogram = Histogram('test_histogram', '', ['page'])
+	_run_threads(lambda: (counter.inc('a'), histogram.observe(0.2, 'a')), 2000)
+
+	assert len(counter._shards) <= 2
+	assert len(histogram._shards) <= 2
+	assert counter.values() == {('a',): 2000}
+	assert histogram.values()[('a',)][-1] == 2000